@@ -0,0 +1,40 @@
+import argparse
+import json
+from pathlib import Path
+
+from .db import BACKUP_PAGES_PER_STEP, backup_database, init_db, restore_database
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m backend.app.backup',
+        description='Back up or restore the Plex Collector database while the server is running.',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    backup_parser = commands.add_parser('backup', help='Write an online backup of the database.')
+    backup_parser.add_argument('target', nargs='?', type=Path, help='Output file (default: BACKUP_DIR/<timestamp>.db)')
+    backup_parser.add_argument('--gzip', action='store_true', help='Compress the backup with gzip.')
+    backup_parser.add_argument(
+        '--pages-per-step',
+        type=int,
+        default=BACKUP_PAGES_PER_STEP,
+        help=f'Pages copied per backup step (default: {BACKUP_PAGES_PER_STEP}).',
+    )
+    restore_parser = commands.add_parser('restore', help='Replace the database contents with a backup.')
+    restore_parser.add_argument('source', type=Path, help='Backup file (.db or .db.gz)')
+    args = parser.parse_args(argv)
+
+    init_db()
+    try:
+        if args.command == 'backup':
+            result = backup_database(args.target, compress=args.gzip, pages_per_step=args.pages_per_step)
+        else:
+            result = restore_database(args.source)
+    except (FileNotFoundError, ValueError) as exc:
+        parser.exit(1, f'error: {exc}\n')
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -18,6 +18,42 @@ PLEX_DEVICE = os.getenv('PLEX_DEVICE', 'Localhost')
 
 TMDB_API_KEY = os.getenv('TMDB_API_KEY', '')
 TMDB_IMAGE_BASE = 'https://image.tmdb.org/t/p/w500'
+TMDB_POOL_SIZE = int(os.getenv('TMDB_POOL_SIZE', '16'))
+# Requests per second across all workers; 0 disables the limiter.
+TMDB_RATE_LIMIT = float(os.getenv('TMDB_RATE_LIMIT', '40'))
+
+PLEX_PAGE_SIZE = int(os.getenv('PLEX_PAGE_SIZE', '2000'))
+LIBRARY_WRITE_CHUNK_SIZE = int(os.getenv('LIBRARY_WRITE_CHUNK_SIZE', '2000'))
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+MISSING_SCAN_WORKERS = int(os.getenv('MISSING_SCAN_WORKERS', '8'))
+MISSING_SCAN_WRITE_BATCH = int(os.getenv('MISSING_SCAN_WRITE_BATCH', '200'))
+MISSING_SCAN_FRESH_DAYS = float(os.getenv('MISSING_SCAN_FRESH_DAYS', '7'))
 
 DB_PATH = BASE_DIR / 'backend' / 'data' / 'plex_collector.db'
+BACKUP_DIR = Path(os.getenv('BACKUP_DIR', str(BASE_DIR / 'backend' / 'data' / 'backups')))
 STATIC_DIR = BASE_DIR / 'frontend' / 'static'
+
+# cache_size is per connection (negative = KiB) and every worker thread keeps
+# a read and a write connection; mmap_size is shared through the OS page
+# cache. page_size only applies when the database file is created.
+SQLITE_PRAGMA_PRESETS = {
+    'small': {
+        'page_size': 4096,
+        'cache_size': -8000,
+        'mmap_size': 128 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+    },
+    'large': {
+        'page_size': 8192,
+        'cache_size': -32000,
+        'mmap_size': 1024 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+    },
+}
+SQLITE_PROFILE = os.getenv('SQLITE_PROFILE', 'small').strip().lower()
+_SQLITE_PRESET = SQLITE_PRAGMA_PRESETS.get(SQLITE_PROFILE, SQLITE_PRAGMA_PRESETS['small'])
+SQLITE_PRAGMAS = {
+    **_SQLITE_PRESET,
+    'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', str(_SQLITE_PRESET['cache_size']))),
+    'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', str(_SQLITE_PRESET['mmap_size']))),
+}
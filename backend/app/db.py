@@ -1,504 +1,1082 @@
-﻿import json
+﻿import copy
+import gzip
+import json
+import os
+import shutil
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
-from typing import Any
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
-from .config import DB_PATH
+from .config import BACKUP_DIR, DB_PATH, SQLITE_PRAGMAS
 
+BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 256
 
-def init_db() -> None:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS actors (
-                actor_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                role TEXT NOT NULL DEFAULT 'actor',
-                appearances INTEGER NOT NULL,
-                tmdb_person_id INTEGER,
-                image_url TEXT,
-                movies_in_plex_count INTEGER,
-                missing_movie_count INTEGER,
-                missing_new_count INTEGER,
-                missing_upcoming_count INTEGER,
-                first_release_date TEXT,
-                next_upcoming_release_date TEXT,
-                missing_scan_at TEXT,
-                plex_web_url TEXT,
-                updated_at TEXT NOT NULL
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS plex_movies (
-                plex_rating_key TEXT PRIMARY KEY,
-                library_section_id TEXT,
-                title TEXT NOT NULL,
-                original_title TEXT,
-                year INTEGER,
-                tmdb_id INTEGER,
-                imdb_id TEXT,
-                normalized_title TEXT NOT NULL,
-                normalized_original_title TEXT,
-                plex_web_url TEXT,
-                updated_at TEXT NOT NULL
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS plex_shows (
-                show_id TEXT PRIMARY KEY,
-                plex_rating_key TEXT UNIQUE NOT NULL,
-                title TEXT NOT NULL,
-                year INTEGER,
-                tmdb_show_id INTEGER,
-                normalized_title TEXT NOT NULL,
-                image_url TEXT,
-                plex_web_url TEXT,
-                has_missing_episodes INTEGER,
-                missing_episode_count INTEGER,
-                missing_new_count INTEGER,
-                missing_old_count INTEGER,
-                missing_upcoming_count INTEGER,
-                missing_scan_at TEXT,
-                missing_upcoming_air_dates TEXT,
-                updated_at TEXT NOT NULL
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS plex_show_episodes (
-                plex_rating_key TEXT PRIMARY KEY,
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                episode_number INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                normalized_title TEXT NOT NULL,
-                tmdb_episode_id INTEGER,
-                season_plex_web_url TEXT,
-                plex_web_url TEXT,
-                updated_at TEXT NOT NULL
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS ignored_episodes (
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                episode_number INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (show_id, season_number, episode_number)
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS ignored_movies (
-                actor_id TEXT NOT NULL,
-                tmdb_movie_id INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (actor_id, tmdb_movie_id)
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS actor_missing_movies (
-                actor_id TEXT NOT NULL,
-                tmdb_movie_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                release_date TEXT NOT NULL,
-                poster_url TEXT,
-                status TEXT NOT NULL,
-                ignored INTEGER NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (actor_id, tmdb_movie_id)
-            )
-            '''
-        )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS show_missing_episodes (
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                episode_number INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                air_date TEXT NOT NULL,
-                status TEXT NOT NULL,
-                ignored INTEGER NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (show_id, season_number, episode_number)
-            )
-            '''
+_LOCAL = threading.local()
+
+SCHEMA_VERSION = 9
+
+_BASELINE_TABLES = [
+    '''
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS actors (
+        actor_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL DEFAULT 'actor',
+        appearances INTEGER NOT NULL,
+        tmdb_person_id INTEGER,
+        image_url TEXT,
+        movies_in_plex_count INTEGER,
+        missing_movie_count INTEGER,
+        missing_new_count INTEGER,
+        missing_upcoming_count INTEGER,
+        first_release_date TEXT,
+        next_upcoming_release_date TEXT,
+        missing_scan_at TEXT,
+        plex_web_url TEXT,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS plex_movies (
+        plex_rating_key TEXT PRIMARY KEY,
+        library_section_id TEXT,
+        title TEXT NOT NULL,
+        original_title TEXT,
+        year INTEGER,
+        tmdb_id INTEGER,
+        imdb_id TEXT,
+        normalized_title TEXT NOT NULL,
+        normalized_original_title TEXT,
+        plex_web_url TEXT,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS plex_shows (
+        show_id TEXT PRIMARY KEY,
+        plex_rating_key TEXT UNIQUE NOT NULL,
+        title TEXT NOT NULL,
+        year INTEGER,
+        tmdb_show_id INTEGER,
+        normalized_title TEXT NOT NULL,
+        image_url TEXT,
+        plex_web_url TEXT,
+        has_missing_episodes INTEGER,
+        missing_episode_count INTEGER,
+        missing_new_count INTEGER,
+        missing_old_count INTEGER,
+        missing_upcoming_count INTEGER,
+        missing_scan_at TEXT,
+        missing_upcoming_air_dates TEXT,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS plex_show_episodes (
+        plex_rating_key TEXT PRIMARY KEY,
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        episode_number INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        normalized_title TEXT NOT NULL,
+        tmdb_episode_id INTEGER,
+        season_plex_web_url TEXT,
+        plex_web_url TEXT,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS ignored_episodes (
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        episode_number INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (show_id, season_number, episode_number)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS ignored_movies (
+        actor_id TEXT NOT NULL,
+        tmdb_movie_id INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (actor_id, tmdb_movie_id)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS actor_missing_movies (
+        actor_id TEXT NOT NULL,
+        tmdb_movie_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        release_date TEXT NOT NULL,
+        poster_url TEXT,
+        status TEXT NOT NULL,
+        ignored INTEGER NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (actor_id, tmdb_movie_id)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS show_missing_episodes (
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        episode_number INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        air_date TEXT NOT NULL,
+        status TEXT NOT NULL,
+        ignored INTEGER NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (show_id, season_number, episode_number)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS show_seasons_summary (
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        episode_count INTEGER NOT NULL,
+        air_date TEXT,
+        poster_url TEXT,
+        year INTEGER,
+        in_plex INTEGER NOT NULL,
+        episodes_in_plex INTEGER NOT NULL,
+        count_overflow INTEGER NOT NULL,
+        plex_web_url TEXT,
+        next_upcoming_air_date TEXT,
+        missing_new_count INTEGER NOT NULL,
+        missing_old_count INTEGER NOT NULL,
+        missing_upcoming_count INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (show_id, season_number)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tracked_cast (
+        actor_id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tracked_movies (
+        tmdb_movie_id INTEGER PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tracked_shows (
+        show_id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tracked_seasons (
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (show_id, season_number)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tracked_episodes (
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        episode_number INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (show_id, season_number, episode_number)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS untracked_episodes (
+        show_id TEXT NOT NULL,
+        season_number INTEGER NOT NULL,
+        episode_number INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (show_id, season_number, episode_number)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tmdb_movie_credits_cache (
+        tmdb_movie_id INTEGER PRIMARY KEY,
+        director TEXT,
+        writer TEXT,
+        top_cast_json TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tmdb_trailer_cache (
+        media_type TEXT NOT NULL,
+        tmdb_id INTEGER NOT NULL,
+        trailer_url TEXT,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (media_type, tmdb_id)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tmdb_imdb_movie_ids (
+        imdb_id TEXT PRIMARY KEY,
+        tmdb_movie_id INTEGER,
+        updated_at TEXT NOT NULL
+    )
+    ''',
+]
+
+# Columns added to pre-versioned databases over time. Fresh databases get
+# them from _BASELINE_TABLES; old ones are patched once by migration 1.
+_LEGACY_COLUMNS: dict[str, dict[str, str]] = {
+    'actors': {
+        'movies_in_plex_count': 'INTEGER',
+        'role': "TEXT NOT NULL DEFAULT 'actor'",
+        'missing_movie_count': 'INTEGER',
+        'missing_new_count': 'INTEGER',
+        'missing_upcoming_count': 'INTEGER',
+        'first_release_date': 'TEXT',
+        'next_upcoming_release_date': 'TEXT',
+        'missing_scan_at': 'TEXT',
+        'plex_web_url': 'TEXT',
+    },
+    'plex_movies': {
+        'original_title': 'TEXT',
+        'normalized_original_title': 'TEXT',
+        'tmdb_id': 'INTEGER',
+        'imdb_id': 'TEXT',
+        'library_section_id': 'TEXT',
+    },
+    'plex_shows': {
+        'tmdb_show_id': 'INTEGER',
+        'normalized_title': 'TEXT',
+        'image_url': 'TEXT',
+        'plex_web_url': 'TEXT',
+        'has_missing_episodes': 'INTEGER',
+        'missing_episode_count': 'INTEGER',
+        'missing_new_count': 'INTEGER',
+        'missing_old_count': 'INTEGER',
+        'missing_upcoming_count': 'INTEGER',
+        'missing_scan_at': 'TEXT',
+        'missing_upcoming_air_dates': 'TEXT',
+    },
+    'plex_show_episodes': {
+        'tmdb_episode_id': 'INTEGER',
+        'season_plex_web_url': 'TEXT',
+        'plex_web_url': 'TEXT',
+    },
+    'actor_missing_movies': {
+        'poster_url': 'TEXT',
+    },
+}
+
+
+# Composite-key tables are looked up by their key; storing rows in the
+# primary-key b-tree drops the separate rowid table and its index. Fresh
+# databases create them this way; migration 1 rebuilds pre-versioned ones.
+WITHOUT_ROWID_TABLES = (
+    'ignored_episodes',
+    'ignored_movies',
+    'actor_missing_movies',
+    'show_missing_episodes',
+    'show_seasons_summary',
+    'tracked_seasons',
+    'tracked_episodes',
+    'untracked_episodes',
+    'tmdb_trailer_cache',
+)
+
+
+def _rebuild_without_rowid(conn: sqlite3.Connection, table: str) -> None:
+    table_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table,),
+    ).fetchone()[0]
+    if table_sql.rstrip().upper().endswith('WITHOUT ROWID'):
+        return
+    index_sqls = [
+        row[0]
+        for row in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        ).fetchall()
+    ]
+    conn.execute(f'ALTER TABLE {table} RENAME TO {table}_rowid')
+    conn.execute(f'{table_sql.rstrip()} WITHOUT ROWID')
+    conn.execute(f'INSERT INTO {table} SELECT * FROM {table}_rowid')
+    conn.execute(f'DROP TABLE {table}_rowid')
+    for index_sql in index_sqls:
+        conn.execute(index_sql)
+
+
+def _migrate_v1_baseline(conn: sqlite3.Connection) -> None:
+    for ddl in _BASELINE_TABLES:
+        conn.execute(ddl)
+    for table, columns in _LEGACY_COLUMNS.items():
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info('{table}')").fetchall()}
+        for column, column_type in columns.items():
+            if column not in existing:
+                conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}')
+    conn.execute("UPDATE actors SET role = 'actor' WHERE role IS NULL OR TRIM(role) = ''")
+    for table in WITHOUT_ROWID_TABLES:
+        _rebuild_without_rowid(conn, table)
+    _create_indexes(conn)
+
+
+def _migrate_v2_settings_version(conn: sqlite3.Connection) -> None:
+    # Bumped by triggers on every settings write, from any process, so
+    # in-memory settings caches can detect changes with one cheap read.
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS settings_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
         )
+        '''
+    )
+    conn.execute('INSERT OR IGNORE INTO settings_version (id, version) VALUES (1, 0)')
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
         conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS show_seasons_summary (
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                episode_count INTEGER NOT NULL,
-                air_date TEXT,
-                poster_url TEXT,
-                year INTEGER,
-                in_plex INTEGER NOT NULL,
-                episodes_in_plex INTEGER NOT NULL,
-                count_overflow INTEGER NOT NULL,
-                plex_web_url TEXT,
-                next_upcoming_air_date TEXT,
-                missing_new_count INTEGER NOT NULL,
-                missing_old_count INTEGER NOT NULL,
-                missing_upcoming_count INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (show_id, season_number)
-            )
+            f'''
+            CREATE TRIGGER IF NOT EXISTS settings_version_after_{event.lower()}
+            AFTER {event} ON settings
+            BEGIN
+                UPDATE settings_version SET version = version + 1 WHERE id = 1;
+            END
             '''
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS tracked_cast (
-                actor_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-            '''
+
+
+def _migrate_v3_scan_history(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS scan_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            scanned_at TEXT NOT NULL,
+            server_name TEXT,
+            duration_ms INTEGER,
+            bytes_received INTEGER,
+            counts_json TEXT NOT NULL,
+            phases_json TEXT NOT NULL,
+            error TEXT
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS tracked_movies (
-                tmdb_movie_id INTEGER PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
+        '''
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_scan_history_kind ON scan_history (kind, id DESC)')
+    # Move the legacy JSON lists out of settings, oldest first so ids keep
+    # chronological order.
+    for setting_key, kind, count_keys in (
+        ('scan_logs', 'actors', ('actors', 'movies')),
+        ('show_scan_logs', 'shows', ('shows', 'episodes')),
+    ):
+        row = conn.execute('SELECT value FROM settings WHERE key = ?', (setting_key,)).fetchone()
+        if not row:
+            continue
+        try:
+            entries = json.loads(row[0])
+        except json.JSONDecodeError:
+            entries = []
+        if not isinstance(entries, list):
+            entries = []
+        for entry in reversed(entries):
+            if not isinstance(entry, dict) or not entry.get('scanned_at'):
+                continue
+            conn.execute(
+                '''
+                INSERT INTO scan_history (kind, scanned_at, server_name, counts_json, phases_json)
+                VALUES (?, ?, ?, ?, '{}')
+                ''',
+                (
+                    kind,
+                    str(entry['scanned_at']),
+                    entry.get('server_name'),
+                    json.dumps({key: entry.get(key) for key in count_keys}),
+                ),
             )
-            '''
+        conn.execute('DELETE FROM settings WHERE key = ?', (setting_key,))
+
+
+def _migrate_v4_episode_counts(conn: sqlite3.Connection) -> None:
+    # Stored episode counts so /api/shows needs no aggregate; kept current
+    # by the show library sync.
+    conn.execute('ALTER TABLE plex_shows ADD COLUMN episodes_in_plex INTEGER NOT NULL DEFAULT 0')
+    conn.execute(
+        '''
+        UPDATE plex_shows
+        SET episodes_in_plex = (
+            SELECT COUNT(*) FROM plex_show_episodes e WHERE e.show_id = plex_shows.show_id
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS tracked_shows (
-                show_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-            '''
+        '''
+    )
+    conn.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_plex_shows_episodes_in_plex
+        ON plex_shows (episodes_in_plex DESC, title)
+        '''
+    )
+
+
+def _migrate_v5_release_events(conn: sqlite3.Connection) -> None:
+    # event_day is days since 1970-01-01. Keying the table on it keeps each
+    # day's events together on disk, so calendar and discovery range reads
+    # touch only the pages for that range. Unused key parts are 0 or ''.
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS release_events (
+            media_type TEXT NOT NULL,
+            event_day INTEGER NOT NULL,
+            tmdb_movie_id INTEGER NOT NULL DEFAULT 0,
+            show_id TEXT NOT NULL DEFAULT '',
+            season_number INTEGER NOT NULL DEFAULT 0,
+            episode_number INTEGER NOT NULL DEFAULT 0,
+            event_date TEXT NOT NULL,
+            title TEXT NOT NULL,
+            poster_url TEXT,
+            status TEXT NOT NULL,
+            tracked INTEGER NOT NULL,
+            tracked_show INTEGER NOT NULL DEFAULT 0,
+            tracked_season INTEGER NOT NULL DEFAULT 0,
+            tracked_episode INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (media_type, event_day, tmdb_movie_id, show_id, season_number, episode_number)
+        ) WITHOUT ROWID
+        '''
+    )
+    conn.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_release_events_movie
+        ON release_events (tmdb_movie_id) WHERE media_type = 'movie'
+        '''
+    )
+    conn.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_release_events_show
+        ON release_events (show_id, season_number, episode_number) WHERE media_type = 'show'
+        '''
+    )
+    conn.execute(
+        'CREATE INDEX IF NOT EXISTS idx_actor_missing_movies_tmdb_id ON actor_missing_movies (tmdb_movie_id)'
+    )
+    refresh_movie_release_events(conn)
+    # Show events read effective_tracked_episodes and are filled by v6.
+
+
+def _migrate_v6_effective_tracking(conn: sqlite3.Connection) -> None:
+    # One row per tracking rule: (show, 0, 0) tracks a whole show, (show, s, 0)
+    # a season, and (show, s, e) pins one episode tracked or untracked. The
+    # most specific row present decides.
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS effective_tracked_episodes (
+            show_id TEXT NOT NULL,
+            season_number INTEGER NOT NULL,
+            episode_number INTEGER NOT NULL,
+            tracked INTEGER NOT NULL,
+            PRIMARY KEY (show_id, season_number, episode_number)
+        ) WITHOUT ROWID
+        '''
+    )
+    conn.execute(
+        '''
+        INSERT OR REPLACE INTO effective_tracked_episodes (show_id, season_number, episode_number, tracked)
+        SELECT show_id, 0, 0, 1 FROM tracked_shows
+        UNION ALL
+        SELECT show_id, season_number, 0, 1 FROM tracked_seasons WHERE season_number > 0
+        UNION ALL
+        SELECT show_id, season_number, episode_number, 1 FROM tracked_episodes
+        WHERE season_number > 0 AND episode_number > 0
+        '''
+    )
+    conn.execute(
+        '''
+        INSERT OR REPLACE INTO effective_tracked_episodes (show_id, season_number, episode_number, tracked)
+        SELECT show_id, season_number, episode_number, 0 FROM untracked_episodes
+        WHERE season_number > 0 AND episode_number > 0
+        '''
+    )
+    refresh_show_release_events(conn)
+
+
+def _migrate_v7_library_staging(conn: sqlite3.Connection) -> None:
+    # Show scans stream into these in short committed chunks; the finished
+    # snapshot is then diffed into plex_shows/plex_show_episodes in one
+    # transaction, so readers never see a half-written library.
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS plex_shows_staging (
+            show_id TEXT PRIMARY KEY,
+            plex_rating_key TEXT NOT NULL,
+            title TEXT NOT NULL,
+            year INTEGER,
+            tmdb_show_id INTEGER,
+            normalized_title TEXT NOT NULL,
+            image_url TEXT,
+            plex_web_url TEXT,
+            updated_at TEXT NOT NULL
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS tracked_seasons (
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (show_id, season_number)
-            )
-            '''
+        '''
+    )
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS plex_show_episodes_staging (
+            plex_rating_key TEXT PRIMARY KEY,
+            show_id TEXT NOT NULL,
+            season_number INTEGER NOT NULL,
+            episode_number INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            normalized_title TEXT NOT NULL,
+            tmdb_episode_id INTEGER,
+            season_plex_web_url TEXT,
+            plex_web_url TEXT,
+            updated_at TEXT NOT NULL
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS tracked_episodes (
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                episode_number INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (show_id, season_number, episode_number)
-            )
-            '''
+        '''
+    )
+
+
+def _migrate_v8_show_freshness(conn: sqlite3.Connection) -> None:
+    # Missing scans skip a show TMDb reports as finished when nothing was
+    # missing at its last scan and Plex still has the same episode count.
+    conn.execute('ALTER TABLE plex_shows ADD COLUMN tmdb_status TEXT')
+    conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_scan_episodes_in_plex INTEGER')
+
+
+def _migrate_v9_missing_scan_checkpoints(conn: sqlite3.Connection) -> None:
+    # Long missing scans record each committed batch so a scan interrupted by
+    # a crash or restart resumes after the last batch instead of starting over.
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS missing_scan_runs (
+            run_id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            params_json TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS untracked_episodes (
-                show_id TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                episode_number INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (show_id, season_number, episode_number)
-            )
-            '''
+        '''
+    )
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS missing_scan_run_items (
+            run_id INTEGER NOT NULL,
+            item_id TEXT NOT NULL,
+            PRIMARY KEY (run_id, item_id)
+        ) WITHOUT ROWID
+        '''
+    )
+
+
+MIGRATIONS: list[tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migrate_v1_baseline),
+    (2, _migrate_v2_settings_version),
+    (3, _migrate_v3_scan_history),
+    (4, _migrate_v4_episode_counts),
+    (5, _migrate_v5_release_events),
+    (6, _migrate_v6_effective_tracking),
+    (7, _migrate_v7_library_staging),
+    (8, _migrate_v8_show_freshness),
+    (9, _migrate_v9_missing_scan_checkpoints),
+]
+
+
+def init_db() -> None:
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    try:
+        if not conn.execute('PRAGMA page_count').fetchone()[0]:
+            conn.execute(f"PRAGMA page_size = {int(SQLITE_PRAGMAS['page_size'])}")
+            # A new file takes the mode before its first table. Existing files
+            # switch over through the VACUUM in run_database_maintenance.
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        _apply_connection_pragmas(conn)
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        # WAL is persistent in the database file; readers no longer block on
+        # a scan's write transaction. It cannot be switched inside BEGIN.
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Re-read under the write lock in case another process migrated.
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for target_version, migrate in MIGRATIONS:
+                if target_version > version:
+                    migrate(conn)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.close()
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_plex_movies_tmdb_id ON plex_movies (tmdb_id)')
+    conn.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_plex_show_episodes_show_season_episode
+        ON plex_show_episodes (show_id, season_number, episode_number)
+        '''
+    )
+    conn.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_actors_role_appearances
+        ON actors (role, appearances DESC, name)
+        '''
+    )
+
+
+def _apply_connection_pragmas(conn: sqlite3.Connection) -> None:
+    conn.execute(f"PRAGMA cache_size = {int(SQLITE_PRAGMAS['cache_size'])}")
+    conn.execute(f"PRAGMA mmap_size = {int(SQLITE_PRAGMAS['mmap_size'])}")
+    conn.execute(f"PRAGMA temp_store = {SQLITE_PRAGMAS['temp_store']}")
+
+
+def _open_conn(read_only: bool) -> sqlite3.Connection:
+    if read_only:
+        conn = sqlite3.connect(
+            f'{DB_PATH.as_uri()}?mode=ro',
+            uri=True,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
-        conn.execute(
-            '''
-            CREATE TABLE IF NOT EXISTS tmdb_movie_credits_cache (
-                tmdb_movie_id INTEGER PRIMARY KEY,
-                director TEXT,
-                writer TEXT,
-                top_cast_json TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-            '''
+    else:
+        conn = sqlite3.connect(
+            DB_PATH,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
-        columns = {row[1] for row in conn.execute("PRAGMA table_info('plex_movies')").fetchall()}
-        actor_columns = {row[1] for row in conn.execute("PRAGMA table_info('actors')").fetchall()}
-        if 'movies_in_plex_count' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN movies_in_plex_count INTEGER')
-        if 'role' not in actor_columns:
-            conn.execute("ALTER TABLE actors ADD COLUMN role TEXT NOT NULL DEFAULT 'actor'")
-        if 'missing_movie_count' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN missing_movie_count INTEGER')
-        if 'missing_new_count' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN missing_new_count INTEGER')
-        if 'missing_upcoming_count' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN missing_upcoming_count INTEGER')
-        if 'first_release_date' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN first_release_date TEXT')
-        if 'next_upcoming_release_date' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN next_upcoming_release_date TEXT')
-        if 'missing_scan_at' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN missing_scan_at TEXT')
-        if 'plex_web_url' not in actor_columns:
-            conn.execute('ALTER TABLE actors ADD COLUMN plex_web_url TEXT')
-        conn.execute("UPDATE actors SET role = 'actor' WHERE role IS NULL OR TRIM(role) = ''")
-        if 'original_title' not in columns:
-            conn.execute('ALTER TABLE plex_movies ADD COLUMN original_title TEXT')
-        if 'normalized_original_title' not in columns:
-            conn.execute('ALTER TABLE plex_movies ADD COLUMN normalized_original_title TEXT')
-        if 'tmdb_id' not in columns:
-            conn.execute('ALTER TABLE plex_movies ADD COLUMN tmdb_id INTEGER')
-        if 'imdb_id' not in columns:
-            conn.execute('ALTER TABLE plex_movies ADD COLUMN imdb_id TEXT')
-        if 'library_section_id' not in columns:
-            conn.execute('ALTER TABLE plex_movies ADD COLUMN library_section_id TEXT')
-        show_columns = {row[1] for row in conn.execute("PRAGMA table_info('plex_shows')").fetchall()}
-        if 'tmdb_show_id' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN tmdb_show_id INTEGER')
-        if 'normalized_title' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN normalized_title TEXT')
-        if 'image_url' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN image_url TEXT')
-        if 'plex_web_url' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN plex_web_url TEXT')
-        if 'has_missing_episodes' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN has_missing_episodes INTEGER')
-        if 'missing_episode_count' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_episode_count INTEGER')
-        if 'missing_new_count' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_new_count INTEGER')
-        if 'missing_old_count' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_old_count INTEGER')
-        if 'missing_upcoming_count' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_upcoming_count INTEGER')
-        if 'missing_scan_at' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_scan_at TEXT')
-        if 'missing_upcoming_air_dates' not in show_columns:
-            conn.execute('ALTER TABLE plex_shows ADD COLUMN missing_upcoming_air_dates TEXT')
-        episode_columns = {row[1] for row in conn.execute("PRAGMA table_info('plex_show_episodes')").fetchall()}
-        if 'tmdb_episode_id' not in episode_columns:
-            conn.execute('ALTER TABLE plex_show_episodes ADD COLUMN tmdb_episode_id INTEGER')
-        if 'season_plex_web_url' not in episode_columns:
-            conn.execute('ALTER TABLE plex_show_episodes ADD COLUMN season_plex_web_url TEXT')
-        if 'plex_web_url' not in episode_columns:
-            conn.execute('ALTER TABLE plex_show_episodes ADD COLUMN plex_web_url TEXT')
-        ignored_columns = {row[1] for row in conn.execute("PRAGMA table_info('ignored_episodes')").fetchall()}
-        if not ignored_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS ignored_episodes (
-                    show_id TEXT NOT NULL,
-                    season_number INTEGER NOT NULL,
-                    episode_number INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (show_id, season_number, episode_number)
-                )
-                '''
-            )
-        ignored_movie_columns = {row[1] for row in conn.execute("PRAGMA table_info('ignored_movies')").fetchall()}
-        if not ignored_movie_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS ignored_movies (
-                    actor_id TEXT NOT NULL,
-                    tmdb_movie_id INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (actor_id, tmdb_movie_id)
-                )
-                '''
-            )
-        actor_missing_movie_columns = {row[1] for row in conn.execute("PRAGMA table_info('actor_missing_movies')").fetchall()}
-        if not actor_missing_movie_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS actor_missing_movies (
-                    actor_id TEXT NOT NULL,
-                    tmdb_movie_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    release_date TEXT NOT NULL,
-                    poster_url TEXT,
-                    status TEXT NOT NULL,
-                    ignored INTEGER NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (actor_id, tmdb_movie_id)
-                )
-                '''
-            )
-        if 'poster_url' not in actor_missing_movie_columns:
-            conn.execute('ALTER TABLE actor_missing_movies ADD COLUMN poster_url TEXT')
-        show_missing_episode_columns = {row[1] for row in conn.execute("PRAGMA table_info('show_missing_episodes')").fetchall()}
-        if not show_missing_episode_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS show_missing_episodes (
-                    show_id TEXT NOT NULL,
-                    season_number INTEGER NOT NULL,
-                    episode_number INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    air_date TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    ignored INTEGER NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (show_id, season_number, episode_number)
-                )
-                '''
-            )
-        show_season_summary_columns = {row[1] for row in conn.execute("PRAGMA table_info('show_seasons_summary')").fetchall()}
-        if not show_season_summary_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS show_seasons_summary (
-                    show_id TEXT NOT NULL,
-                    season_number INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    episode_count INTEGER NOT NULL,
-                    air_date TEXT,
-                    poster_url TEXT,
-                    year INTEGER,
-                    in_plex INTEGER NOT NULL,
-                    episodes_in_plex INTEGER NOT NULL,
-                    count_overflow INTEGER NOT NULL,
-                    plex_web_url TEXT,
-                    next_upcoming_air_date TEXT,
-                    missing_new_count INTEGER NOT NULL,
-                    missing_old_count INTEGER NOT NULL,
-                    missing_upcoming_count INTEGER NOT NULL,
-                    status TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (show_id, season_number)
-                )
-                '''
-            )
-        tracked_cast_columns = {row[1] for row in conn.execute("PRAGMA table_info('tracked_cast')").fetchall()}
-        if not tracked_cast_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS tracked_cast (
-                    actor_id TEXT PRIMARY KEY,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-                '''
-            )
-        tracked_movie_columns = {row[1] for row in conn.execute("PRAGMA table_info('tracked_movies')").fetchall()}
-        if not tracked_movie_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS tracked_movies (
-                    tmdb_movie_id INTEGER PRIMARY KEY,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-                '''
-            )
-        tracked_show_columns = {row[1] for row in conn.execute("PRAGMA table_info('tracked_shows')").fetchall()}
-        if not tracked_show_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS tracked_shows (
-                    show_id TEXT PRIMARY KEY,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-                '''
-            )
-        tracked_season_columns = {row[1] for row in conn.execute("PRAGMA table_info('tracked_seasons')").fetchall()}
-        if not tracked_season_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS tracked_seasons (
-                    show_id TEXT NOT NULL,
-                    season_number INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (show_id, season_number)
-                )
-                '''
-            )
-        tracked_episode_columns = {row[1] for row in conn.execute("PRAGMA table_info('tracked_episodes')").fetchall()}
-        if not tracked_episode_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS tracked_episodes (
-                    show_id TEXT NOT NULL,
-                    season_number INTEGER NOT NULL,
-                    episode_number INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (show_id, season_number, episode_number)
-                )
-                '''
-            )
-        untracked_episode_columns = {row[1] for row in conn.execute("PRAGMA table_info('untracked_episodes')").fetchall()}
-        if not untracked_episode_columns:
-            conn.execute(
-                '''
-                CREATE TABLE IF NOT EXISTS untracked_episodes (
-                    show_id TEXT NOT NULL,
-                    season_number INTEGER NOT NULL,
-                    episode_number INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (show_id, season_number, episode_number)
-                )
-                '''
-            )
-        conn.commit()
+    conn.row_factory = sqlite3.Row
+    conn.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    _apply_connection_pragmas(conn)
+    return conn
 
 
 @contextmanager
-def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def _thread_conn(read_only: bool) -> Iterator[sqlite3.Connection]:
+    slot = 'read' if read_only else 'write'
+    conns = _LOCAL.__dict__.setdefault('conns', {})
+    depths = _LOCAL.__dict__.setdefault('depths', {})
+    conn = conns.get(slot)
+    if conn is None:
+        conn = _open_conn(read_only)
+        conns[slot] = conn
+    depths[slot] = depths.get(slot, 0) + 1
     try:
         yield conn
     finally:
-        conn.close()
+        depths[slot] -= 1
+        # Uncommitted work used to be discarded by close(); keep that
+        # behaviour now that the connection outlives the block.
+        if depths[slot] == 0 and conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                conns.pop(slot, None)
+                conn.close()
 
 
-def set_setting(key: str, value: Any) -> None:
-    payload = json.dumps(value)
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    with _thread_conn(read_only=False) as conn:
+        yield conn
+
+
+@contextmanager
+def get_read_conn() -> Iterator[sqlite3.Connection]:
+    with _thread_conn(read_only=True) as conn:
+        yield conn
+
+
+def close_thread_conns() -> None:
+    conns = _LOCAL.__dict__.get('conns', {})
+    for slot in list(conns):
+        conns.pop(slot).close()
+
+
+AUTO_VACUUM_INCREMENTAL = 2
+ANALYSIS_LIMIT = 1000
+FREELIST_VACUUM_RATIO = 0.2
+FREELIST_VACUUM_MIN_PAGES = 256
+
+
+def database_page_stats(conn: sqlite3.Connection) -> dict[str, Any]:
+    page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+    page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    freelist_count = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    analyzed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).fetchone()
+    return {
+        'page_size': page_size,
+        'page_count': page_count,
+        'freelist_count': freelist_count,
+        'freelist_ratio': round(freelist_count / page_count, 4) if page_count else 0.0,
+        'size_bytes': page_size * page_count,
+        'auto_vacuum': conn.execute('PRAGMA auto_vacuum').fetchone()[0],
+        'analyzed': analyzed is not None,
+    }
+
+
+def run_database_maintenance(convert_auto_vacuum: bool = False) -> dict[str, Any]:
+    """Refresh planner statistics and reclaim free pages.
+
+    convert_auto_vacuum switches a database created before incremental vacuum
+    over with a full VACUUM. That rewrites the whole file and needs about its
+    size again in free disk, so it only runs when asked for explicitly.
+    """
+    started = time.perf_counter()
+    actions: list[str] = []
     with get_conn() as conn:
-        conn.execute(
-            'INSERT INTO settings(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value',
-            (key, payload),
-        )
         conn.commit()
+        before = database_page_stats(conn)
+        # analysis_limit keeps ANALYZE to a bounded sample per index, so the
+        # write lock is held for milliseconds even on large libraries.
+        conn.execute(f'PRAGMA analysis_limit = {ANALYSIS_LIMIT}')
+        conn.execute('ANALYZE')
+        conn.execute('PRAGMA optimize')
+        actions.extend(['analyze', 'optimize'])
+        if convert_auto_vacuum and before['auto_vacuum'] != AUTO_VACUUM_INCREMENTAL:
+            # VACUUM also drops the whole freelist.
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            conn.execute('VACUUM')
+            actions.append('vacuum')
+        elif (
+            before['auto_vacuum'] == AUTO_VACUUM_INCREMENTAL
+            and before['freelist_count'] >= FREELIST_VACUUM_MIN_PAGES
+            and before['freelist_ratio'] >= FREELIST_VACUUM_RATIO
+        ):
+            # execute() steps the pragma once (one page); executescript runs
+            # it to completion.
+            conn.executescript('PRAGMA incremental_vacuum;')
+            actions.append('incremental_vacuum')
+        after = database_page_stats(conn)
+    return {
+        'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+        'actions': actions,
+        'before': before,
+        'after': after,
+    }
+
+
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_STEP_SLEEP = 0.005
+BACKUP_GZIP_LEVEL = 1
+BACKUP_COPY_CHUNK = 1024 * 1024
+
+
+def default_backup_path(compress: bool = False) -> Path:
+    stamp = datetime.now(UTC).strftime('%Y%m%d-%H%M%S')
+    return BACKUP_DIR / f'{DB_PATH.stem}-{stamp}.db{".gz" if compress else ""}'
+
+
+def backup_database(
+    target: Path | None = None,
+    *,
+    compress: bool = False,
+    pages_per_step: int = BACKUP_PAGES_PER_STEP,
+) -> dict[str, Any]:
+    started = time.perf_counter()
+    target = Path(target) if target is not None else default_backup_path(compress)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    snapshot_path = target.with_name(f'.{target.name}.snapshot')
+    partial_path = target.with_name(f'.{target.name}.partial')
+    source = sqlite3.connect(f'{DB_PATH.as_uri()}?mode=ro', uri=True, isolation_level=None)
+    try:
+        # A stepped backup restarts whenever another connection commits, so
+        # under steady scan writes it may never finish. Pinning one WAL read
+        # snapshot keeps the copy consistent and still never blocks writers.
+        source.execute('BEGIN')
+        source.execute('SELECT 1 FROM sqlite_master LIMIT 1').fetchone()
+        destination = sqlite3.connect(snapshot_path if compress else partial_path)
+        try:
+            source.backup(destination, pages=pages_per_step, sleep=BACKUP_STEP_SLEEP)
+            # A rollback-journal copy is one self-contained file.
+            destination.execute('PRAGMA journal_mode = DELETE')
+            page_count = destination.execute('PRAGMA page_count').fetchone()[0]
+        finally:
+            destination.close()
+        source.execute('COMMIT')
+    except BaseException:
+        snapshot_path.unlink(missing_ok=True)
+        partial_path.unlink(missing_ok=True)
+        raise
+    finally:
+        source.close()
+    try:
+        if compress:
+            with open(snapshot_path, 'rb') as raw, gzip.open(partial_path, 'wb', compresslevel=BACKUP_GZIP_LEVEL) as packed:
+                shutil.copyfileobj(raw, packed, BACKUP_COPY_CHUNK)
+        os.replace(partial_path, target)
+    finally:
+        snapshot_path.unlink(missing_ok=True)
+        partial_path.unlink(missing_ok=True)
+    return {
+        'path': str(target),
+        'bytes': target.stat().st_size,
+        'pages': page_count,
+        'compressed': compress,
+        'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def restore_database(source: Path) -> dict[str, Any]:
+    started = time.perf_counter()
+    source = original = Path(source)
+    if not source.is_file():
+        raise FileNotFoundError(f'Backup not found: {source}')
+    staged_path: Path | None = None
+    if source.suffix == '.gz':
+        staged_path = DB_PATH.with_name(f'.{DB_PATH.name}.restore')
+        with gzip.open(source, 'rb') as packed, open(staged_path, 'wb') as raw:
+            shutil.copyfileobj(packed, raw, BACKUP_COPY_CHUNK)
+        source = staged_path
+    try:
+        backup = sqlite3.connect(f'{source.as_uri()}?mode=ro', uri=True)
+        try:
+            try:
+                check = backup.execute('PRAGMA quick_check').fetchone()[0]
+            except sqlite3.DatabaseError as exc:
+                raise ValueError(f'Not a valid database backup: {exc}') from exc
+            if check != 'ok':
+                raise ValueError(f'Backup failed its integrity check: {check}')
+            backup_version = backup.execute('PRAGMA user_version').fetchone()[0]
+            if backup_version > SCHEMA_VERSION:
+                raise ValueError(f'Backup schema version {backup_version} is newer than this app ({SCHEMA_VERSION})')
+            with get_conn() as conn:
+                conn.commit()
+                if backup.execute('PRAGMA page_size').fetchone()[0] != conn.execute('PRAGMA page_size').fetchone()[0]:
+                    raise ValueError('Backup page size differs from the live database')
+                previous_version = _read_settings_version(conn)
+                # Copying into the live database in a single step is one write
+                # transaction: every connection, in any process, sees either
+                # the old or the restored contents. Renaming a file under
+                # open WAL connections would leave them on a stale -shm.
+                backup.backup(conn)
+                if backup_version >= 2:
+                    # Settings caches compare this stamp, and the backup's
+                    # value may equal the one they already hold.
+                    conn.execute(
+                        'UPDATE settings_version SET version = ? WHERE id = 1',
+                        (max(previous_version, _read_settings_version(conn)) + 1,),
+                    )
+                conn.commit()
+        finally:
+            backup.close()
+    finally:
+        if staged_path is not None:
+            staged_path.unlink(missing_ok=True)
+    # Older backups are migrated forward like any other database.
+    init_db()
+    invalidate_settings_cache()
+    return {
+        'restored_from': str(original),
+        'schema_version': backup_version,
+        'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+SETTINGS_VERSION_CHECK_INTERVAL = 1.0
+
+_SETTINGS_CACHE: dict[str, Any] = {'values': None, 'version': None, 'checked_at': 0.0}
+_SETTINGS_LOCK = threading.Lock()
+_DELETED = object()
+
+
+def _read_settings_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute('SELECT version FROM settings_version WHERE id = 1').fetchone()
+    return int(row[0]) if row else 0
+
+
+def _settings_snapshot() -> dict[str, Any]:
+    values = _SETTINGS_CACHE['values']
+    if values is not None and time.monotonic() - _SETTINGS_CACHE['checked_at'] < SETTINGS_VERSION_CHECK_INTERVAL:
+        return values
+    with _SETTINGS_LOCK:
+        values = _SETTINGS_CACHE['values']
+        with get_read_conn() as conn:
+            version = _read_settings_version(conn)
+            if values is None or version != _SETTINGS_CACHE['version']:
+                values = {}
+                for row in conn.execute('SELECT key, value FROM settings').fetchall():
+                    try:
+                        values[row['key']] = json.loads(row['value'])
+                    except json.JSONDecodeError:
+                        continue
+                _SETTINGS_CACHE['values'] = values
+                _SETTINGS_CACHE['version'] = version
+        _SETTINGS_CACHE['checked_at'] = time.monotonic()
+    return values
+
+
+def _apply_settings_write(
+    previous_version: int,
+    version: int,
+    changed_rows: int,
+    changes: dict[str, Any],
+) -> None:
+    values = _SETTINGS_CACHE['values']
+    if (
+        values is None
+        or _SETTINGS_CACHE['version'] != previous_version
+        or version != previous_version + changed_rows
+    ):
+        # Another process wrote in between; reload on next read.
+        _SETTINGS_CACHE['values'] = None
+        return
+    for key, value in changes.items():
+        if value is _DELETED:
+            values.pop(key, None)
+        else:
+            values[key] = value
+    _SETTINGS_CACHE['version'] = version
+
+
+def invalidate_settings_cache() -> None:
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE['values'] = None
+
+
+def set_setting(key: str, value: Any) -> None:
+    payload = json.dumps(value)
+    with _SETTINGS_LOCK:
+        with get_conn() as conn:
+            previous_version = _read_settings_version(conn)
+            cursor = conn.execute(
+                'INSERT INTO settings(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                (key, payload),
+            )
+            version = _read_settings_version(conn)
+            conn.commit()
+        _apply_settings_write(previous_version, version, cursor.rowcount, {key: json.loads(payload)})
 
 
 def get_setting(key: str, default: Any = None) -> Any:
-    with get_conn() as conn:
-        row = conn.execute('SELECT value FROM settings WHERE key = ?', (key,)).fetchone()
-        if not row:
-            return default
-        return json.loads(row['value'])
+    values = _settings_snapshot()
+    if key not in values:
+        return default
+    value = values[key]
+    # Callers mutate returned dicts/lists before writing them back.
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
 
 def clear_settings(keys: list[str]) -> None:
-    with get_conn() as conn:
-        conn.executemany('DELETE FROM settings WHERE key = ?', [(k,) for k in keys])
-        conn.commit()
+    with _SETTINGS_LOCK:
+        with get_conn() as conn:
+            previous_version = _read_settings_version(conn)
+            cursor = conn.executemany('DELETE FROM settings WHERE key = ?', [(k,) for k in keys])
+            version = _read_settings_version(conn)
+            conn.commit()
+        _apply_settings_write(previous_version, version, cursor.rowcount, {key: _DELETED for key in keys})
+
+
+# release_events holds one row per visible calendar/discovery item: missing
+# rows that are not ignored, with a valid YYYY-MM-DD date and their tracked
+# flags resolved. Show titles and library membership are joined at read time.
+_MOVIE_RELEASE_EVENTS_SQL = '''
+    INSERT INTO release_events (media_type, event_day, event_date, tmdb_movie_id, title, poster_url, status, tracked)
+    SELECT
+        'movie',
+        CAST(julianday(m.release_date) - 2440587.5 AS INTEGER),
+        m.release_date,
+        m.tmdb_movie_id,
+        MIN(m.title),
+        MIN(m.poster_url),
+        CASE WHEN MAX(m.status = 'upcoming') = 1 THEN 'upcoming' ELSE MIN(m.status) END,
+        EXISTS (SELECT 1 FROM tracked_movies t WHERE t.tmdb_movie_id = m.tmdb_movie_id)
+    FROM actor_missing_movies m
+    WHERE
+        m.ignored = 0
+        AND date(m.release_date) = m.release_date
+        AND NOT EXISTS (
+            SELECT 1 FROM ignored_movies i
+            WHERE i.actor_id = m.actor_id AND i.tmdb_movie_id = m.tmdb_movie_id
+        )
+        {scope_sql}
+    GROUP BY m.tmdb_movie_id, m.release_date
+'''
+
+_SHOW_RELEASE_EVENTS_SQL = '''
+    INSERT INTO release_events (
+        media_type,
+        event_day,
+        event_date,
+        show_id,
+        season_number,
+        episode_number,
+        title,
+        status,
+        tracked,
+        tracked_show,
+        tracked_season,
+        tracked_episode
+    )
+    SELECT
+        'show',
+        CAST(julianday(e.air_date) - 2440587.5 AS INTEGER),
+        e.air_date,
+        e.show_id,
+        e.season_number,
+        e.episode_number,
+        e.title,
+        e.status,
+        COALESCE(te.tracked, ts.tracked, tsh.tracked, 0),
+        tsh.tracked IS NOT NULL,
+        ts.tracked IS NOT NULL AND e.season_number > 0,
+        COALESCE(te.tracked, 0)
+    FROM show_missing_episodes e
+    LEFT JOIN effective_tracked_episodes tsh
+        ON tsh.show_id = e.show_id AND tsh.season_number = 0 AND tsh.episode_number = 0
+    LEFT JOIN effective_tracked_episodes ts
+        ON ts.show_id = e.show_id AND ts.season_number = e.season_number AND ts.episode_number = 0
+    LEFT JOIN effective_tracked_episodes te
+        ON te.show_id = e.show_id
+        AND te.season_number = e.season_number
+        AND te.episode_number = e.episode_number
+    WHERE
+        e.ignored = 0
+        AND date(e.air_date) = e.air_date
+        AND NOT EXISTS (
+            SELECT 1 FROM ignored_episodes i
+            WHERE i.show_id = e.show_id
+                AND i.season_number = e.season_number
+                AND i.episode_number = e.episode_number
+        )
+        {scope_sql}
+'''
+
+
+def refresh_movie_release_events(conn: sqlite3.Connection, tmdb_movie_ids: Iterable[int] | None = None) -> None:
+    """Rebuild movie release events, for the given TMDb ids or all movies."""
+    if tmdb_movie_ids is None:
+        conn.execute("DELETE FROM release_events WHERE media_type = 'movie'")
+        conn.execute(_MOVIE_RELEASE_EVENTS_SQL.format(scope_sql=''))
+        return
+    params = [(int(tmdb_movie_id),) for tmdb_movie_id in set(tmdb_movie_ids)]
+    conn.executemany("DELETE FROM release_events WHERE media_type = 'movie' AND tmdb_movie_id = ?", params)
+    conn.executemany(_MOVIE_RELEASE_EVENTS_SQL.format(scope_sql='AND m.tmdb_movie_id = ?'), params)
+
+
+def refresh_show_release_events(conn: sqlite3.Connection, show_ids: Iterable[str] | None = None) -> None:
+    """Rebuild episode release events, for the given shows or all shows."""
+    if show_ids is None:
+        conn.execute("DELETE FROM release_events WHERE media_type = 'show'")
+        conn.execute(_SHOW_RELEASE_EVENTS_SQL.format(scope_sql=''))
+        return
+    params = [(str(show_id),) for show_id in set(show_ids)]
+    conn.executemany("DELETE FROM release_events WHERE media_type = 'show' AND show_id = ?", params)
+    conn.executemany(_SHOW_RELEASE_EVENTS_SQL.format(scope_sql='AND e.show_id = ?'), params)
@@ -0,0 +1,204 @@
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, UTC
+from typing import Any, Callable
+
+from .config import JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+JOB_HISTORY_LIMIT = 50
+ACTIVE_JOB_STATUSES = {'queued', 'running'}
+
+
+class JobCancelled(Exception):
+    pass
+
+
+_JOBS: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_FUTURES: dict[str, Future] = {}
+_JOBS_LOCK = threading.Lock()
+_EXECUTOR = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='scan-job')
+_CURRENT = threading.local()
+_SHUTDOWN = threading.Event()
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _snapshot(job: dict[str, Any]) -> dict[str, Any]:
+    return {**job, 'progress': dict(job['progress']), 'counters': dict(job['counters'])}
+
+
+def _prune_finished_jobs() -> None:
+    finished = [job_id for job_id, job in _JOBS.items() if job['status'] not in ACTIVE_JOB_STATUSES]
+    for job_id in finished[: max(0, len(finished) - JOB_HISTORY_LIMIT)]:
+        del _JOBS[job_id]
+
+
+def submit_job(
+    kind: str,
+    target: Callable[..., Any],
+    *args: Any,
+    params: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], bool]:
+    """Queue target(*args) on the job pool; returns (job, created).
+
+    A queued or running job of the same kind and params is returned instead
+    of starting a second copy of the same scan.
+    """
+    params = params or {}
+    with _JOBS_LOCK:
+        for job in _JOBS.values():
+            if job['kind'] == kind and job['params'] == params and job['status'] in ACTIVE_JOB_STATUSES:
+                return _snapshot(job), False
+        job = {
+            'id': uuid.uuid4().hex[:12],
+            'kind': kind,
+            'params': params,
+            'status': 'queued',
+            'phase': None,
+            'progress': {'done': 0, 'total': None},
+            'counters': {},
+            'result': None,
+            'error': None,
+            'cancel_requested': False,
+            'submitted_at': _now_iso(),
+            'started_at': None,
+            'finished_at': None,
+        }
+        _JOBS[job['id']] = job
+        _prune_finished_jobs()
+        _FUTURES[job['id']] = _EXECUTOR.submit(_run_job, job, target, args)
+        return _snapshot(job), True
+
+
+def _run_job(job: dict[str, Any], target: Callable[..., Any], args: tuple[Any, ...]) -> None:
+    with _JOBS_LOCK:
+        if job['cancel_requested']:
+            job['status'] = 'cancelled'
+            job['finished_at'] = _now_iso()
+            _FUTURES.pop(job['id'], None)
+            return
+        job['status'] = 'running'
+        job['started_at'] = _now_iso()
+    _CURRENT.job = job
+    status = 'succeeded'
+    result: Any = None
+    error: str | None = None
+    try:
+        result = target(*args)
+        if job['cancel_requested']:
+            status = 'cancelled'
+    except JobCancelled:
+        status = 'cancelled'
+    except Exception as exc:  # noqa: BLE001
+        status = 'failed'
+        # HTTPException carries the user-facing message in detail.
+        error = str(getattr(exc, 'detail', None) or exc)
+        if not hasattr(exc, 'status_code'):
+            logger.exception('Background job %s (%s) failed', job['id'], job['kind'])
+    finally:
+        _CURRENT.job = None
+        with _JOBS_LOCK:
+            job['status'] = status
+            job['result'] = result
+            job['error'] = error
+            job['finished_at'] = _now_iso()
+            _FUTURES.pop(job['id'], None)
+
+
+def get_job(job_id: str) -> dict[str, Any] | None:
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+        return _snapshot(job) if job is not None else None
+
+
+def list_jobs(limit: int = 20) -> list[dict[str, Any]]:
+    with _JOBS_LOCK:
+        jobs = [_snapshot(job) for job in reversed(_JOBS.values())]
+    return jobs[:limit]
+
+
+def has_active_job(kinds: set[str]) -> bool:
+    with _JOBS_LOCK:
+        return any(job['kind'] in kinds and job['status'] in ACTIVE_JOB_STATUSES for job in _JOBS.values())
+
+
+def cancel_job(job_id: str) -> dict[str, Any] | None:
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+        if job is None:
+            return None
+        if job['status'] in ACTIVE_JOB_STATUSES:
+            job['cancel_requested'] = True
+            future = _FUTURES.get(job_id)
+            if job['status'] == 'queued' and future is not None and future.cancel():
+                job['status'] = 'cancelled'
+                job['finished_at'] = _now_iso()
+                _FUTURES.pop(job_id, None)
+        return _snapshot(job)
+
+
+def shutdown_jobs() -> None:
+    """Ask every queued or running job to stop because the process is exiting.
+
+    The job threads are not daemons, so interpreter exit waits for them;
+    without this a restart would wait for a long scan to run to the end.
+    """
+    _SHUTDOWN.set()
+    with _JOBS_LOCK:
+        for job_id, job in _JOBS.items():
+            if job['status'] not in ACTIVE_JOB_STATUSES:
+                continue
+            job['cancel_requested'] = True
+            future = _FUTURES.get(job_id)
+            if job['status'] == 'queued' and future is not None and future.cancel():
+                job['status'] = 'cancelled'
+                job['finished_at'] = _now_iso()
+                _FUTURES.pop(job_id, None)
+
+
+def shutdown_requested() -> bool:
+    return _SHUTDOWN.is_set()
+
+
+# The helpers below report into the job running on the calling thread and do
+# nothing when the same code runs inside a plain HTTP request.
+
+
+def job_phase(phase: str, total: int | None = None) -> None:
+    job = getattr(_CURRENT, 'job', None)
+    if job is None:
+        return
+    with _JOBS_LOCK:
+        job['phase'] = phase
+        if total is not None:
+            job['progress'] = {'done': 0, 'total': total}
+
+
+def job_progress(done: int | None = None, **counters: int) -> None:
+    job = getattr(_CURRENT, 'job', None)
+    if job is None:
+        return
+    with _JOBS_LOCK:
+        if done is not None:
+            job['progress'] = {**job['progress'], 'done': done}
+        job['counters'].update(counters)
+
+
+def job_cancel_requested() -> bool:
+    # Shutdown also stops scans running inside a plain HTTP request.
+    if _SHUTDOWN.is_set():
+        return True
+    job = getattr(_CURRENT, 'job', None)
+    return bool(job is not None and job['cancel_requested'])
+
+
+def raise_if_job_cancelled() -> None:
+    if job_cancel_requested():
+        raise JobCancelled()
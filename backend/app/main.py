@@ -1,36 +1,80 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 
 import json
 import logging
+import threading
 import time
 import hashlib
-from datetime import datetime, UTC, timedelta
+from contextvars import copy_context
+from datetime import date, datetime, UTC, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator
 from xml.etree.ElementTree import ParseError
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.trustedhost import TrustedHostMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 import requests
 from requests import ConnectionError as RequestsConnectionError, RequestException
 
-from .config import APP_NAME, APP_VERSION, HOST, PLEX_CLIENT_ID, STATIC_DIR, TMDB_API_KEY
-from .db import clear_settings, get_conn, get_setting, init_db, set_setting
+from .config import (
+    APP_NAME,
+    APP_VERSION,
+    BACKUP_DIR,
+    HOST,
+    LIBRARY_WRITE_CHUNK_SIZE,
+    MISSING_SCAN_FRESH_DAYS,
+    MISSING_SCAN_WORKERS,
+    MISSING_SCAN_WRITE_BATCH,
+    PLEX_CLIENT_ID,
+    STATIC_DIR,
+    TMDB_API_KEY,
+)
+from .db import (
+    AUTO_VACUUM_INCREMENTAL,
+    backup_database,
+    clear_settings,
+    database_page_stats,
+    get_conn,
+    get_read_conn,
+    get_setting,
+    init_db,
+    invalidate_settings_cache,
+    refresh_movie_release_events,
+    refresh_show_release_events,
+    run_database_maintenance,
+    set_setting,
+)
+from .jobs import (
+    cancel_job,
+    get_job,
+    has_active_job,
+    job_cancel_requested,
+    job_phase,
+    job_progress,
+    list_jobs,
+    raise_if_job_cancelled,
+    shutdown_jobs,
+    shutdown_requested,
+    submit_job,
+)
 from .plex_client import (
     append_collection_to_movies,
     candidate_server_uris,
     check_pin,
     choose_preferred_server,
+    count_bytes_received,
     create_smart_collection_for_person,
     fetch_movie_library_snapshot,
-    fetch_show_library_snapshot,
     get_account_profile,
     get_resources,
+    iter_show_library_snapshot,
     pick_server_uri,
     resolve_show_tmdb_ids,
     resolve_movie_section_ids,
@@ -38,17 +82,23 @@ from .plex_client import (
 )
 from .tmdb_client import (
     TMDbNotConfiguredError,
+    count_tmdb_requests,
+    find_movie_id_by_imdb_id,
     get_movie_credits_summary,
     get_movie_trailer_url,
     get_person_movie_credits,
+    get_tmdb_request_stats,
     get_tv_show_trailer_url,
     get_tv_season_episodes,
+    get_tv_show_details,
     get_tv_show_seasons,
     search_person,
     search_tv_show,
+    tmdb_requests_counted,
+    warm_movie_genre_map,
 )
 from .tmdb_client import get_tmdb_api_key
-from .utils import normalize_title
+from .utils import cron_matches, next_cron_run, normalize_title, parse_cron
 
 app = FastAPI(title=APP_NAME, version=APP_VERSION)
 logger = logging.getLogger(__name__)
@@ -112,16 +162,40 @@ class CreateSmartCollectionPayload(BaseModel):
 
 class ShowMissingScanPayload(BaseModel):
     show_ids: list[str]
+    force: bool = False
 
 
 class ActorMissingScanPayload(BaseModel):
     actor_ids: list[str]
+    force: bool = False
 
 
 class ScanCastPayload(BaseModel):
     role: str = 'all'
 
 
+class BackupPayload(BaseModel):
+    compress: bool = False
+
+
+class MaintenancePayload(BaseModel):
+    convert_auto_vacuum: bool = False
+
+
+class ScanSchedulePayload(BaseModel):
+    enabled: bool | None = None
+    library_cron: str | None = None
+    missing_cron: str | None = None
+    missing_batch_size: int | None = None
+    rescan_after_hours: int | None = None
+    tmdb_daily_budget: int | None = None
+
+
+class JobSubmitPayload(BaseModel):
+    kind: str
+    params: dict[str, Any] = {}
+
+
 class IgnoreEpisodePayload(BaseModel):
     ignored: bool
 
@@ -158,13 +232,41 @@ DEFAULT_DOWNLOAD_PREFIX = {
 VALID_DOWNLOAD_MODES = {'encoded_space', 'hyphen', 'plus'}
 
 
-def _parse_iso_date(value: str | None) -> datetime | None:
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_EPOCH_ORDINAL = EPOCH.date().toordinal()
+
+
+@lru_cache(maxsize=65536)
+def _iso_day_number(value: str | None) -> int | None:
+    """Days since 1970-01-01 for a YYYY-MM-DD date; the same number as release_events.event_day."""
     if not value:
         return None
     try:
-        return datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=UTC)
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            parsed = date.fromisoformat(value)
+        else:
+            parsed = datetime.strptime(value, '%Y-%m-%d').date()
     except ValueError:
         return None
+    return parsed.toordinal() - _EPOCH_ORDINAL
+
+
+def _parse_iso_date(value: str | None) -> datetime | None:
+    day_number = _iso_day_number(value)
+    if day_number is None:
+        return None
+    return EPOCH + timedelta(days=day_number)
+
+
+@lru_cache(maxsize=16)
+def _status_day_bounds(now_dt: datetime, new_window_days: int = 90) -> tuple[int, int]:
+    """(today, first new day) as day numbers: later days are upcoming, earlier ones missing."""
+    elapsed = now_dt - EPOCH
+    today = elapsed.days
+    # A date counts as midnight UTC, so part way through today the day
+    # exactly new_window_days back has already left the window.
+    first_new_day = today - new_window_days + (1 if elapsed.seconds or elapsed.microseconds else 0)
+    return today, first_new_day
 
 
 def _classify_missing_air_date(
@@ -173,12 +275,13 @@ def _classify_missing_air_date(
     now_dt: datetime,
     new_window_days: int = 90,
 ) -> str:
-    parsed = _parse_iso_date(air_date)
-    if parsed is None:
+    day_number = _iso_day_number(air_date)
+    if day_number is None:
         return 'unknown'
-    if parsed > now_dt:
+    today, first_new_day = _status_day_bounds(now_dt, new_window_days)
+    if day_number > today:
         return 'upcoming'
-    if parsed >= (now_dt - timedelta(days=new_window_days)):
+    if day_number >= first_new_day:
         return 'new'
     return 'missing'
 
@@ -355,6 +458,34 @@ def _set_track_movie_state(conn, tmdb_movie_id: int, tracked: bool) -> None:
     conn.execute('DELETE FROM tracked_movies WHERE tmdb_movie_id = ?', (tmdb_movie_id,))
 
 
+def _set_effective_tracking(
+    conn,
+    show_id: str,
+    season_number: int,
+    episode_number: int,
+    tracked: bool | None,
+) -> None:
+    # Mirrors the tracking tables into effective_tracked_episodes; None clears
+    # the entry so the broader season or show row applies again.
+    if tracked is None:
+        conn.execute(
+            '''
+            DELETE FROM effective_tracked_episodes
+            WHERE show_id = ? AND season_number = ? AND episode_number = ?
+            ''',
+            (show_id, season_number, episode_number),
+        )
+        return
+    conn.execute(
+        '''
+        INSERT INTO effective_tracked_episodes (show_id, season_number, episode_number, tracked)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(show_id, season_number, episode_number) DO UPDATE SET tracked = excluded.tracked
+        ''',
+        (show_id, season_number, episode_number, 1 if tracked else 0),
+    )
+
+
 def _set_track_show_state(conn, show_id: str, tracked: bool) -> None:
     now_iso = datetime.now(UTC).isoformat()
     if tracked:
@@ -366,8 +497,10 @@ def _set_track_show_state(conn, show_id: str, tracked: bool) -> None:
             ''',
             (show_id, now_iso, now_iso),
         )
+        _set_effective_tracking(conn, show_id, 0, 0, True)
         return
     conn.execute('DELETE FROM tracked_shows WHERE show_id = ?', (show_id,))
+    _set_effective_tracking(conn, show_id, 0, 0, None)
 
 
 def _set_track_season_state(conn, show_id: str, season_number: int, tracked: bool) -> None:
@@ -381,11 +514,13 @@ def _set_track_season_state(conn, show_id: str, season_number: int, tracked: boo
             ''',
             (show_id, season_number, now_iso, now_iso),
         )
+        _set_effective_tracking(conn, show_id, season_number, 0, True)
         return
     conn.execute(
         'DELETE FROM tracked_seasons WHERE show_id = ? AND season_number = ?',
         (show_id, season_number),
     )
+    _set_effective_tracking(conn, show_id, season_number, 0, None)
 
 
 def _set_untracked_episode_override(
@@ -405,6 +540,7 @@ def _set_untracked_episode_override(
             ''',
             (show_id, season_number, episode_number, now_iso, now_iso),
         )
+        _set_effective_tracking(conn, show_id, season_number, episode_number, False)
         return
     conn.execute(
         '''
@@ -413,6 +549,13 @@ def _set_untracked_episode_override(
         ''',
         (show_id, season_number, episode_number),
     )
+    conn.execute(
+        '''
+        DELETE FROM effective_tracked_episodes
+        WHERE show_id = ? AND season_number = ? AND episode_number = ? AND tracked = 0
+        ''',
+        (show_id, season_number, episode_number),
+    )
 
 
 def _set_track_episode_state(conn, show_id: str, season_number: int, episode_number: int, tracked: bool) -> None:
@@ -426,6 +569,7 @@ def _set_track_episode_state(conn, show_id: str, season_number: int, episode_num
             ''',
             (show_id, season_number, episode_number, now_iso, now_iso),
         )
+        _set_effective_tracking(conn, show_id, season_number, episode_number, True)
         _set_untracked_episode_override(conn, show_id, season_number, episode_number, False)
         return
     conn.execute(
@@ -435,16 +579,77 @@ def _set_track_episode_state(conn, show_id: str, season_number: int, episode_num
         ''',
         (show_id, season_number, episode_number),
     )
+    _set_effective_tracking(conn, show_id, season_number, episode_number, None)
     inherited = bool(
-        conn.execute('SELECT 1 FROM tracked_shows WHERE show_id = ?', (show_id,)).fetchone()
-        or conn.execute(
-            'SELECT 1 FROM tracked_seasons WHERE show_id = ? AND season_number = ?',
+        conn.execute(
+            '''
+            SELECT 1 FROM effective_tracked_episodes
+            WHERE show_id = ? AND season_number IN (0, ?) AND episode_number = 0
+            ''',
             (show_id, season_number),
         ).fetchone()
     )
     _set_untracked_episode_override(conn, show_id, season_number, episode_number, inherited)
 
 
+def _clear_episode_tracking(
+    conn,
+    show_id: str,
+    season_number: int | None = None,
+    *,
+    overrides_only: bool = False,
+) -> None:
+    """Drop tracking below a show or season; overrides_only keeps tracked rows."""
+    scope_sql = ''
+    params: tuple[Any, ...] = (show_id,)
+    if season_number is not None:
+        scope_sql = 'AND season_number = ?'
+        params = (show_id, season_number)
+    conn.execute(f'DELETE FROM untracked_episodes WHERE show_id = ? {scope_sql}', params)
+    if overrides_only:
+        conn.execute(f'DELETE FROM effective_tracked_episodes WHERE show_id = ? {scope_sql} AND tracked = 0', params)
+        return
+    conn.execute(f'DELETE FROM tracked_episodes WHERE show_id = ? {scope_sql}', params)
+    if season_number is None:
+        conn.execute('DELETE FROM tracked_seasons WHERE show_id = ?', params)
+        conn.execute('DELETE FROM effective_tracked_episodes WHERE show_id = ? AND season_number > 0', params)
+        return
+    conn.execute(
+        f'DELETE FROM effective_tracked_episodes WHERE show_id = ? {scope_sql} AND episode_number > 0',
+        params,
+    )
+
+
+def _get_effective_tracking(conn, show_id: str, season_number: int | None = None) -> dict[tuple[int, int], bool]:
+    """Tracking rows for a show, or one season plus the show-level row.
+
+    Keys are (season, episode); 0 stands for the whole show or season. The most
+    specific key present decides whether an episode is tracked.
+    """
+    if season_number is None:
+        rows = conn.execute(
+            'SELECT season_number, episode_number, tracked FROM effective_tracked_episodes WHERE show_id = ?',
+            (show_id,),
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            '''
+            SELECT season_number, episode_number, tracked
+            FROM effective_tracked_episodes
+            WHERE show_id = ? AND season_number IN (0, ?)
+            ''',
+            (show_id, season_number),
+        ).fetchall()
+    return {(int(row['season_number']), int(row['episode_number'])): bool(row['tracked']) for row in rows}
+
+
+def _is_episode_tracked(tracking: dict[tuple[int, int], bool], season_number: int, episode_number: int) -> bool:
+    for key in ((season_number, episode_number), (season_number, 0), (0, 0)):
+        if key in tracking:
+            return tracking[key]
+    return False
+
+
 def get_download_prefix_settings() -> dict[str, str]:
     raw = get_setting('download_prefix', {})
     if not isinstance(raw, dict):
@@ -509,6 +714,179 @@ def _build_plex_movie_match_context(conn) -> dict[str, Any]:
     }
 
 
+IMDB_RESOLVE_MISS_TTL = timedelta(days=7)
+IMDB_RESOLVER_STATE: dict[str, Any] = {'running': False, 'last_run_at': None, 'resolved': 0}
+IMDB_RESOLVER_LOCK = threading.Lock()
+
+
+def resolve_plex_movie_tmdb_ids() -> int:
+    """Fill plex_movies.tmdb_id from IMDb ids so matching can join on ids."""
+    with get_conn() as conn:
+        # Apply previously resolved ids first; new or re-added movies come in
+        # from a library rescan without them.
+        conn.execute(
+            '''
+            UPDATE plex_movies
+            SET tmdb_id = (
+                SELECT c.tmdb_movie_id FROM tmdb_imdb_movie_ids c WHERE c.imdb_id = plex_movies.imdb_id
+            )
+            WHERE tmdb_id IS NULL
+                AND imdb_id IS NOT NULL
+                AND EXISTS (
+                    SELECT 1 FROM tmdb_imdb_movie_ids c
+                    WHERE c.imdb_id = plex_movies.imdb_id AND c.tmdb_movie_id IS NOT NULL
+                )
+            '''
+        )
+        conn.commit()
+        miss_cutoff = (datetime.now(UTC) - IMDB_RESOLVE_MISS_TTL).isoformat()
+        pending_imdb_ids = [
+            str(row['imdb_id'])
+            for row in conn.execute(
+                '''
+                SELECT DISTINCT m.imdb_id
+                FROM plex_movies m
+                LEFT JOIN tmdb_imdb_movie_ids c ON c.imdb_id = m.imdb_id
+                WHERE m.tmdb_id IS NULL
+                    AND m.imdb_id IS NOT NULL
+                    AND (c.imdb_id IS NULL OR (c.tmdb_movie_id IS NULL AND c.updated_at < ?))
+                ''',
+                (miss_cutoff,),
+            ).fetchall()
+        ]
+    if not pending_imdb_ids:
+        return 0
+
+    def fetch_one(imdb_id: str) -> tuple[str, int | None] | None:
+        try:
+            return imdb_id, find_movie_id_by_imdb_id(imdb_id)
+        except RequestException:
+            return None
+
+    resolved_rows: list[tuple[str, int | None, str]] = []
+    with ThreadPoolExecutor(max_workers=min(6, len(pending_imdb_ids))) as pool:
+        for result in pool.map(fetch_one, pending_imdb_ids):
+            if result is None:
+                continue
+            imdb_id, tmdb_movie_id = result
+            resolved_rows.append((imdb_id, tmdb_movie_id, datetime.now(UTC).isoformat()))
+
+    with get_conn() as conn:
+        conn.executemany(
+            '''
+            INSERT INTO tmdb_imdb_movie_ids (imdb_id, tmdb_movie_id, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(imdb_id) DO UPDATE SET
+                tmdb_movie_id = excluded.tmdb_movie_id,
+                updated_at = excluded.updated_at
+            ''',
+            resolved_rows,
+        )
+        conn.executemany(
+            'UPDATE plex_movies SET tmdb_id = ? WHERE imdb_id = ? AND tmdb_id IS NULL',
+            [(tmdb_movie_id, imdb_id) for imdb_id, tmdb_movie_id, _ in resolved_rows if tmdb_movie_id is not None],
+        )
+        conn.commit()
+    return sum(1 for _, tmdb_movie_id, _ in resolved_rows if tmdb_movie_id is not None)
+
+
+def _run_plex_movie_id_resolver() -> None:
+    try:
+        resolved = resolve_plex_movie_tmdb_ids()
+        IMDB_RESOLVER_STATE['resolved'] = resolved
+        IMDB_RESOLVER_STATE['last_run_at'] = datetime.now(UTC).isoformat()
+    except TMDbNotConfiguredError:
+        pass
+    except Exception:  # noqa: BLE001
+        logger.exception('Background TMDb id resolution for Plex movies failed')
+    finally:
+        IMDB_RESOLVER_STATE['running'] = False
+
+
+def start_plex_movie_id_resolver() -> bool:
+    with IMDB_RESOLVER_LOCK:
+        if IMDB_RESOLVER_STATE['running']:
+            return False
+        IMDB_RESOLVER_STATE['running'] = True
+    threading.Thread(target=_run_plex_movie_id_resolver, name='plex-movie-id-resolver', daemon=True).start()
+    return True
+
+
+# Planner statistics go stale as scans add rows; refresh them once enough
+# rows have been written rather than on every small edit.
+MAINTENANCE_CHANGE_THRESHOLD = 5000
+MAINTENANCE_STATE: dict[str, Any] = {'running': False, 'pending_changes': 0}
+MAINTENANCE_LOCK = threading.Lock()
+
+
+def _run_database_maintenance(convert_auto_vacuum: bool = False) -> None:
+    try:
+        result = run_database_maintenance(convert_auto_vacuum=convert_auto_vacuum)
+        set_setting('last_maintenance', {'ran_at': datetime.now(UTC).isoformat(), **result})
+    except Exception:  # noqa: BLE001
+        logger.exception('Background database maintenance failed')
+    finally:
+        MAINTENANCE_STATE['running'] = False
+
+
+def start_database_maintenance(force: bool = False, convert_auto_vacuum: bool = False) -> bool:
+    with MAINTENANCE_LOCK:
+        if MAINTENANCE_STATE['running']:
+            return False
+        if not force and MAINTENANCE_STATE['pending_changes'] < MAINTENANCE_CHANGE_THRESHOLD:
+            return False
+        MAINTENANCE_STATE['running'] = True
+        MAINTENANCE_STATE['pending_changes'] = 0
+    threading.Thread(
+        target=_run_database_maintenance,
+        args=(convert_auto_vacuum,),
+        name='database-maintenance',
+        daemon=True,
+    ).start()
+    return True
+
+
+def record_bulk_write(changed_rows: int) -> None:
+    if changed_rows <= 0:
+        return
+    with MAINTENANCE_LOCK:
+        MAINTENANCE_STATE['pending_changes'] += changed_rows
+    start_database_maintenance()
+
+
+BACKUP_STATE: dict[str, Any] = {'running': False, 'error': None}
+BACKUP_LOCK = threading.Lock()
+
+
+def _run_database_backup(compress: bool) -> None:
+    try:
+        result = backup_database(compress=compress)
+        set_setting('last_backup', {'finished_at': datetime.now(UTC).isoformat(), **result})
+        BACKUP_STATE['error'] = None
+    except Exception as exc:  # noqa: BLE001
+        logger.exception('Database backup failed')
+        BACKUP_STATE['error'] = str(exc)
+    finally:
+        BACKUP_STATE['running'] = False
+
+
+def start_database_backup(compress: bool = False) -> bool:
+    with BACKUP_LOCK:
+        if BACKUP_STATE['running']:
+            return False
+        BACKUP_STATE['running'] = True
+    threading.Thread(target=_run_database_backup, args=(compress,), name='database-backup', daemon=True).start()
+    return True
+
+
+def _written_row_count(changes: dict[str, Any]) -> int:
+    return sum(
+        stats['inserted'] + stats['updated'] + stats['deleted']
+        for stats in changes.values()
+        if isinstance(stats, dict)
+    )
+
+
 def _get_tracked_movie_ids(conn) -> set[int]:
     return {
         int(row['tmdb_movie_id'])
@@ -622,14 +1000,14 @@ def _build_show_season_summary_rows(
         missing_upcoming_count = 0
         season_episodes = season_episodes_by_number.get(season_no, [])
         earliest_episode_air_date: str | None = None
-        earliest_episode_air_dt: datetime | None = None
+        earliest_episode_air_day: int | None = None
         for ep in season_episodes:
             ep_air_date = str(ep.get('air_date') or '').strip() or None
-            ep_air_dt = _parse_iso_date(ep_air_date)
-            if ep_air_dt is None:
+            ep_air_day = _iso_day_number(ep_air_date)
+            if ep_air_day is None:
                 continue
-            if earliest_episode_air_dt is None or ep_air_dt < earliest_episode_air_dt:
-                earliest_episode_air_dt = ep_air_dt
+            if earliest_episode_air_day is None or ep_air_day < earliest_episode_air_day:
+                earliest_episode_air_day = ep_air_day
                 earliest_episode_air_date = ep_air_date
         upcoming_dates: list[str] = []
         for ep in season_episodes:
@@ -659,7 +1037,7 @@ def _build_show_season_summary_rows(
         elif missing_old_count > 0:
             status = 'missing'
         season_air_date = str(season.get('air_date') or '').strip() or None
-        if _parse_iso_date(season_air_date) is None and earliest_episode_air_date:
+        if _iso_day_number(season_air_date) is None and earliest_episode_air_date:
             season_air_date = earliest_episode_air_date
         if season_air_date == '':
             season_air_date = None
@@ -737,26 +1115,122 @@ def _build_show_season_items_from_summary_rows(
     return items
 
 
-def upsert_actor_and_movies(actors: list[dict[str, Any]], movies: list[dict[str, Any]]) -> None:
+ACTOR_COLUMNS = (
+    'actor_id',
+    'name',
+    'role',
+    'appearances',
+    'tmdb_person_id',
+    'image_url',
+    'plex_web_url',
+    'movies_in_plex_count',
+    'missing_movie_count',
+    'missing_new_count',
+    'missing_upcoming_count',
+    'first_release_date',
+    'next_upcoming_release_date',
+    'missing_scan_at',
+    'updated_at',
+)
+PLEX_SHOW_COLUMNS = (
+    'show_id',
+    'plex_rating_key',
+    'title',
+    'year',
+    'tmdb_show_id',
+    'normalized_title',
+    'image_url',
+    'plex_web_url',
+    'has_missing_episodes',
+    'missing_episode_count',
+    'missing_new_count',
+    'missing_old_count',
+    'missing_upcoming_count',
+    'missing_scan_at',
+    'missing_upcoming_air_dates',
+    'updated_at',
+)
+PLEX_EPISODE_COLUMNS = (
+    'plex_rating_key',
+    'show_id',
+    'season_number',
+    'episode_number',
+    'title',
+    'normalized_title',
+    'tmdb_episode_id',
+    'season_plex_web_url',
+    'plex_web_url',
+    'updated_at',
+)
+PLEX_MOVIE_COLUMNS = (
+    'plex_rating_key',
+    'library_section_id',
+    'title',
+    'original_title',
+    'year',
+    'tmdb_id',
+    'imdb_id',
+    'normalized_title',
+    'normalized_original_title',
+    'plex_web_url',
+    'updated_at',
+)
+
+
+def _diff_value(value: Any) -> Any:
+    # Stored TEXT/INTEGER values round-trip with SQLite affinity applied, so
+    # compare on a canonical form rather than the raw Python type.
+    return None if value is None else str(value)
+
+
+def diff_sync_rows(
+    conn,
+    table: str,
+    key: str,
+    columns: tuple[str, ...],
+    rows: list[dict[str, Any]],
+    existing_by_key: dict[str, dict[str, Any]],
+) -> dict[str, int]:
+    """Write only inserted, changed and removed rows; updated_at alone is not a change."""
+    compare_columns = [column for column in columns if column not in {key, 'updated_at'}]
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for row in rows:
+        row_key = str(row.get(key))
+        seen.add(row_key)
+        previous = existing_by_key.get(row_key)
+        if previous is None:
+            inserts.append(row)
+        elif any(_diff_value(row.get(column)) != _diff_value(previous.get(column)) for column in compare_columns):
+            updates.append(row)
+    removed = [(row_key,) for row_key in existing_by_key if row_key not in seen]
+
+    column_sql = ', '.join(columns)
+    if removed:
+        conn.executemany(f'DELETE FROM {table} WHERE {key} = ?', removed)
+    if inserts:
+        conn.executemany(
+            f'INSERT INTO {table} ({column_sql}) VALUES ({", ".join(f":{column}" for column in columns)})',
+            [{column: row.get(column) for column in columns} for row in inserts],
+        )
+    if updates:
+        set_sql = ', '.join(f'{column} = :{column}' for column in columns if column != key)
+        conn.executemany(
+            f'UPDATE {table} SET {set_sql} WHERE {key} = :{key}',
+            [{column: row.get(column) for column in columns} for row in updates],
+        )
+    return {
+        'inserted': len(inserts),
+        'updated': len(updates),
+        'deleted': len(removed),
+        'unchanged': len(rows) - len(inserts) - len(updates),
+    }
+
+
+def upsert_actor_and_movies(actors: list[dict[str, Any]], movies: list[dict[str, Any]]) -> dict[str, Any]:
     with get_conn() as conn:
-        existing_actor_rows = conn.execute(
-            '''
-            SELECT
-                actor_id,
-                role,
-                tmdb_person_id,
-                image_url,
-                plex_web_url,
-                movies_in_plex_count,
-                missing_movie_count,
-                missing_new_count,
-                missing_upcoming_count,
-                first_release_date,
-                next_upcoming_release_date,
-                missing_scan_at
-            FROM actors
-            '''
-        ).fetchall()
+        existing_actor_rows = conn.execute(f'SELECT {", ".join(ACTOR_COLUMNS)} FROM actors').fetchall()
         existing_by_actor_id = {str(row['actor_id']): dict(row) for row in existing_actor_rows}
         prepared_actors: list[dict[str, Any]] = []
         for actor in actors:
@@ -815,80 +1289,38 @@ def upsert_actor_and_movies(actors: list[dict[str, Any]], movies: list[dict[str,
                 existing['updated_at'] = incoming_updated_at
         prepared_actors = list(deduped_actors.values())
 
-        conn.execute('DELETE FROM actors')
-        conn.execute('DELETE FROM plex_movies')
-
-        conn.executemany(
-            '''
-            INSERT INTO actors(
-                actor_id,
-                name,
-                role,
-                appearances,
-                tmdb_person_id,
-                image_url,
-                plex_web_url,
-                movies_in_plex_count,
-                missing_movie_count,
-                missing_new_count,
-                missing_upcoming_count,
-                first_release_date,
-                next_upcoming_release_date,
-                missing_scan_at,
-                updated_at
-            )
-            VALUES(
-                :actor_id,
-                :name,
-                :role,
-                :appearances,
-                :tmdb_person_id,
-                :image_url,
-                :plex_web_url,
-                :movies_in_plex_count,
-                :missing_movie_count,
-                :missing_new_count,
-                :missing_upcoming_count,
-                :first_release_date,
-                :next_upcoming_release_date,
-                :missing_scan_at,
-                :updated_at
-            )
-            ''',
-            prepared_actors,
-        )
-        conn.executemany(
-            '''
-            INSERT INTO plex_movies(
-                plex_rating_key,
-                library_section_id,
-                title,
-                original_title,
-                year,
-                tmdb_id,
-                imdb_id,
-                normalized_title,
-                normalized_original_title,
-                plex_web_url,
-                updated_at
-            )
-            VALUES(
-                :plex_rating_key,
-                :library_section_id,
-                :title,
-                :original_title,
-                :year,
-                :tmdb_id,
-                :imdb_id,
-                :normalized_title,
-                :normalized_original_title,
-                :plex_web_url,
-                :updated_at
-            )
-            ''',
-            movies,
-        )
+        existing_movies_by_key = {
+            str(row['plex_rating_key']): dict(row)
+            for row in conn.execute(f'SELECT {", ".join(PLEX_MOVIE_COLUMNS)} FROM plex_movies').fetchall()
+        }
+        prepared_movies: dict[str, dict[str, Any]] = {}
+        for movie in movies:
+            prepared = dict(movie)
+            previous = existing_movies_by_key.get(str(prepared.get('plex_rating_key')))
+            # Keep ids filled in by the IMDb resolver while the IMDb id is unchanged.
+            if (
+                previous
+                and prepared.get('tmdb_id') is None
+                and previous.get('tmdb_id') is not None
+                and prepared.get('imdb_id')
+                and prepared.get('imdb_id') == previous.get('imdb_id')
+            ):
+                prepared['tmdb_id'] = previous.get('tmdb_id')
+            prepared_movies[str(prepared.get('plex_rating_key'))] = prepared
+
+        changes = {
+            'actors': diff_sync_rows(conn, 'actors', 'actor_id', ACTOR_COLUMNS, prepared_actors, existing_by_actor_id),
+            'movies': diff_sync_rows(
+                conn,
+                'plex_movies',
+                'plex_rating_key',
+                PLEX_MOVIE_COLUMNS,
+                list(prepared_movies.values()),
+                existing_movies_by_key,
+            ),
+        }
         conn.commit()
+    return changes
 
 
 def _build_actor_movies_payload(
@@ -949,7 +1381,7 @@ def _build_actor_movies_payload(
     results = []
     for movie in credits:
         release_date = str(movie.get('release_date') or '').strip() or None
-        has_valid_release_date = bool(release_date and _parse_iso_date(release_date))
+        has_valid_release_date = _iso_day_number(release_date) is not None
         normalized = normalize_title(movie['title'])
         normalized_original = normalize_title(movie.get('original_title')) if movie.get('original_title') else None
         # Avoid matching movies without a valid release date ("No date"),
@@ -1026,123 +1458,318 @@ def _build_actor_movies_payload(
     }
 
 
-def upsert_shows_and_episodes(shows: list[dict[str, Any]], episodes: list[dict[str, Any]]) -> None:
-    with get_conn() as conn:
-        existing_rows = conn.execute(
-            '''
-            SELECT
-                show_id,
-                tmdb_show_id,
-                has_missing_episodes,
-                missing_episode_count,
-                missing_new_count,
-                missing_old_count,
-                missing_upcoming_count,
-                missing_scan_at,
-                missing_upcoming_air_dates
-            FROM plex_shows
-            '''
-        ).fetchall()
-        existing_by_id = {str(row['show_id']): dict(row) for row in existing_rows}
+def refresh_show_episode_counts(conn, show_ids: list[str]) -> None:
+    """Recount plex_shows.episodes_in_plex for the given shows."""
+    params = [(show_id,) for show_id in show_ids]
+    conn.executemany(
+        '''
+        UPDATE plex_shows
+        SET episodes_in_plex = (SELECT COUNT(*) FROM plex_show_episodes e WHERE e.show_id = plex_shows.show_id)
+        WHERE show_id = ?
+        ''',
+        params,
+    )
 
-        prepared_shows: list[dict[str, Any]] = []
-        for show in shows:
-            prepared = dict(show)
-            previous = existing_by_id.get(str(prepared.get('show_id')))
-            if previous:
-                if not prepared.get('tmdb_show_id') and previous.get('tmdb_show_id'):
-                    prepared['tmdb_show_id'] = previous.get('tmdb_show_id')
-                prepared['has_missing_episodes'] = previous.get('has_missing_episodes')
-                prepared['missing_episode_count'] = previous.get('missing_episode_count')
-                prepared['missing_new_count'] = previous.get('missing_new_count')
-                prepared['missing_old_count'] = previous.get('missing_old_count')
-                prepared['missing_upcoming_count'] = previous.get('missing_upcoming_count')
-                prepared['missing_scan_at'] = previous.get('missing_scan_at')
-                prepared['missing_upcoming_air_dates'] = previous.get('missing_upcoming_air_dates')
-            else:
-                prepared['has_missing_episodes'] = None
-                prepared['missing_episode_count'] = None
-                prepared['missing_new_count'] = None
-                prepared['missing_old_count'] = None
-                prepared['missing_upcoming_count'] = None
-                prepared['missing_scan_at'] = None
-                prepared['missing_upcoming_air_dates'] = None
-            prepared_shows.append(prepared)
 
-        conn.execute('DELETE FROM plex_shows')
-        conn.execute('DELETE FROM plex_show_episodes')
-        conn.execute('DELETE FROM show_seasons_summary')
-        conn.executemany(
-            '''
-            INSERT INTO plex_shows(
-                show_id,
-                plex_rating_key,
-                title,
-                year,
-                tmdb_show_id,
-                normalized_title,
-                image_url,
-                plex_web_url,
-                has_missing_episodes,
-                missing_episode_count,
-                missing_new_count,
-                missing_old_count,
-                missing_upcoming_count,
-                missing_scan_at,
-                missing_upcoming_air_dates,
-                updated_at
-            )
-            VALUES(
-                :show_id,
-                :plex_rating_key,
-                :title,
-                :year,
-                :tmdb_show_id,
-                :normalized_title,
-                :image_url,
-                :plex_web_url,
-                :has_missing_episodes,
-                :missing_episode_count,
-                :missing_new_count,
-                :missing_old_count,
-                :missing_upcoming_count,
-                :missing_scan_at,
-                :missing_upcoming_air_dates,
-                :updated_at
-            )
-            ''',
-            prepared_shows,
-        )
-        conn.executemany(
-            '''
-            INSERT INTO plex_show_episodes(
-                plex_rating_key,
-                show_id,
-                season_number,
-                episode_number,
-                title,
-                normalized_title,
-                tmdb_episode_id,
-                season_plex_web_url,
-                plex_web_url,
-                updated_at
-            )
-            VALUES(
-                :plex_rating_key,
-                :show_id,
-                :season_number,
-                :episode_number,
-                :title,
-                :normalized_title,
-                :tmdb_episode_id,
-                :season_plex_web_url,
-                :plex_web_url,
-                :updated_at
+PLEX_SHOW_STAGING_COLUMNS = (
+    'show_id',
+    'plex_rating_key',
+    'title',
+    'year',
+    'tmdb_show_id',
+    'normalized_title',
+    'image_url',
+    'plex_web_url',
+    'updated_at',
+)
+
+LIBRARY_STAGING_LOCK = threading.Lock()
+
+# A scan without a TMDb id keeps the one already stored for the show.
+_STAGED_SHOW_TMDB_SQL = (
+    'CASE WHEN COALESCE(s.tmdb_show_id, 0) = 0 AND {live}.tmdb_show_id '
+    'THEN {live}.tmdb_show_id ELSE s.tmdb_show_id END'
+)
+
+# Shows whose show_seasons_summary inputs (TMDb id, Plex URL, episode set)
+# differ between the live tables and the staged snapshot.
+_STAGED_SUMMARY_CHANGES_SQL = f'''
+    SELECT show_id FROM (
+        SELECT s.show_id
+        FROM plex_shows_staging s
+        LEFT JOIN plex_shows p ON p.show_id = s.show_id
+        WHERE p.show_id IS NULL
+            OR p.plex_web_url IS NOT s.plex_web_url
+            OR p.tmdb_show_id IS NOT ({_STAGED_SHOW_TMDB_SQL.format(live='p')})
+        UNION
+        SELECT show_id FROM plex_shows
+        WHERE show_id NOT IN (SELECT show_id FROM plex_shows_staging)
+        UNION
+        SELECT s.show_id
+        FROM plex_show_episodes_staging s
+        LEFT JOIN plex_show_episodes p ON p.plex_rating_key = s.plex_rating_key
+        WHERE p.plex_rating_key IS NULL
+            OR p.show_id IS NOT s.show_id
+            OR p.season_number IS NOT s.season_number
+            OR p.episode_number IS NOT s.episode_number
+            OR p.season_plex_web_url IS NOT s.season_plex_web_url
+        UNION
+        SELECT p.show_id
+        FROM plex_show_episodes p
+        LEFT JOIN plex_show_episodes_staging s ON s.plex_rating_key = p.plex_rating_key
+        WHERE s.plex_rating_key IS NULL OR s.show_id IS NOT p.show_id
+    )
+    WHERE show_id IN (SELECT show_id FROM plex_shows UNION ALL SELECT show_id FROM plex_shows_staging)
+'''
+
+
+def _stage_rows(conn, table: str, columns: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+    conn.executemany(
+        f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) VALUES ({", ".join(f":{column}" for column in columns)})',
+        [{column: row.get(column) for column in columns} for row in rows],
+    )
+    conn.commit()
+    rows.clear()
+
+
+def sync_from_staging(
+    conn,
+    table: str,
+    staging_table: str,
+    key: str,
+    columns: tuple[str, ...],
+    update_values: dict[str, str] | None = None,
+) -> dict[str, int]:
+    """SQL counterpart of diff_sync_rows, reading the new rows from staging_table.
+
+    update_values overrides the expression used for a column when an existing
+    row is updated; it may refer to the staged row as s and the live row by
+    the table name.
+    """
+    values = {column: f's.{column}' for column in columns}
+    values.update(update_values or {})
+    set_sql = ', '.join(f'{column} = {values[column]}' for column in columns if column != key)
+    changed_sql = ' OR '.join(
+        f'{table}.{column} IS NOT {values[column]}' for column in columns if column not in {key, 'updated_at'}
+    )
+    column_sql = ', '.join(columns)
+    deleted = conn.execute(
+        f'DELETE FROM {table} WHERE {key} NOT IN (SELECT {key} FROM {staging_table})'
+    ).rowcount
+    updated = conn.execute(
+        f'''
+        UPDATE {table} SET {set_sql}
+        FROM {staging_table} AS s
+        WHERE {table}.{key} = s.{key} AND ({changed_sql})
+        '''
+    ).rowcount
+    inserted = conn.execute(
+        f'''
+        INSERT INTO {table} ({column_sql})
+        SELECT {", ".join(f"s.{column}" for column in columns)}
+        FROM {staging_table} AS s
+        WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE t.{key} = s.{key})
+        '''
+    ).rowcount
+    total = conn.execute(f'SELECT COUNT(*) FROM {staging_table}').fetchone()[0]
+    return {
+        'inserted': inserted,
+        'updated': updated,
+        'deleted': deleted,
+        'unchanged': total - inserted - updated,
+    }
+
+
+def stream_shows_and_episodes(
+    records: Iterable[tuple[str, dict[str, Any]]],
+    chunk_size: int = LIBRARY_WRITE_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Write a show library snapshot from ('show' | 'episode', row) records.
+
+    Rows are committed to the staging tables chunk_size at a time, so neither
+    the snapshot nor the write lock is held for the whole library. The live
+    tables switch to the new snapshot in one final transaction; if the
+    records fail part way, the live tables are left as they were.
+    """
+    staging = {
+        'show': ('plex_shows_staging', PLEX_SHOW_STAGING_COLUMNS),
+        'episode': ('plex_show_episodes_staging', PLEX_EPISODE_COLUMNS),
+    }
+    with LIBRARY_STAGING_LOCK, get_conn() as conn:
+        conn.execute('DELETE FROM plex_shows_staging')
+        conn.execute('DELETE FROM plex_show_episodes_staging')
+        conn.commit()
+        pending: dict[str, list[dict[str, Any]]] = {'show': [], 'episode': []}
+        for kind, record in records:
+            rows = pending[kind]
+            rows.append(record)
+            if len(rows) >= chunk_size:
+                _stage_rows(conn, *staging[kind], rows)
+        for kind, rows in pending.items():
+            if rows:
+                _stage_rows(conn, *staging[kind], rows)
+
+        changed_show_ids = [row[0] for row in conn.execute(_STAGED_SUMMARY_CHANGES_SQL).fetchall()]
+        changes = {
+            'shows': sync_from_staging(
+                conn,
+                'plex_shows',
+                'plex_shows_staging',
+                'show_id',
+                PLEX_SHOW_STAGING_COLUMNS,
+                {'tmdb_show_id': _STAGED_SHOW_TMDB_SQL.format(live='plex_shows')},
+            ),
+            'episodes': sync_from_staging(
+                conn,
+                'plex_show_episodes',
+                'plex_show_episodes_staging',
+                'plex_rating_key',
+                PLEX_EPISODE_COLUMNS,
+            ),
+        }
+        # Season summaries and episode counts only depend on which episodes
+        # Plex has, so leave shows whose episode set is unchanged alone.
+        conn.executemany('DELETE FROM show_seasons_summary WHERE show_id = ?', [(show_id,) for show_id in changed_show_ids])
+        conn.execute('DELETE FROM show_seasons_summary WHERE show_id NOT IN (SELECT show_id FROM plex_shows)')
+        refresh_show_episode_counts(conn, changed_show_ids)
+        conn.execute('DELETE FROM plex_shows_staging')
+        conn.execute('DELETE FROM plex_show_episodes_staging')
+        conn.commit()
+    changes['summaries_invalidated'] = len(changed_show_ids)
+    return changes
+
+
+def upsert_shows_and_episodes(shows: list[dict[str, Any]], episodes: list[dict[str, Any]]) -> dict[str, Any]:
+    return stream_shows_and_episodes(
+        chain((('show', show) for show in shows), (('episode', episode) for episode in episodes))
+    )
+
+
+def _report_stream_progress(
+    records: Iterable[tuple[str, dict[str, Any]]],
+    every: int = 500,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    # Raising here abandons the staged snapshot; the live tables are untouched.
+    counts = {'shows': 0, 'episodes': 0}
+    for kind, record in records:
+        counts[f'{kind}s'] += 1
+        if (counts['shows'] + counts['episodes']) % every == 0:
+            raise_if_job_cancelled()
+            job_progress(**counts)
+        yield kind, record
+    job_progress(**counts)
+
+
+def _synced_row_count(stats: dict[str, int]) -> int:
+    return stats['inserted'] + stats['updated'] + stats['unchanged']
+
+
+SCAN_LOG_LIMIT = 100
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
+
+def record_scan_history(
+    kind: str,
+    *,
+    server_name: str | None,
+    started: float,
+    bytes_received: int,
+    counts: dict[str, Any],
+    phases: dict[str, int],
+    error: str | None = None,
+    scanned_at: str | None = None,
+) -> dict[str, Any]:
+    entry = {
+        'kind': kind,
+        'scanned_at': scanned_at or datetime.now(UTC).isoformat(),
+        'server_name': server_name,
+        'duration_ms': _elapsed_ms(started),
+        'bytes_received': bytes_received,
+        'counts': counts,
+        'phases': phases,
+        'error': error,
+    }
+    with get_conn() as conn:
+        cursor = conn.execute(
+            '''
+            INSERT INTO scan_history (
+                kind,
+                scanned_at,
+                server_name,
+                duration_ms,
+                bytes_received,
+                counts_json,
+                phases_json,
+                error
             )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ''',
-            episodes,
+            (
+                kind,
+                entry['scanned_at'],
+                server_name,
+                entry['duration_ms'],
+                entry['bytes_received'],
+                json.dumps(counts),
+                json.dumps(phases),
+                error,
+            ),
         )
         conn.commit()
+    entry['id'] = cursor.lastrowid
+    return entry
+
+
+def _scan_history_item(row: Any) -> dict[str, Any]:
+    try:
+        counts = json.loads(row['counts_json'] or '{}')
+    except json.JSONDecodeError:
+        counts = {}
+    try:
+        phases = json.loads(row['phases_json'] or '{}')
+    except json.JSONDecodeError:
+        phases = {}
+    return {
+        'id': int(row['id']),
+        'kind': row['kind'],
+        'scanned_at': row['scanned_at'],
+        'server_name': row['server_name'],
+        'duration_ms': row['duration_ms'],
+        'bytes_received': row['bytes_received'],
+        'counts': counts if isinstance(counts, dict) else {},
+        'phases': phases if isinstance(phases, dict) else {},
+        'error': row['error'],
+    }
+
+
+def get_scan_logs(kind: str, limit: int = SCAN_LOG_LIMIT) -> list[dict[str, Any]]:
+    """Recent successful scans in the flat shape the profile page renders."""
+    with get_read_conn() as conn:
+        rows = conn.execute(
+            '''
+            SELECT id, kind, scanned_at, server_name, duration_ms, bytes_received, counts_json, phases_json, error
+            FROM scan_history
+            WHERE kind = ? AND error IS NULL
+            ORDER BY id DESC
+            LIMIT ?
+            ''',
+            (kind, limit),
+        ).fetchall()
+    logs: list[dict[str, Any]] = []
+    for row in rows:
+        item = _scan_history_item(row)
+        logs.append(
+            {
+                'scanned_at': item['scanned_at'],
+                **item['counts'],
+                'server_name': item['server_name'],
+                'duration_ms': item['duration_ms'],
+            }
+        )
+    return logs
 
 
 def get_session_payload() -> dict[str, Any]:
@@ -1192,6 +1819,17 @@ def _resolve_single_show_tmdb_from_plex(show_id: str) -> int | None:
 @app.on_event('startup')
 def startup() -> None:
     init_db()
+    warm_movie_genre_map()
+    start_plex_movie_id_resolver()
+    start_scan_scheduler()
+    resume_missing_scan_runs()
+
+
+@app.on_event('shutdown')
+def shutdown() -> None:
+    # Running scans stop at their next item; missing scans keep their
+    # checkpoint and resume at the next startup.
+    shutdown_jobs()
 
 
 @app.get('/api/health')
@@ -1264,6 +1902,7 @@ def reset_app_state() -> dict[str, bool]:
         conn.execute('DELETE FROM show_seasons_summary')
         conn.execute('DELETE FROM actor_missing_movies')
         conn.execute('DELETE FROM show_missing_episodes')
+        conn.execute('DELETE FROM release_events')
         conn.execute('DELETE FROM ignored_movies')
         conn.execute('DELETE FROM ignored_episodes')
         conn.execute('DELETE FROM tracked_cast')
@@ -1272,8 +1911,11 @@ def reset_app_state() -> dict[str, bool]:
         conn.execute('DELETE FROM tracked_seasons')
         conn.execute('DELETE FROM tracked_episodes')
         conn.execute('DELETE FROM untracked_episodes')
+        conn.execute('DELETE FROM effective_tracked_episodes')
+        conn.execute('DELETE FROM scan_history')
         conn.execute('DELETE FROM settings')
         conn.commit()
+    invalidate_settings_cache()
     return {'ok': True}
 
 
@@ -1287,6 +1929,7 @@ def reset_scan_state() -> dict[str, Any]:
         conn.execute('DELETE FROM show_seasons_summary')
         conn.execute('DELETE FROM actor_missing_movies')
         conn.execute('DELETE FROM show_missing_episodes')
+        conn.execute('DELETE FROM release_events')
         conn.execute('DELETE FROM ignored_movies')
         conn.execute('DELETE FROM ignored_episodes')
         conn.execute('DELETE FROM tracked_cast')
@@ -1295,11 +1938,97 @@ def reset_scan_state() -> dict[str, Any]:
         conn.execute('DELETE FROM tracked_seasons')
         conn.execute('DELETE FROM tracked_episodes')
         conn.execute('DELETE FROM untracked_episodes')
+        conn.execute('DELETE FROM effective_tracked_episodes')
+        conn.execute('DELETE FROM scan_history')
         conn.commit()
-    clear_settings(['scan_logs', 'show_scan_logs', 'last_scan_at', 'last_show_scan_at'])
+    clear_settings(['last_scan_at', 'last_show_scan_at'])
     return {'ok': True, 'scan_logs': [], 'show_scan_logs': []}
 
 
+@app.get('/api/scan/history')
+def scan_history(
+    kind: str = Query('all'),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+) -> dict[str, Any]:
+    normalized_kind = str(kind or 'all').strip().lower()
+    params: list[Any] = []
+    kind_filter_sql = ''
+    if normalized_kind != 'all':
+        kind_filter_sql = 'WHERE kind = ?'
+        params.append(normalized_kind)
+    with get_read_conn() as conn:
+        rows = conn.execute(
+            f'''
+            SELECT id, kind, scanned_at, server_name, duration_ms, bytes_received, counts_json, phases_json, error
+            FROM scan_history
+            {kind_filter_sql}
+            ORDER BY id DESC
+            LIMIT ? OFFSET ?
+            ''',
+            (*params, limit + 1, offset),
+        ).fetchall()
+    items = [_scan_history_item(row) for row in rows[:limit]]
+    return {
+        'ok': True,
+        'kind': normalized_kind,
+        'offset': offset,
+        'limit': limit,
+        'has_more': len(rows) > limit,
+        'items': items,
+    }
+
+
+@app.get('/api/maintenance')
+def maintenance_status() -> dict[str, Any]:
+    with get_read_conn() as conn:
+        stats = database_page_stats(conn)
+    return {
+        'ok': True,
+        **stats,
+        'incremental_vacuum': stats['auto_vacuum'] == AUTO_VACUUM_INCREMENTAL,
+        'running': MAINTENANCE_STATE['running'],
+        'pending_changes': MAINTENANCE_STATE['pending_changes'],
+        'last_maintenance': get_setting('last_maintenance'),
+    }
+
+
+@app.post('/api/maintenance/run')
+def run_maintenance(payload: MaintenancePayload | None = None) -> dict[str, Any]:
+    convert_auto_vacuum = bool(payload and payload.convert_auto_vacuum)
+    return {'ok': True, 'started': start_database_maintenance(force=True, convert_auto_vacuum=convert_auto_vacuum)}
+
+
+@app.get('/api/backup')
+def backup_status() -> dict[str, Any]:
+    backups = []
+    if BACKUP_DIR.is_dir():
+        for path in BACKUP_DIR.iterdir():
+            if not path.is_file() or path.name.startswith('.') or not path.name.endswith(('.db', '.db.gz')):
+                continue
+            stat = path.stat()
+            backups.append(
+                {
+                    'name': path.name,
+                    'bytes': stat.st_size,
+                    'modified_at': datetime.fromtimestamp(stat.st_mtime, UTC).isoformat(),
+                }
+            )
+    backups.sort(key=lambda item: item['modified_at'], reverse=True)
+    return {
+        'ok': True,
+        'running': BACKUP_STATE['running'],
+        'error': BACKUP_STATE['error'],
+        'last_backup': get_setting('last_backup'),
+        'backups': backups,
+    }
+
+
+@app.post('/api/backup')
+def run_backup(payload: BackupPayload | None = None) -> dict[str, Any]:
+    return {'ok': True, 'started': start_database_backup(compress=bool(payload and payload.compress))}
+
+
 @app.get('/api/profile')
 def profile() -> dict[str, Any]:
     auth_token, current_server = ensure_auth()
@@ -1338,8 +2067,8 @@ def profile() -> dict[str, Any]:
         'tmdb_has_local_override': bool(local_tmdb_key),
         'tmdb_api_key': active_tmdb_key if active_tmdb_key else '',
         'download_prefix': get_download_prefix_settings(),
-        'scan_logs': get_setting('scan_logs', []),
-        'show_scan_logs': get_setting('show_scan_logs', []),
+        'scan_logs': get_scan_logs('actors'),
+        'show_scan_logs': get_scan_logs('shows'),
     }
 
 
@@ -1358,21 +2087,82 @@ def clear_tmdb_key() -> dict[str, Any]:
     return {'ok': True, 'tmdb_configured': bool(TMDB_API_KEY), 'tmdb_source': 'env' if TMDB_API_KEY else 'none'}
 
 
+TRAILER_CACHE_TTL = timedelta(days=30)
+# Movies without a trailer often get one close to release, so re-check sooner.
+TRAILER_CACHE_MISS_TTL = timedelta(days=3)
+
+
+def _get_cached_trailer_urls(media_type: str, tmdb_ids: list[int]) -> dict[int, str | None]:
+    if not tmdb_ids:
+        return {}
+    now_dt = datetime.now(UTC)
+    cached: dict[int, str | None] = {}
+    with get_read_conn() as conn:
+        placeholders = ','.join('?' for _ in tmdb_ids)
+        rows = conn.execute(
+            f'''
+            SELECT tmdb_id, trailer_url, updated_at
+            FROM tmdb_trailer_cache
+            WHERE media_type = ? AND tmdb_id IN ({placeholders})
+            ''',
+            (media_type, *tmdb_ids),
+        ).fetchall()
+    for row in rows:
+        try:
+            updated_dt = datetime.fromisoformat(str(row['updated_at'] or ''))
+        except ValueError:
+            continue
+        trailer_url = str(row['trailer_url'] or '').strip() or None
+        ttl = TRAILER_CACHE_TTL if trailer_url else TRAILER_CACHE_MISS_TTL
+        if updated_dt < now_dt - ttl:
+            continue
+        cached[int(row['tmdb_id'])] = trailer_url
+    return cached
+
+
+def _store_trailer_urls(media_type: str, trailer_urls: dict[int, str | None]) -> None:
+    if not trailer_urls:
+        return
+    now_iso = datetime.now(UTC).isoformat()
+    with get_conn() as conn:
+        conn.executemany(
+            '''
+            INSERT INTO tmdb_trailer_cache (media_type, tmdb_id, trailer_url, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(media_type, tmdb_id) DO UPDATE SET
+                trailer_url = excluded.trailer_url,
+                updated_at = excluded.updated_at
+            ''',
+            [(media_type, tmdb_id, url, now_iso) for tmdb_id, url in trailer_urls.items()],
+        )
+        conn.commit()
+
+
+@app.get('/api/tmdb/stats')
+def tmdb_stats() -> dict[str, Any]:
+    return {'ok': True, **get_tmdb_request_stats()}
+
+
 @app.get('/api/tmdb/trailer')
 def get_tmdb_trailer(
     media_type: str = Query(..., alias='type'),
     tmdb_id: int = Query(..., ge=1),
 ) -> dict[str, Any]:
     normalized_type = str(media_type or '').strip().lower()
-    try:
-        if normalized_type == 'movie':
-            trailer_url = get_movie_trailer_url(int(tmdb_id))
-        elif normalized_type == 'show':
-            trailer_url = get_tv_show_trailer_url(int(tmdb_id))
-        else:
-            raise HTTPException(status_code=400, detail='type must be "movie" or "show"')
-    except TMDbNotConfiguredError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if normalized_type not in {'movie', 'show'}:
+        raise HTTPException(status_code=400, detail='type must be "movie" or "show"')
+    cached = _get_cached_trailer_urls(normalized_type, [int(tmdb_id)])
+    if int(tmdb_id) in cached:
+        trailer_url = cached[int(tmdb_id)]
+    else:
+        try:
+            if normalized_type == 'movie':
+                trailer_url = get_movie_trailer_url(int(tmdb_id))
+            else:
+                trailer_url = get_tv_show_trailer_url(int(tmdb_id))
+        except TMDbNotConfiguredError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        _store_trailer_urls(normalized_type, {int(tmdb_id): trailer_url})
 
     return {
         'ok': True,
@@ -1397,19 +2187,24 @@ def get_tmdb_movie_trailers(payload: TMDbMovieTrailersPayload) -> dict[str, Any]
         ids.append(value)
     if not ids:
         return {'ok': True, 'items': []}
-    try:
-        workers = min(6, len(ids))
-        results: dict[int, str | None] = {}
-        with ThreadPoolExecutor(max_workers=workers) as pool:
-            futures = {pool.submit(get_movie_trailer_url, movie_id): movie_id for movie_id in ids}
-            for future in as_completed(futures):
-                movie_id = futures[future]
-                try:
-                    results[movie_id] = future.result()
-                except Exception:
-                    results[movie_id] = None
-    except TMDbNotConfiguredError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    results = _get_cached_trailer_urls('movie', ids)
+    missing_ids = [movie_id for movie_id in ids if movie_id not in results]
+    if missing_ids:
+        fetched: dict[int, str | None] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(6, len(missing_ids))) as pool:
+                futures = {pool.submit(get_movie_trailer_url, movie_id): movie_id for movie_id in missing_ids}
+                for future in as_completed(futures):
+                    movie_id = futures[future]
+                    try:
+                        fetched[movie_id] = future.result()
+                    except Exception:
+                        # Failed lookups are not cached as "no trailer".
+                        results[movie_id] = None
+        except TMDbNotConfiguredError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        _store_trailer_urls('movie', fetched)
+        results.update(fetched)
 
     items = [
         {
@@ -1488,11 +2283,19 @@ def set_download_prefix(payload: DownloadPrefixPayload) -> dict[str, Any]:
 
 @app.post('/api/scan/actors')
 def scan_actors(payload: ScanCastPayload | None = None) -> dict[str, Any]:
+    with count_bytes_received() as transfer:
+        return _scan_actors(payload, transfer)
+
+
+def _scan_actors(payload: ScanCastPayload | None, transfer: dict[str, int]) -> dict[str, Any]:
     auth_token, server = ensure_auth()
     role_raw = (payload.role if payload else 'all').strip().lower()
     if role_raw not in {'all', 'actor', 'director', 'writer'}:
         raise HTTPException(status_code=400, detail='Invalid cast scan role')
     roles_to_scan = {'actor', 'director', 'writer'} if role_raw == 'all' else {role_raw}
+    started = time.perf_counter()
+    phases: dict[str, int] = {}
+    job_phase('resources')
 
     # Refresh connection list from Plex resources when possible.
     try:
@@ -1507,6 +2310,7 @@ def scan_actors(payload: ScanCastPayload | None = None) -> dict[str, Any]:
             set_setting('server', server)
     except Exception:
         pass
+    phases['resources_ms'] = _elapsed_ms(started)
 
     uris_to_try = candidate_server_uris(server)
     if not uris_to_try:
@@ -1515,6 +2319,8 @@ def scan_actors(payload: ScanCastPayload | None = None) -> dict[str, Any]:
             detail='No valid Plex connection URIs were found.',
         )
 
+    phase_started = time.perf_counter()
+    job_phase('fetch')
     last_error: Exception | None = None
     actors: list[dict[str, Any]] | None = None
     movies: list[dict[str, Any]] | None = None
@@ -1533,12 +2339,27 @@ def scan_actors(payload: ScanCastPayload | None = None) -> dict[str, Any]:
             last_error = exc
             continue
 
+    phases['fetch_ms'] = _elapsed_ms(phase_started)
+
     if actors is None or movies is None:
+        record_scan_history(
+            'actors',
+            server_name=server.get('name'),
+            started=started,
+            bytes_received=transfer['bytes_received'],
+            counts={'actors': 0, 'movies': 0},
+            phases=phases,
+            error=str(last_error) if last_error else 'Could not connect to Plex server',
+        )
         raise HTTPException(
             status_code=502,
             detail='Could not connect to Plex server via known endpoints.',
         ) from last_error
 
+    raise_if_job_cancelled()
+    phase_started = time.perf_counter()
+    job_phase('write')
+    job_progress(actors=len(actors), movies=len(movies))
     enriched_actors = [
         {
             **actor,
@@ -1547,33 +2368,43 @@ def scan_actors(payload: ScanCastPayload | None = None) -> dict[str, Any]:
         for actor in actors
     ]
 
-    upsert_actor_and_movies(enriched_actors, movies)
+    changes = upsert_actor_and_movies(enriched_actors, movies)
+    phases['write_ms'] = _elapsed_ms(phase_started)
+    record_bulk_write(_written_row_count(changes))
+    start_plex_movie_id_resolver()
     scanned_at = datetime.now(UTC).isoformat()
     set_setting('last_scan_at', scanned_at)
-    scan_logs = get_setting('scan_logs', [])
-    scan_logs.insert(
-        0,
-        {
-            'scanned_at': scanned_at,
-            'actors': len(enriched_actors),
-            'movies': len(movies),
-            'server_name': server.get('name'),
-        },
+    record_scan_history(
+        'actors',
+        scanned_at=scanned_at,
+        server_name=server.get('name'),
+        started=started,
+        bytes_received=transfer['bytes_received'],
+        counts={'actors': len(enriched_actors), 'movies': len(movies), 'changes': changes},
+        phases=phases,
     )
-    set_setting('scan_logs', scan_logs[:100])
 
     return {
         'ok': True,
         'actors': len(enriched_actors),
         'movies': len(movies),
+        'changes': changes,
         'last_scan_at': scanned_at,
-        'scan_logs': scan_logs[:100],
+        'scan_logs': get_scan_logs('actors'),
     }
 
 
 @app.post('/api/scan/shows')
 def scan_shows() -> dict[str, Any]:
+    with count_bytes_received() as transfer:
+        return _scan_shows(transfer)
+
+
+def _scan_shows(transfer: dict[str, int]) -> dict[str, Any]:
     auth_token, server = ensure_auth()
+    started = time.perf_counter()
+    phases: dict[str, int] = {}
+    job_phase('resources')
 
     try:
         resources = get_resources(auth_token)
@@ -1587,6 +2418,7 @@ def scan_shows() -> dict[str, Any]:
             set_setting('server', server)
     except Exception:
         pass
+    phases['resources_ms'] = _elapsed_ms(started)
 
     uris_to_try = candidate_server_uris(server)
     if not uris_to_try:
@@ -1595,15 +2427,20 @@ def scan_shows() -> dict[str, Any]:
             detail='No valid Plex connection URIs were found.',
         )
 
+    phase_started = time.perf_counter()
+    job_phase('stream')
     last_error: Exception | None = None
-    shows: list[dict[str, Any]] | None = None
-    episodes: list[dict[str, Any]] | None = None
+    changes: dict[str, Any] | None = None
     for uri in uris_to_try:
         try:
-            shows, episodes = fetch_show_library_snapshot(
-                uri,
-                server['token'],
-                server.get('client_identifier'),
+            changes = stream_shows_and_episodes(
+                _report_stream_progress(
+                    iter_show_library_snapshot(
+                        uri,
+                        server['token'],
+                        server.get('client_identifier'),
+                    )
+                )
             )
             server['uri'] = uri
             set_setting('server', server)
@@ -1612,159 +2449,361 @@ def scan_shows() -> dict[str, Any]:
             last_error = exc
             continue
 
-    if shows is None or episodes is None:
+    # Fetching and writing are interleaved, so they share one phase.
+    phases['stream_ms'] = _elapsed_ms(phase_started)
+
+    if changes is None:
+        record_scan_history(
+            'shows',
+            server_name=server.get('name'),
+            started=started,
+            bytes_received=transfer['bytes_received'],
+            counts={'shows': 0, 'episodes': 0},
+            phases=phases,
+            error=str(last_error) if last_error else 'Could not connect to Plex server',
+        )
         raise HTTPException(
             status_code=502,
             detail='Could not connect to Plex server via known endpoints.',
         ) from last_error
 
-    upsert_shows_and_episodes(shows, episodes)
+    record_bulk_write(_written_row_count(changes))
+    show_count = _synced_row_count(changes['shows'])
+    episode_count = _synced_row_count(changes['episodes'])
     scanned_at = datetime.now(UTC).isoformat()
     set_setting('last_show_scan_at', scanned_at)
-    show_scan_logs = get_setting('show_scan_logs', [])
-    show_scan_logs.insert(
-        0,
-        {
-            'scanned_at': scanned_at,
-            'shows': len(shows),
-            'episodes': len(episodes),
-            'server_name': server.get('name'),
-        },
+    record_scan_history(
+        'shows',
+        scanned_at=scanned_at,
+        server_name=server.get('name'),
+        started=started,
+        bytes_received=transfer['bytes_received'],
+        counts={'shows': show_count, 'episodes': episode_count, 'changes': changes},
+        phases=phases,
     )
-    set_setting('show_scan_logs', show_scan_logs[:100])
 
     return {
         'ok': True,
-        'shows': len(shows),
-        'episodes': len(episodes),
+        'shows': show_count,
+        'episodes': episode_count,
+        'changes': changes,
         'last_scan_at': scanned_at,
-        'show_scan_logs': show_scan_logs[:100],
+        'show_scan_logs': get_scan_logs('shows'),
     }
 
 
-@app.post('/api/actors/missing-scan')
-def scan_actors_for_missing(payload: ActorMissingScanPayload) -> dict[str, Any]:
-    actor_ids = [str(item).strip() for item in payload.actor_ids if str(item).strip()]
-    if not actor_ids:
-        raise HTTPException(status_code=400, detail='No actors selected for missing scan')
+# Freshness policy for missing scans (SQL over actors a / plex_shows s). Items
+# matching it are skipped unless the scan is forced: anything scanned within
+# MISSING_SCAN_FRESH_DAYS with nothing upcoming, and shows TMDb reports as
+# finished that had nothing missing while Plex still has as many episodes.
+_ACTOR_FRESH_SQL = 'a.missing_scan_at >= :fresh_cutoff AND COALESCE(a.missing_upcoming_count, 0) = 0'
+_SHOW_FRESH_SQL = '''
+    (s.missing_scan_at >= :fresh_cutoff AND COALESCE(s.missing_upcoming_count, 0) = 0)
+    OR (
+        s.tmdb_status IN ('Ended', 'Canceled')
+        AND s.missing_scan_at IS NOT NULL
+        AND COALESCE(s.missing_episode_count, 0) = 0
+        AND COALESCE(s.missing_upcoming_count, 0) = 0
+        AND s.missing_scan_episodes_in_plex = s.episodes_in_plex
+    )
+'''
 
-    unique_actor_ids = list(dict.fromkeys(actor_ids))
-    scanned_total = 0
-    failed_total = 0
-    missing_total = 0
-    now_iso = datetime.now(UTC).isoformat()
-    updates: list[tuple[Any, ...]] = []
-    results: list[dict[str, Any]] = []
-    actor_missing_rows_by_actor: dict[str, list[tuple[Any, ...]]] = {}
-    actor_keep_tmdb_ids_by_actor: dict[str, set[int]] = {}
-    with get_conn() as preload_conn:
-        plex_match_context = _build_plex_movie_match_context(preload_conn)
-        tracked_movie_ids = _get_tracked_movie_ids(preload_conn)
-
-    for actor_id in unique_actor_ids:
-        scanned_total += 1
-        try:
+
+def _missing_scan_fresh_cutoff() -> str:
+    return (datetime.now(UTC) - timedelta(days=MISSING_SCAN_FRESH_DAYS)).isoformat()
+
+
+def _fresh_missing_scan_ids(conn, table: str, id_column: str, fresh_sql: str, item_ids: list[str]) -> set[str]:
+    alias = 'a' if table == 'actors' else 's'
+    placeholders = ','.join(f':id{index}' for index in range(len(item_ids)))
+    rows = conn.execute(
+        f'SELECT {alias}.{id_column} FROM {table} {alias} WHERE {alias}.{id_column} IN ({placeholders}) AND ({fresh_sql})',
+        {'fresh_cutoff': _missing_scan_fresh_cutoff(), **{f'id{index}': item_id for index, item_id in enumerate(item_ids)}},
+    ).fetchall()
+    return {str(row[0]) for row in rows}
+
+
+# Checkpoints for missing scans larger than one write batch: the ids of
+# finished items are committed with each batch. A run's rows are removed once
+# the scan completes, fails or the user cancels it; a scan stopped by shutdown
+# (or a killed process) keeps them and is resumed as a job at the next startup.
+MISSING_SCAN_ACTIVE_RUNS: set[int] = set()
+MISSING_SCAN_RUNS_LOCK = threading.Lock()
+
+
+def _open_missing_scan_run(kind: str, params: dict[str, Any]) -> tuple[int, set[str]]:
+    """Return (run_id, ids already written) for an interrupted identical scan, or a new run."""
+    params_json = json.dumps(params, sort_keys=True)
+    with MISSING_SCAN_RUNS_LOCK, get_conn() as conn:
+        run_ids = [
+            int(row['run_id'])
+            for row in conn.execute(
+                'SELECT run_id FROM missing_scan_runs WHERE kind = ? AND params_json = ? ORDER BY run_id',
+                (kind, params_json),
+            ).fetchall()
+        ]
+        run_id = next((candidate for candidate in run_ids if candidate not in MISSING_SCAN_ACTIVE_RUNS), None)
+        if run_id is None:
+            now_iso = datetime.now(UTC).isoformat()
+            cursor = conn.execute(
+                'INSERT INTO missing_scan_runs (kind, params_json, started_at, updated_at) VALUES (?, ?, ?, ?)',
+                (kind, params_json, now_iso, now_iso),
+            )
+            conn.commit()
+            run_id = int(cursor.lastrowid)
+            processed_ids: set[str] = set()
+        else:
+            processed_ids = {
+                str(row['item_id'])
+                for row in conn.execute(
+                    'SELECT item_id FROM missing_scan_run_items WHERE run_id = ?',
+                    (run_id,),
+                ).fetchall()
+            }
+        MISSING_SCAN_ACTIVE_RUNS.add(run_id)
+    return run_id, processed_ids
+
+
+def _close_missing_scan_run(run_id: int, keep: bool) -> None:
+    with MISSING_SCAN_RUNS_LOCK:
+        if not keep:
             with get_conn() as conn:
-                actor_payload = _build_actor_movies_payload(
-                    actor_id,
-                    False,
-                    False,
-                    False,
-                    False,
-                    conn=conn,
-                    plex_match_context=plex_match_context,
-                    tracked_movie_ids=tracked_movie_ids,
-                )
-            items = actor_payload.get('items', [])
-            movies_in_plex_count = 0
-            missing_new_count = 0
-            missing_old_count = 0
-            missing_upcoming_count = 0
-            missing_old_tmdb_ids: set[int] = set()
-            actor_missing_rows: list[tuple[Any, ...]] = []
-            release_dates: list[str] = []
-            upcoming_dates: list[str] = []
-
-            for item in items:
-                if item.get('in_plex'):
-                    movies_in_plex_count += 1
-                status = item.get('status')
-                release_date = str(item.get('release_date') or '').strip() or None
-                if release_date:
-                    release_dates.append(release_date)
-                if status == 'new':
-                    missing_new_count += 1
-                elif status == 'missing':
-                    missing_old_count += 1
-                    if item.get('tmdb_id') is not None:
-                        try:
-                            missing_old_tmdb_ids.add(int(item['tmdb_id']))
-                        except (TypeError, ValueError):
-                            pass
-                elif status == 'ignored':
-                    if item.get('tmdb_id') is not None:
-                        try:
-                            missing_old_tmdb_ids.add(int(item['tmdb_id']))
-                        except (TypeError, ValueError):
-                            pass
-                elif status == 'upcoming':
-                    missing_upcoming_count += 1
-                    if release_date:
-                        upcoming_dates.append(release_date)
-                if (
-                    not item.get('in_plex')
-                    and release_date
-                    and item.get('tmdb_id') is not None
-                    and status in {'missing', 'new', 'upcoming', 'ignored'}
-                ):
+                conn.execute('DELETE FROM missing_scan_run_items WHERE run_id = ?', (run_id,))
+                conn.execute('DELETE FROM missing_scan_runs WHERE run_id = ?', (run_id,))
+                conn.commit()
+        MISSING_SCAN_ACTIVE_RUNS.discard(run_id)
+
+
+def _commit_missing_scan_batch(
+    write_batch: Callable[[Any, list[dict[str, Any]]], None],
+    writes: list[dict[str, Any]],
+    run_id: int | None,
+    finished_ids: list[str],
+) -> int:
+    with get_conn() as conn:
+        changes_before = conn.total_changes
+        if writes:
+            write_batch(conn, writes)
+        written_rows = conn.total_changes - changes_before
+        if run_id is not None:
+            conn.executemany(
+                'INSERT OR IGNORE INTO missing_scan_run_items (run_id, item_id) VALUES (?, ?)',
+                [(run_id, item_id) for item_id in finished_ids],
+            )
+            conn.execute(
+                'UPDATE missing_scan_runs SET updated_at = ? WHERE run_id = ?',
+                (datetime.now(UTC).isoformat(), run_id),
+            )
+        conn.commit()
+    return written_rows
+
+
+def _run_missing_scan_pool(
+    kind: str,
+    params: dict[str, Any],
+    item_ids: list[str],
+    scan_item: Callable[[str], dict[str, Any]],
+    write_batch: Callable[[Any, list[dict[str, Any]]], None],
+) -> dict[str, Any]:
+    """Scan item_ids on a bounded worker pool and write finished items in groups.
+
+    scan_item runs on the workers and returns an outcome dict with the API
+    result, its counter flags and the rows to write (or None). Outcomes are
+    written MISSING_SCAN_WRITE_BATCH at a time from this thread, so only the
+    current batch's rows are held in memory. Scans longer than one batch also
+    checkpoint their finished ids and skip them when the same scan (kind and
+    params) is started again after a shutdown. Their summary carries only the
+    totals and 'items' is None; callers re-read the rows they changed.
+    """
+    run_id: int | None = None
+    processed_ids: set[str] = set()
+    completed = False
+    if tmdb_requests_counted():
+        # Scheduled scans run inside a TMDb request counter; the flag makes a
+        # resumed run keep charging the scheduler's budget.
+        params = {**params, 'tmdb_budget': True}
+    if len(item_ids) > MISSING_SCAN_WRITE_BATCH:
+        run_id, processed_ids = _open_missing_scan_run(kind, params)
+    try:
+        remaining_ids = [item_id for item_id in item_ids if item_id not in processed_ids]
+        workers = max(1, min(MISSING_SCAN_WORKERS, len(remaining_ids)))
+        window = workers * 2
+        results: dict[str, dict[str, Any]] = {}
+        done_count = 0
+        totals = {'scanned': 0, 'refreshed': 0, 'failed': 0, 'missing': 0}
+        pending_writes: list[dict[str, Any]] = []
+        pending_ids: list[str] = []
+        written_rows = 0
+        fatal: TMDbNotConfiguredError | None = None
+        remaining = iter(remaining_ids)
+        in_flight: dict[Future, str] = {}
+
+        job_phase('scan', total=len(item_ids))
+        if processed_ids:
+            job_progress(len(item_ids) - len(remaining_ids), resumed=len(item_ids) - len(remaining_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='missing-scan') as pool:
+            while True:
+                if fatal is None and not job_cancel_requested():
+                    for item_id in islice(remaining, window - len(in_flight)):
+                        in_flight[pool.submit(copy_context().run, scan_item, item_id)] = item_id
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item_id = in_flight.pop(future)
                     try:
-                        tmdb_movie_id = int(item['tmdb_id'])
+                        outcome = future.result()
+                    except TMDbNotConfiguredError as exc:
+                        fatal = fatal or exc
+                        continue
+                    done_count += 1
+                    if run_id is None:
+                        results[item_id] = outcome['result']
+                    pending_ids.append(item_id)
+                    for key in totals:
+                        if outcome.get(key):
+                            totals[key] += 1
+                    if outcome.get('write') is not None:
+                        pending_writes.append(outcome['write'])
+                if len(pending_ids) >= MISSING_SCAN_WRITE_BATCH:
+                    written_rows += _commit_missing_scan_batch(write_batch, pending_writes, run_id, pending_ids)
+                    pending_writes = []
+                    pending_ids = []
+                job_progress(len(item_ids) - len(remaining_ids) + done_count, **totals)
+
+        completed = done_count == len(remaining_ids)
+        if pending_ids:
+            job_phase('write')
+            written_rows += _commit_missing_scan_batch(write_batch, pending_writes, run_id, pending_ids)
+        if written_rows:
+            record_bulk_write(written_rows)
+        if fatal is not None:
+            raise HTTPException(status_code=400, detail=str(fatal)) from fatal
+    finally:
+        if run_id is not None:
+            # Only a shutdown pauses a run; completion, a user cancel or an
+            # error ends it.
+            _close_missing_scan_run(run_id, keep=shutdown_requested() and not completed)
+
+    return {
+        **totals,
+        'resumed': len(item_ids) - len(remaining_ids),
+        'items': None if run_id is not None else [
+            results[item_id] for item_id in remaining_ids if item_id in results
+        ],
+    }
+
+
+def _scan_actor_missing_item(
+    actor_id: str,
+    plex_match_context: dict[str, Any],
+    tracked_movie_ids: set[int],
+    now_iso: str,
+) -> dict[str, Any]:
+    try:
+        with get_conn() as conn:
+            actor_payload = _build_actor_movies_payload(
+                actor_id,
+                False,
+                False,
+                False,
+                False,
+                conn=conn,
+                plex_match_context=plex_match_context,
+                tracked_movie_ids=tracked_movie_ids,
+            )
+        items = actor_payload.get('items', [])
+        movies_in_plex_count = 0
+        missing_new_count = 0
+        missing_old_count = 0
+        missing_upcoming_count = 0
+        missing_old_tmdb_ids: set[int] = set()
+        actor_missing_rows: list[tuple[Any, ...]] = []
+        release_dates: list[str] = []
+        upcoming_dates: list[str] = []
+
+        for item in items:
+            if item.get('in_plex'):
+                movies_in_plex_count += 1
+            status = item.get('status')
+            release_date = str(item.get('release_date') or '').strip() or None
+            if release_date:
+                release_dates.append(release_date)
+            if status == 'new':
+                missing_new_count += 1
+            elif status == 'missing':
+                missing_old_count += 1
+                if item.get('tmdb_id') is not None:
+                    try:
+                        missing_old_tmdb_ids.add(int(item['tmdb_id']))
                     except (TypeError, ValueError):
-                        tmdb_movie_id = 0
-                    if tmdb_movie_id > 0:
-                        actor_missing_rows.append(
-                            (
-                                actor_id,
-                                tmdb_movie_id,
-                                str(item.get('title') or 'Untitled'),
-                                release_date,
-                                str(item.get('poster_url') or '').strip() or None,
-                                status,
-                                1 if status == 'ignored' else 0,
-                                now_iso,
-                            )
+                        pass
+            elif status == 'ignored':
+                if item.get('tmdb_id') is not None:
+                    try:
+                        missing_old_tmdb_ids.add(int(item['tmdb_id']))
+                    except (TypeError, ValueError):
+                        pass
+            elif status == 'upcoming':
+                missing_upcoming_count += 1
+                if release_date:
+                    upcoming_dates.append(release_date)
+            if (
+                not item.get('in_plex')
+                and release_date
+                and item.get('tmdb_id') is not None
+                and status in {'missing', 'new', 'upcoming', 'ignored'}
+            ):
+                try:
+                    tmdb_movie_id = int(item['tmdb_id'])
+                except (TypeError, ValueError):
+                    tmdb_movie_id = 0
+                if tmdb_movie_id > 0:
+                    actor_missing_rows.append(
+                        (
+                            actor_id,
+                            tmdb_movie_id,
+                            str(item.get('title') or 'Untitled'),
+                            release_date,
+                            str(item.get('poster_url') or '').strip() or None,
+                            status,
+                            1 if status == 'ignored' else 0,
+                            now_iso,
                         )
+                    )
 
-            # Defensive dedupe: TMDb credits can occasionally contain repeated
-            # movie ids for a person, while actor_missing_movies enforces
-            # UNIQUE(actor_id, tmdb_movie_id).
-            if actor_missing_rows:
-                deduped_rows: dict[int, tuple[Any, ...]] = {}
-                for row in actor_missing_rows:
-                    movie_id = int(row[1])
-                    if movie_id not in deduped_rows:
-                        deduped_rows[movie_id] = row
-                        continue
-                    existing = deduped_rows[movie_id]
-                    # Prefer ignored over non-ignored if both exist.
-                    existing_ignored = int(existing[6]) == 1
-                    incoming_ignored = int(row[6]) == 1
-                    if incoming_ignored and not existing_ignored:
-                        deduped_rows[movie_id] = row
-                actor_missing_rows = list(deduped_rows.values())
-
-            actor_keep_tmdb_ids_by_actor[actor_id] = missing_old_tmdb_ids
-            actor_missing_rows_by_actor[actor_id] = actor_missing_rows
-
-            missing_movie_count = missing_new_count + missing_old_count
-            first_release_date = min(release_dates) if release_dates else None
-            next_upcoming_release_date = min(upcoming_dates) if upcoming_dates else None
-            has_missing_movies = (missing_movie_count + missing_upcoming_count) > 0
-            if has_missing_movies:
-                missing_total += 1
-
-            updates.append(
-                (
+        # Defensive dedupe: TMDb credits can occasionally contain repeated
+        # movie ids for a person, while actor_missing_movies enforces
+        # UNIQUE(actor_id, tmdb_movie_id).
+        if actor_missing_rows:
+            deduped_rows: dict[int, tuple[Any, ...]] = {}
+            for row in actor_missing_rows:
+                movie_id = int(row[1])
+                if movie_id not in deduped_rows:
+                    deduped_rows[movie_id] = row
+                    continue
+                existing = deduped_rows[movie_id]
+                # Prefer ignored over non-ignored if both exist.
+                existing_ignored = int(existing[6]) == 1
+                incoming_ignored = int(row[6]) == 1
+                if incoming_ignored and not existing_ignored:
+                    deduped_rows[movie_id] = row
+            actor_missing_rows = list(deduped_rows.values())
+
+        missing_movie_count = missing_new_count + missing_old_count
+        first_release_date = min(release_dates) if release_dates else None
+        next_upcoming_release_date = min(upcoming_dates) if upcoming_dates else None
+        has_missing_movies = (missing_movie_count + missing_upcoming_count) > 0
+        return {
+            'scanned': True,
+            'refreshed': True,
+            'failed': False,
+            'missing': has_missing_movies,
+            'write': {
+                'actor_id': actor_id,
+                'keep_ids': missing_old_tmdb_ids,
+                'missing_rows': actor_missing_rows,
+                'update': (
                     movies_in_plex_count,
                     missing_movie_count,
                     missing_new_count,
@@ -1774,92 +2813,412 @@ def scan_actors_for_missing(payload: ActorMissingScanPayload) -> dict[str, Any]:
                     now_iso,
                     now_iso,
                     actor_id,
-                )
-            )
-            results.append(
-                {
-                    'actor_id': actor_id,
-                    'movies_in_plex_count': movies_in_plex_count,
-                    'missing_movie_count': missing_movie_count,
-                    'missing_new_count': missing_new_count,
-                    'missing_upcoming_count': missing_upcoming_count,
-                    'first_release_date': first_release_date,
-                    'next_upcoming_release_date': next_upcoming_release_date,
-                    'missing_scan_at': now_iso,
-                    'has_missing_movies': has_missing_movies,
-                    'error': None,
-                }
-            )
-        except TMDbNotConfiguredError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        except Exception:  # noqa: BLE001
-            logger.exception('Missing-movie scan failed for actor_id=%s', actor_id)
-            failed_total += 1
-            results.append(
-                {
-                    'actor_id': actor_id,
-                    'movies_in_plex_count': None,
-                    'missing_movie_count': None,
-                    'missing_new_count': None,
-                    'missing_upcoming_count': None,
-                    'first_release_date': None,
-                    'next_upcoming_release_date': None,
-                    'missing_scan_at': None,
-                    'has_missing_movies': None,
-                    'error': 'Unable to scan this actor right now.',
-                }
-            )
+                ),
+            },
+            'result': {
+                'actor_id': actor_id,
+                'movies_in_plex_count': movies_in_plex_count,
+                'missing_movie_count': missing_movie_count,
+                'missing_new_count': missing_new_count,
+                'missing_upcoming_count': missing_upcoming_count,
+                'first_release_date': first_release_date,
+                'next_upcoming_release_date': next_upcoming_release_date,
+                'missing_scan_at': now_iso,
+                'has_missing_movies': has_missing_movies,
+                'error': None,
+            },
+        }
+    except TMDbNotConfiguredError:
+        raise
+    except Exception:  # noqa: BLE001
+        logger.exception('Missing-movie scan failed for actor_id=%s', actor_id)
+        return {
+            'scanned': True,
+            'failed': True,
+            'missing': False,
+            'write': None,
+            'result': {
+                'actor_id': actor_id,
+                'movies_in_plex_count': None,
+                'missing_movie_count': None,
+                'missing_new_count': None,
+                'missing_upcoming_count': None,
+                'first_release_date': None,
+                'next_upcoming_release_date': None,
+                'missing_scan_at': None,
+                'has_missing_movies': None,
+                'error': 'Unable to scan this actor right now.',
+            },
+        }
 
-    if updates:
-        with get_conn() as conn:
-            for actor_id, keep_ids in actor_keep_tmdb_ids_by_actor.items():
-                _cleanup_ignored_movie_ids(conn, actor_id, keep_ids)
-            for actor_id, rows in actor_missing_rows_by_actor.items():
-                conn.execute('DELETE FROM actor_missing_movies WHERE actor_id = ?', (actor_id,))
-                if rows:
-                    conn.executemany(
-                        '''
-                        INSERT INTO actor_missing_movies (
-                            actor_id,
-                            tmdb_movie_id,
-                            title,
-                            release_date,
-                            poster_url,
-                            status,
-                            ignored,
-                            updated_at
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        ''',
-                        rows,
-                    )
+
+def _write_actor_missing_batch(conn, batch: list[dict[str, Any]]) -> None:
+    for entry in batch:
+        _cleanup_ignored_movie_ids(conn, entry['actor_id'], entry['keep_ids'])
+    changed_movie_ids: set[int] = set()
+    for entry in batch:
+        actor_id = entry['actor_id']
+        rows = entry['missing_rows']
+        changed_movie_ids.update(
+            int(row['tmdb_movie_id'])
+            for row in conn.execute(
+                'SELECT tmdb_movie_id FROM actor_missing_movies WHERE actor_id = ?',
+                (actor_id,),
+            ).fetchall()
+        )
+        changed_movie_ids.update(int(row[1]) for row in rows)
+        conn.execute('DELETE FROM actor_missing_movies WHERE actor_id = ?', (actor_id,))
+        if rows:
             conn.executemany(
                 '''
-                UPDATE actors
-                SET
-                    movies_in_plex_count = ?,
-                    missing_movie_count = ?,
-                    missing_new_count = ?,
-                    missing_upcoming_count = ?,
-                    first_release_date = ?,
-                    next_upcoming_release_date = ?,
-                    missing_scan_at = ?,
-                    updated_at = ?
-                WHERE actor_id = ?
+                INSERT INTO actor_missing_movies (
+                    actor_id,
+                    tmdb_movie_id,
+                    title,
+                    release_date,
+                    poster_url,
+                    status,
+                    ignored,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 ''',
-                updates,
+                rows,
             )
-            conn.commit()
+    conn.executemany(
+        '''
+        UPDATE actors
+        SET
+            movies_in_plex_count = ?,
+            missing_movie_count = ?,
+            missing_new_count = ?,
+            missing_upcoming_count = ?,
+            first_release_date = ?,
+            next_upcoming_release_date = ?,
+            missing_scan_at = ?,
+            updated_at = ?
+        WHERE actor_id = ?
+        ''',
+        [entry['update'] for entry in batch],
+    )
+    refresh_movie_release_events(conn, changed_movie_ids)
 
+
+@app.post('/api/actors/missing-scan')
+def scan_actors_for_missing(payload: ActorMissingScanPayload) -> dict[str, Any]:
+    actor_ids = [str(item).strip() for item in payload.actor_ids if str(item).strip()]
+    if not actor_ids:
+        raise HTTPException(status_code=400, detail='No actors selected for missing scan')
+
+    unique_actor_ids = list(dict.fromkeys(actor_ids))
+    now_iso = datetime.now(UTC).isoformat()
+    # One match context for the whole batch; workers only read from it.
+    with get_read_conn() as preload_conn:
+        fresh_ids = set() if payload.force else _fresh_missing_scan_ids(
+            preload_conn, 'actors', 'actor_id', _ACTOR_FRESH_SQL, unique_actor_ids
+        )
+        refresh_ids = [actor_id for actor_id in unique_actor_ids if actor_id not in fresh_ids]
+        plex_match_context = _build_plex_movie_match_context(preload_conn) if refresh_ids else {}
+        tracked_movie_ids = _get_tracked_movie_ids(preload_conn) if refresh_ids else set()
+
+    job_progress(skipped=len(fresh_ids))
+    summary = _run_missing_scan_pool(
+        'actors_missing_scan',
+        payload.model_dump(),
+        refresh_ids,
+        lambda actor_id: _scan_actor_missing_item(actor_id, plex_match_context, tracked_movie_ids, now_iso),
+        _write_actor_missing_batch,
+    )
     return {
         'ok': True,
-        'scanned': scanned_total,
-        'failed': failed_total,
-        'missing_actors': missing_total,
-        'items': results,
+        'scanned': summary['scanned'],
+        'skipped': len(fresh_ids),
+        'resumed': summary['resumed'],
+        'refreshed': summary['refreshed'],
+        'failed': summary['failed'],
+        'missing_actors': summary['missing'],
+        'items': summary['items'],
     }
 
 
+def _failed_show_missing_result(show_id: str, error: str) -> dict[str, Any]:
+    return {
+        'show_id': show_id,
+        'has_missing_episodes': None,
+        'missing_episode_count': None,
+        'missing_new_count': None,
+        'missing_old_count': None,
+        'missing_upcoming_count': None,
+        'missing_scan_at': None,
+        'missing_upcoming_air_dates': [],
+        'error': error,
+    }
+
+
+def _scan_show_missing_item(show_id: str, context: dict[str, Any], now_iso: str) -> dict[str, Any]:
+    show = context['shows_by_id'].get(show_id)
+    if not show:
+        return {
+            'scanned': False,
+            'failed': True,
+            'missing': False,
+            'write': None,
+            'result': _failed_show_missing_result(show_id, 'Show not found in local cache'),
+        }
+    try:
+        tmdb_id_update: tuple[int, str, str] | None = None
+        tmdb_show_id = show.get('tmdb_show_id')
+        if not tmdb_show_id:
+            found = search_tv_show(show.get('title') or '', show.get('year'))
+            if not found:
+                plex_tmdb_id = _resolve_single_show_tmdb_from_plex(show_id)
+                if plex_tmdb_id is None:
+                    return {
+                        'scanned': True,
+                        'failed': True,
+                        'missing': False,
+                        'write': None,
+                        'result': _failed_show_missing_result(show_id, 'TMDb match not found'),
+                    }
+                tmdb_show_id = int(plex_tmdb_id)
+            else:
+                tmdb_show_id = int(found['id'])
+            tmdb_id_update = (tmdb_show_id, now_iso, show_id)
+
+        # Plex episodes and ignore rows are read per show so a whole-library
+        # scan only holds the shows currently in flight.
+        with get_read_conn() as conn:
+            plex_episode_rows = conn.execute(
+                '''
+                SELECT show_id, season_number, episode_number, season_plex_web_url
+                FROM plex_show_episodes
+                WHERE show_id = ?
+                ''',
+                (show_id,),
+            ).fetchall()
+            ignored_episode_keys = _get_ignored_episode_keys(conn, show_id)
+        plex_episode_set = {
+            (int(row['season_number'] or 0), int(row['episode_number'] or 0))
+            for row in plex_episode_rows
+            if int(row['season_number'] or 0) > 0 and int(row['episode_number'] or 0) > 0
+        }
+
+        tmdb_episode_set: set[tuple[int, int]] = set()
+        tmdb_episode_air_dates: dict[tuple[int, int], str] = {}
+        tmdb_episode_titles: dict[tuple[int, int], str] = {}
+        show_details = get_tv_show_details(int(tmdb_show_id))
+        seasons = show_details['seasons']
+        season_numbers = [
+            int(season.get('season_number') or 0)
+            for season in seasons
+            if int(season.get('season_number') or 0) > 0
+        ]
+        season_episode_pairs: list[tuple[int, list[dict[str, Any]]]] = []
+        if season_numbers:
+            season_workers = min(4, len(season_numbers))
+            with ThreadPoolExecutor(max_workers=season_workers) as pool:
+                futures = {
+                    pool.submit(copy_context().run, get_tv_season_episodes, int(tmdb_show_id), season_number): season_number
+                    for season_number in season_numbers
+                }
+                for future in as_completed(futures):
+                    season_episode_pairs.append((futures[future], future.result()))
+        season_episodes_by_number = {
+            season_number: episodes
+            for season_number, episodes in season_episode_pairs
+        }
+        for season_number, episodes in season_episode_pairs:
+            for episode in episodes:
+                episode_number = int(episode.get('episode_number') or 0)
+                if episode_number <= 0:
+                    continue
+                key = (season_number, episode_number)
+                tmdb_episode_set.add(key)
+                tmdb_episode_titles[key] = str(episode.get('title') or '').strip() or f'Episode {episode_number}'
+                air_date = str(episode.get('air_date') or '').strip()
+                if air_date:
+                    tmdb_episode_air_dates[key] = air_date
+
+        missing_episode_keys = tmdb_episode_set - plex_episode_set
+        missing_new_count = 0
+        missing_old_count = 0
+        missing_upcoming_count = 0
+        show_missing_rows: list[tuple[Any, ...]] = []
+        now_dt = datetime.now(UTC)
+        for key in missing_episode_keys:
+            season_no, episode_no = key
+            air_date = tmdb_episode_air_dates.get(key)
+            status = _classify_missing_air_date(air_date, now_dt=now_dt)
+            if status == 'missing' and key in ignored_episode_keys:
+                status = 'ignored'
+            if status == 'new':
+                missing_new_count += 1
+            elif status == 'upcoming':
+                missing_upcoming_count += 1
+            elif status == 'missing':
+                missing_old_count += 1
+            # Episodes without air_date are ignored for status/counters.
+            if air_date and status in {'missing', 'new', 'upcoming'}:
+                show_missing_rows.append(
+                    (
+                        show_id,
+                        season_no,
+                        episode_no,
+                        tmdb_episode_titles.get(key) or f'Episode {episode_no}',
+                        air_date,
+                        status,
+                        0,
+                        now_iso,
+                    )
+                )
+        # "Missing" counter excludes upcoming episodes by design.
+        missing_episode_count = missing_new_count + missing_old_count
+        has_missing = 1 if (missing_episode_count + missing_upcoming_count) > 0 else 0
+        upcoming_air_dates = sorted(
+            {
+                tmdb_episode_air_dates[key]
+                for key in missing_episode_keys
+                if key in tmdb_episode_air_dates and key not in ignored_episode_keys
+            }
+        )
+        season_rows = _build_show_season_summary_rows(
+            show_id=show_id,
+            show_plex_url=show.get('plex_web_url'),
+            plex_rows=plex_episode_rows,
+            ignored_episode_keys=ignored_episode_keys,
+            seasons=seasons,
+            season_episodes_by_number=season_episodes_by_number,
+            now_dt=now_dt,
+            now_iso=now_iso,
+        )
+        return {
+            'scanned': True,
+            'refreshed': True,
+            'failed': False,
+            'missing': bool(has_missing),
+            'write': {
+                'show_id': show_id,
+                'tmdb_id_update': tmdb_id_update,
+                'keep_keys': missing_episode_keys,
+                'missing_rows': show_missing_rows,
+                'season_rows': season_rows,
+                'update': (
+                    has_missing,
+                    missing_episode_count,
+                    missing_new_count,
+                    missing_old_count,
+                    missing_upcoming_count,
+                    now_iso,
+                    json.dumps(upcoming_air_dates),
+                    show_details['status'],
+                    show.get('episodes_in_plex'),
+                    now_iso,
+                    show_id,
+                ),
+            },
+            'result': {
+                'show_id': show_id,
+                'has_missing_episodes': bool(has_missing),
+                'missing_episode_count': missing_episode_count,
+                'missing_new_count': missing_new_count,
+                'missing_old_count': missing_old_count,
+                'missing_upcoming_count': missing_upcoming_count,
+                'missing_scan_at': now_iso,
+                'missing_upcoming_air_dates': upcoming_air_dates,
+                'error': None,
+            },
+        }
+    except TMDbNotConfiguredError:
+        raise
+    except Exception:  # noqa: BLE001
+        logger.exception('Missing-episode scan failed for show_id=%s', show_id)
+        return {
+            'scanned': True,
+            'failed': True,
+            'missing': False,
+            'write': None,
+            'result': _failed_show_missing_result(show_id, 'Unable to scan this show right now.'),
+        }
+
+
+def _write_show_missing_batch(conn, batch: list[dict[str, Any]]) -> None:
+    tmdb_id_updates = [entry['tmdb_id_update'] for entry in batch if entry['tmdb_id_update'] is not None]
+    if tmdb_id_updates:
+        conn.executemany(
+            'UPDATE plex_shows SET tmdb_show_id = ?, updated_at = ? WHERE show_id = ?',
+            tmdb_id_updates,
+        )
+    for entry in batch:
+        # Auto-clean stale ignore rows in the same transaction as the batch.
+        _cleanup_ignored_episode_keys(conn, entry['show_id'], entry['keep_keys'])
+    for entry in batch:
+        conn.execute('DELETE FROM show_missing_episodes WHERE show_id = ?', (entry['show_id'],))
+        if entry['missing_rows']:
+            conn.executemany(
+                '''
+                INSERT INTO show_missing_episodes (
+                    show_id,
+                    season_number,
+                    episode_number,
+                    title,
+                    air_date,
+                    status,
+                    ignored,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''',
+                entry['missing_rows'],
+            )
+    for entry in batch:
+        conn.execute('DELETE FROM show_seasons_summary WHERE show_id = ?', (entry['show_id'],))
+        if entry['season_rows']:
+            conn.executemany(
+                '''
+                INSERT INTO show_seasons_summary (
+                    show_id,
+                    season_number,
+                    name,
+                    episode_count,
+                    air_date,
+                    poster_url,
+                    year,
+                    in_plex,
+                    episodes_in_plex,
+                    count_overflow,
+                    plex_web_url,
+                    next_upcoming_air_date,
+                    missing_new_count,
+                    missing_old_count,
+                    missing_upcoming_count,
+                    status,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''',
+                entry['season_rows'],
+            )
+    conn.executemany(
+        '''
+        UPDATE plex_shows
+        SET
+            has_missing_episodes = ?,
+            missing_episode_count = ?,
+            missing_new_count = ?,
+            missing_old_count = ?,
+            missing_upcoming_count = ?,
+            missing_scan_at = ?,
+            missing_upcoming_air_dates = ?,
+            tmdb_status = ?,
+            missing_scan_episodes_in_plex = ?,
+            updated_at = ?
+        WHERE show_id = ?
+        ''',
+        [entry['update'] for entry in batch],
+    )
+    refresh_show_release_events(conn, [entry['show_id'] for entry in batch])
+
+
 @app.post('/api/shows/missing-scan')
 def scan_shows_for_missing(payload: ShowMissingScanPayload) -> dict[str, Any]:
     show_ids = [str(sid).strip() for sid in payload.show_ids if str(sid).strip()]
@@ -1867,408 +3226,430 @@ def scan_shows_for_missing(payload: ShowMissingScanPayload) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail='No shows selected for missing scan')
     unique_show_ids = list(dict.fromkeys(show_ids))
 
-    with get_conn() as conn:
+    with get_read_conn() as conn:
+        fresh_ids = set() if payload.force else _fresh_missing_scan_ids(
+            conn, 'plex_shows', 'show_id', _SHOW_FRESH_SQL, unique_show_ids
+        )
+        unique_show_ids = [show_id for show_id in unique_show_ids if show_id not in fresh_ids]
         placeholders = ','.join('?' for _ in unique_show_ids)
         show_rows = conn.execute(
             f'''
-            SELECT show_id, title, year, tmdb_show_id, plex_web_url
+            SELECT show_id, title, year, tmdb_show_id, plex_web_url, episodes_in_plex
             FROM plex_shows
             WHERE show_id IN ({placeholders})
             ''',
             unique_show_ids,
         ).fetchall()
         shows_by_id = {str(row['show_id']): dict(row) for row in show_rows}
-        episode_rows = conn.execute(
-            f'''
-            SELECT show_id, season_number, episode_number, season_plex_web_url
-            FROM plex_show_episodes
-            WHERE show_id IN ({placeholders})
-            ''',
-            unique_show_ids,
-        ).fetchall()
 
+    context = {'shows_by_id': shows_by_id}
     now_iso = datetime.now(UTC).isoformat()
-    results: list[dict[str, Any]] = []
-    updates: list[tuple[int, int, int, int, int, str, str | None, str, str]] = []
-    tmdb_id_updates: list[tuple[int, str, str]] = []
-    missing_total = 0
-    failed_total = 0
-    scanned_total = 0
-    show_missing_rows_by_show: dict[str, list[tuple[Any, ...]]] = {}
-    show_season_summary_rows_by_show: dict[str, list[tuple[Any, ...]]] = {}
-    show_keep_keys_by_show: dict[str, set[tuple[int, int]]] = {}
-    ignored_episode_keys_by_show: dict[str, set[tuple[int, int]]] = {}
+    job_progress(skipped=len(fresh_ids))
+    summary = _run_missing_scan_pool(
+        'shows_missing_scan',
+        payload.model_dump(),
+        unique_show_ids,
+        lambda show_id: _scan_show_missing_item(show_id, context, now_iso),
+        _write_show_missing_batch,
+    )
+    return {
+        'ok': True,
+        'scanned': summary['scanned'],
+        'skipped': len(fresh_ids),
+        'resumed': summary['resumed'],
+        'refreshed': summary['refreshed'],
+        'failed': summary['failed'],
+        'missing_shows': summary['missing'],
+        'items': summary['items'],
+    }
 
-    with get_conn() as conn:
-        for sid in unique_show_ids:
-            ignored_episode_keys_by_show[sid] = _get_ignored_episode_keys(conn, sid)
 
-    plex_episode_set_by_show: dict[str, set[tuple[int, int]]] = {sid: set() for sid in unique_show_ids}
-    plex_episode_rows_by_show: dict[str, list[Any]] = {sid: [] for sid in unique_show_ids}
-    for row in episode_rows:
-        show_id_key = str(row['show_id'])
-        season_no = int(row['season_number'] or 0)
-        episode_no = int(row['episode_number'] or 0)
-        if show_id_key not in plex_episode_rows_by_show:
-            plex_episode_rows_by_show[show_id_key] = []
-        plex_episode_rows_by_show[show_id_key].append(row)
-        if season_no <= 0 or episode_no <= 0:
-            continue
-        if show_id_key not in plex_episode_set_by_show:
-            plex_episode_set_by_show[show_id_key] = set()
-        plex_episode_set_by_show[show_id_key].add((season_no, episode_no))
+# Unattended scans. The schedule lives in settings['scan_schedule'] and uses
+# five-field cron expressions in local time; scheduled runs go through the job
+# pool so they show up in /api/jobs. Library scans share their job kind with
+# the manual buttons and are deduplicated with them; a scheduled missing scan
+# is skipped while a manual missing scan is queued or running.
+MISSING_SCAN_JOB_KINDS = {'actors_missing_scan', 'shows_missing_scan'}
+DEFAULT_SCAN_SCHEDULE: dict[str, Any] = {
+    'enabled': True,
+    'library_cron': '0 4 * * *',
+    'missing_cron': '30 */6 * * *',
+    'missing_batch_size': 500,
+    'rescan_after_hours': 24,
+    'tmdb_daily_budget': 10000,
+}
+SCHEDULER_POLL_SECONDS = 20
+SCHEDULER_STATE: dict[str, Any] = {'running': False, 'last_fired': {}, 'last_runs': {}}
+SCHEDULER_LOCK = threading.Lock()
 
-    for show_id in unique_show_ids:
-        show = shows_by_id.get(show_id)
-        if not show:
-            failed_total += 1
-            results.append(
-                {
-                    'show_id': show_id,
-                    'has_missing_episodes': None,
-                    'missing_episode_count': None,
-                    'missing_new_count': None,
-                    'missing_old_count': None,
-                    'missing_upcoming_count': None,
-                    'missing_scan_at': None,
-                    'missing_upcoming_air_dates': [],
-                    'error': 'Show not found in local cache',
-                }
-            )
-            continue
-        scanned_total += 1
-        try:
-            tmdb_show_id = show.get('tmdb_show_id')
-            if not tmdb_show_id:
-                found = search_tv_show(show.get('title') or '', show.get('year'))
-                if not found:
-                    plex_tmdb_id = _resolve_single_show_tmdb_from_plex(show_id)
-                    if plex_tmdb_id is None:
-                        failed_total += 1
-                        results.append(
-                            {
-                                'show_id': show_id,
-                                'has_missing_episodes': None,
-                                'missing_episode_count': None,
-                                'missing_new_count': None,
-                                'missing_old_count': None,
-                                'missing_upcoming_count': None,
-                                'missing_scan_at': None,
-                                'missing_upcoming_air_dates': [],
-                                'error': 'TMDb match not found',
-                            }
-                        )
-                        continue
-                    tmdb_show_id = int(plex_tmdb_id)
-                else:
-                    tmdb_show_id = int(found['id'])
-                tmdb_id_updates.append((tmdb_show_id, now_iso, show_id))
-
-            plex_episode_set = plex_episode_set_by_show.get(show_id, set())
-
-            tmdb_episode_set: set[tuple[int, int]] = set()
-            tmdb_episode_air_dates: dict[tuple[int, int], str] = {}
-            tmdb_episode_titles: dict[tuple[int, int], str] = {}
-            seasons = get_tv_show_seasons(int(tmdb_show_id))
-            season_numbers = [
-                int(season.get('season_number') or 0)
-                for season in seasons
-                if int(season.get('season_number') or 0) > 0
-            ]
-            season_episode_pairs: list[tuple[int, list[dict[str, Any]]]] = []
-            if season_numbers:
-                season_workers = min(4, len(season_numbers))
-                with ThreadPoolExecutor(max_workers=season_workers) as pool:
-                    futures = {
-                        pool.submit(get_tv_season_episodes, int(tmdb_show_id), season_number): season_number
-                        for season_number in season_numbers
-                    }
-                    for future in as_completed(futures):
-                        season_episode_pairs.append((futures[future], future.result()))
-            season_episodes_by_number = {
-                season_number: episodes
-                for season_number, episodes in season_episode_pairs
-            }
-            for season_number, episodes in season_episode_pairs:
-                for episode in episodes:
-                    episode_number = int(episode.get('episode_number') or 0)
-                    if episode_number <= 0:
-                        continue
-                    key = (season_number, episode_number)
-                    tmdb_episode_set.add(key)
-                    tmdb_episode_titles[key] = str(episode.get('title') or '').strip() or f'Episode {episode_number}'
-                    air_date = str(episode.get('air_date') or '').strip()
-                    if air_date:
-                        tmdb_episode_air_dates[key] = air_date
-
-            missing_episode_keys = tmdb_episode_set - plex_episode_set
-            ignored_episode_keys = ignored_episode_keys_by_show.get(show_id, set())
-            missing_new_count = 0
-            missing_old_count = 0
-            missing_upcoming_count = 0
-            show_missing_rows: list[tuple[Any, ...]] = []
-            now_dt = datetime.now(UTC)
-            for key in missing_episode_keys:
-                season_no, episode_no = key
-                air_date = tmdb_episode_air_dates.get(key)
-                status = _classify_missing_air_date(air_date, now_dt=now_dt)
-                if status == 'missing' and key in ignored_episode_keys:
-                    status = 'ignored'
-                if status == 'new':
-                    missing_new_count += 1
-                elif status == 'upcoming':
-                    missing_upcoming_count += 1
-                elif status == 'missing':
-                    missing_old_count += 1
-                # Episodes without air_date are ignored for status/counters.
-                if air_date and status in {'missing', 'new', 'upcoming'}:
-                    show_missing_rows.append(
-                        (
-                            show_id,
-                            season_no,
-                            episode_no,
-                            tmdb_episode_titles.get(key) or f'Episode {episode_no}',
-                            air_date,
-                            status,
-                            0,
-                            now_iso,
-                        )
-                    )
-            # "Missing" counter excludes upcoming episodes by design.
-            missing_episode_count = missing_new_count + missing_old_count
-            has_missing = 1 if (missing_episode_count + missing_upcoming_count) > 0 else 0
-            if has_missing:
-                missing_total += 1
-            upcoming_air_dates = sorted(
-                {
-                    tmdb_episode_air_dates[key]
-                    for key in missing_episode_keys
-                    if key in tmdb_episode_air_dates and key not in ignored_episode_keys
-                }
-            )
-            show_keep_keys_by_show[show_id] = missing_episode_keys
-            show_missing_rows_by_show[show_id] = show_missing_rows
-            show_season_summary_rows_by_show[show_id] = _build_show_season_summary_rows(
-                show_id=show_id,
-                show_plex_url=show.get('plex_web_url'),
-                plex_rows=plex_episode_rows_by_show.get(show_id, []),
-                ignored_episode_keys=ignored_episode_keys,
-                seasons=seasons,
-                season_episodes_by_number=season_episodes_by_number,
-                now_dt=now_dt,
-                now_iso=now_iso,
-            )
-            updates.append(
-                (
-                    has_missing,
-                    missing_episode_count,
-                    missing_new_count,
-                    missing_old_count,
-                    missing_upcoming_count,
-                    now_iso,
-                    json.dumps(upcoming_air_dates),
-                    now_iso,
-                    show_id,
-                )
-            )
-            results.append(
-                {
-                    'show_id': show_id,
-                    'has_missing_episodes': bool(has_missing),
-                    'missing_episode_count': missing_episode_count,
-                    'missing_new_count': missing_new_count,
-                    'missing_old_count': missing_old_count,
-                    'missing_upcoming_count': missing_upcoming_count,
-                    'missing_scan_at': now_iso,
-                    'missing_upcoming_air_dates': upcoming_air_dates,
-                    'error': None,
-                }
-            )
-        except TMDbNotConfiguredError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        except Exception as exc:  # noqa: BLE001
-            logger.exception('Missing-episode scan failed for show_id=%s', show_id)
-            failed_total += 1
-            results.append(
-                {
-                    'show_id': show_id,
-                    'has_missing_episodes': None,
-                    'missing_episode_count': None,
-                    'missing_new_count': None,
-                    'missing_old_count': None,
-                    'missing_upcoming_count': None,
-                    'missing_scan_at': None,
-                    'missing_upcoming_air_dates': [],
-                    'error': 'Unable to scan this show right now.',
-                }
-            )
 
-    if updates:
-        with get_conn() as conn:
-            if tmdb_id_updates:
-                conn.executemany(
-                    'UPDATE plex_shows SET tmdb_show_id = ?, updated_at = ? WHERE show_id = ?',
-                    tmdb_id_updates,
-                )
-            for show_id, keep_keys in show_keep_keys_by_show.items():
-                # Auto-clean stale ignore rows in one transaction for whole scan.
-                _cleanup_ignored_episode_keys(conn, show_id, keep_keys)
-            for show_id, rows in show_missing_rows_by_show.items():
-                conn.execute('DELETE FROM show_missing_episodes WHERE show_id = ?', (show_id,))
-                if rows:
-                    conn.executemany(
-                        '''
-                        INSERT INTO show_missing_episodes (
-                            show_id,
-                            season_number,
-                            episode_number,
-                            title,
-                            air_date,
-                            status,
-                            ignored,
-                            updated_at
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        ''',
-                        rows,
-                    )
-            for show_id, rows in show_season_summary_rows_by_show.items():
-                conn.execute('DELETE FROM show_seasons_summary WHERE show_id = ?', (show_id,))
-                if rows:
-                    conn.executemany(
-                        '''
-                        INSERT INTO show_seasons_summary (
-                            show_id,
-                            season_number,
-                            name,
-                            episode_count,
-                            air_date,
-                            poster_url,
-                            year,
-                            in_plex,
-                            episodes_in_plex,
-                            count_overflow,
-                            plex_web_url,
-                            next_upcoming_air_date,
-                            missing_new_count,
-                            missing_old_count,
-                            missing_upcoming_count,
-                            status,
-                            updated_at
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''',
-                        rows,
+def get_scan_schedule() -> dict[str, Any]:
+    stored = get_setting('scan_schedule', {})
+    if not isinstance(stored, dict):
+        stored = {}
+    return {**DEFAULT_SCAN_SCHEDULE, **{k: v for k, v in stored.items() if k in DEFAULT_SCAN_SCHEDULE}}
+
+
+def _scheduler_tmdb_usage(day: str) -> int:
+    usage = get_setting('scheduler_tmdb_usage', {})
+    if isinstance(usage, dict) and usage.get('day') == day:
+        return int(usage.get('requests') or 0)
+    return 0
+
+
+def _record_scheduler_tmdb_usage(day: str, requests_used: int) -> None:
+    if requests_used <= 0:
+        return
+    set_setting('scheduler_tmdb_usage', {'day': day, 'requests': _scheduler_tmdb_usage(day) + requests_used})
+
+
+def _scheduled_missing_candidates(rescan_after_hours: int) -> list[tuple[tuple[Any, ...], str, str, int]]:
+    """Stale actors and shows as (priority key, kind, id, estimated TMDb requests).
+
+    Items the missing-scan freshness policy would skip are left out. Tracked
+    items come first, then the nearest upcoming release, then the oldest (or
+    missing) missing_scan_at.
+    """
+    params = {
+        'cutoff': (datetime.now(UTC) - timedelta(hours=max(0, rescan_after_hours))).isoformat(),
+        'fresh_cutoff': _missing_scan_fresh_cutoff(),
+    }
+    with get_read_conn() as conn:
+        actor_rows = conn.execute(
+            f'''
+            SELECT
+                a.actor_id AS item_id,
+                t.actor_id IS NOT NULL AS tracked,
+                a.next_upcoming_release_date AS upcoming,
+                a.missing_scan_at AS scanned_at,
+                CASE WHEN a.tmdb_person_id IS NULL THEN 2 ELSE 1 END AS cost
+            FROM actors a
+            LEFT JOIN tracked_cast t ON t.actor_id = a.actor_id
+            WHERE (a.missing_scan_at IS NULL OR a.missing_scan_at < :cutoff)
+                AND NOT COALESCE(({_ACTOR_FRESH_SQL}), 0)
+            ''',
+            params,
+        ).fetchall()
+        show_rows = conn.execute(
+            f'''
+            SELECT
+                s.show_id AS item_id,
+                EXISTS (SELECT 1 FROM tracked_shows ts WHERE ts.show_id = s.show_id)
+                    OR EXISTS (SELECT 1 FROM tracked_seasons tn WHERE tn.show_id = s.show_id) AS tracked,
+                (
+                    SELECT MIN(ss.next_upcoming_air_date)
+                    FROM show_seasons_summary ss
+                    WHERE ss.show_id = s.show_id
+                ) AS upcoming,
+                s.missing_scan_at AS scanned_at,
+                CASE WHEN s.tmdb_show_id IS NULL THEN 2 ELSE 1 END + MAX(
+                    1,
+                    (
+                        SELECT COUNT(*)
+                        FROM show_seasons_summary ss
+                        WHERE ss.show_id = s.show_id AND ss.season_number > 0
                     )
-            conn.executemany(
-                '''
-                UPDATE plex_shows
-                SET
-                    has_missing_episodes = ?,
-                    missing_episode_count = ?,
-                    missing_new_count = ?,
-                    missing_old_count = ?,
-                    missing_upcoming_count = ?,
-                    missing_scan_at = ?,
-                    missing_upcoming_air_dates = ?,
-                    updated_at = ?
-                WHERE show_id = ?
-                ''',
-                updates,
+                ) AS cost
+            FROM plex_shows s
+            WHERE (s.missing_scan_at IS NULL OR s.missing_scan_at < :cutoff)
+                AND NOT COALESCE(({_SHOW_FRESH_SQL}), 0)
+            ''',
+            params,
+        ).fetchall()
+
+    candidates: list[tuple[tuple[Any, ...], str, str, int]] = []
+    for kind, rows in (('actor', actor_rows), ('show', show_rows)):
+        for row in rows:
+            upcoming = row['upcoming']
+            scanned_at = row['scanned_at']
+            priority = (
+                0 if row['tracked'] else 1,
+                upcoming is None,
+                upcoming or '',
+                scanned_at is not None,
+                scanned_at or '',
             )
-            conn.commit()
+            candidates.append((priority, kind, str(row['item_id']), int(row['cost'])))
+    candidates.sort(key=lambda candidate: candidate[0])
+    return candidates
+
+
+def _run_scheduled_missing_scan() -> dict[str, Any]:
+    schedule = get_scan_schedule()
+    day = date.today().isoformat()
+    budget = int(schedule['tmdb_daily_budget'])
+    used = _scheduler_tmdb_usage(day)
+    remaining = budget - used
+    if remaining <= 0:
+        return {'ok': True, 'skipped': 'TMDb daily budget used', 'budget': budget, 'used_today': used}
+    if has_active_job(MISSING_SCAN_JOB_KINDS):
+        return {'ok': True, 'skipped': 'Missing scan already queued or running', 'budget': budget, 'used_today': used}
+
+    actor_ids: list[str] = []
+    show_ids: list[str] = []
+    estimated = 0
+    batch_size = int(schedule['missing_batch_size'])
+    for _, kind, item_id, cost in _scheduled_missing_candidates(int(schedule['rescan_after_hours'])):
+        if len(actor_ids) + len(show_ids) >= batch_size or estimated + cost > remaining:
+            break
+        estimated += cost
+        (actor_ids if kind == 'actor' else show_ids).append(item_id)
 
+    summary: dict[str, Any] = {}
+    with count_tmdb_requests() as usage:
+        try:
+            if actor_ids:
+                actors_result = scan_actors_for_missing(ActorMissingScanPayload(actor_ids=actor_ids))
+                summary['actors'] = {key: value for key, value in actors_result.items() if key != 'items'}
+            if show_ids and not job_cancel_requested():
+                shows_result = scan_shows_for_missing(ShowMissingScanPayload(show_ids=show_ids))
+                summary['shows'] = {key: value for key, value in shows_result.items() if key != 'items'}
+        finally:
+            requests_used = usage['requests']
+            _record_scheduler_tmdb_usage(day, requests_used)
     return {
         'ok': True,
-        'scanned': scanned_total,
-        'failed': failed_total,
-        'missing_shows': missing_total,
-        'items': results,
+        **summary,
+        'estimated_requests': estimated,
+        'tmdb_requests': requests_used,
+        'budget': budget,
+        'used_today': used + max(0, requests_used),
+    }
+
+
+def _run_budgeted_missing_scan(target: Callable[[Any], dict[str, Any]], payload: BaseModel) -> dict[str, Any]:
+    """Resume a scheduled missing scan, charging its TMDb requests to today's budget."""
+    with count_tmdb_requests() as usage:
+        try:
+            return target(payload)
+        finally:
+            _record_scheduler_tmdb_usage(date.today().isoformat(), usage['requests'])
+
+
+def _submit_scheduled_task(task: str) -> None:
+    if task == 'library':
+        if not get_setting('auth_token') or not get_setting('server'):
+            SCHEDULER_STATE['last_runs'][task] = {'at': datetime.now(UTC).isoformat(), 'skipped': 'Not authenticated with Plex'}
+            return
+        job_ids = [
+            submit_job('scan_actors', scan_actors, ScanCastPayload(), params=ScanCastPayload().model_dump())[0]['id'],
+            submit_job('scan_shows', scan_shows)[0]['id'],
+        ]
+    else:
+        if not get_tmdb_api_key():
+            SCHEDULER_STATE['last_runs'][task] = {'at': datetime.now(UTC).isoformat(), 'skipped': 'TMDb API key missing'}
+            return
+        if has_active_job(MISSING_SCAN_JOB_KINDS):
+            SCHEDULER_STATE['last_runs'][task] = {
+                'at': datetime.now(UTC).isoformat(),
+                'skipped': 'Missing scan already queued or running',
+            }
+            return
+        job_ids = [submit_job('scheduled_missing_scan', _run_scheduled_missing_scan)[0]['id']]
+    SCHEDULER_STATE['last_runs'][task] = {'at': datetime.now(UTC).isoformat(), 'job_ids': job_ids}
+
+
+def _scheduler_tick(now: datetime) -> None:
+    schedule = get_scan_schedule()
+    if not schedule['enabled']:
+        return
+    minute_key = now.strftime('%Y-%m-%dT%H:%M')
+    for task, cron_key in (('library', 'library_cron'), ('missing', 'missing_cron')):
+        try:
+            due = cron_matches(schedule[cron_key], now)
+        except ValueError:
+            continue
+        if due and SCHEDULER_STATE['last_fired'].get(task) != minute_key:
+            SCHEDULER_STATE['last_fired'][task] = minute_key
+            _submit_scheduled_task(task)
+
+
+def _run_scan_scheduler() -> None:
+    while True:
+        try:
+            _scheduler_tick(datetime.now())
+        except Exception:  # noqa: BLE001
+            logger.exception('Scan scheduler tick failed')
+        time.sleep(SCHEDULER_POLL_SECONDS)
+
+
+def start_scan_scheduler() -> bool:
+    with SCHEDULER_LOCK:
+        if SCHEDULER_STATE['running']:
+            return False
+        SCHEDULER_STATE['running'] = True
+    threading.Thread(target=_run_scan_scheduler, name='scan-scheduler', daemon=True).start()
+    return True
+
+
+def _scan_schedule_payload() -> dict[str, Any]:
+    schedule = get_scan_schedule()
+    now = datetime.now()
+    next_runs: dict[str, str | None] = {}
+    for task, cron_key in (('library', 'library_cron'), ('missing', 'missing_cron')):
+        try:
+            next_run = next_cron_run(schedule[cron_key], now) if schedule['enabled'] else None
+        except ValueError:
+            next_run = None
+        next_runs[task] = next_run.isoformat(timespec='minutes') if next_run else None
+    return {
+        'ok': True,
+        'schedule': schedule,
+        'next_runs': next_runs,
+        'last_runs': SCHEDULER_STATE['last_runs'],
+        'tmdb_used_today': _scheduler_tmdb_usage(date.today().isoformat()),
     }
 
 
+@app.get('/api/scan-schedule')
+def scan_schedule_status() -> dict[str, Any]:
+    return _scan_schedule_payload()
+
+
+@app.post('/api/scan-schedule')
+def update_scan_schedule(payload: ScanSchedulePayload) -> dict[str, Any]:
+    changes = payload.model_dump(exclude_none=True)
+    for cron_key in ('library_cron', 'missing_cron'):
+        if cron_key in changes:
+            changes[cron_key] = ' '.join(changes[cron_key].split())
+            try:
+                parse_cron(changes[cron_key])
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=f'Invalid {cron_key}: {exc}') from exc
+    if changes.get('missing_batch_size', 1) < 1:
+        raise HTTPException(status_code=400, detail='missing_batch_size must be at least 1')
+    if changes.get('rescan_after_hours', 0) < 0 or changes.get('tmdb_daily_budget', 0) < 0:
+        raise HTTPException(status_code=400, detail='rescan_after_hours and tmdb_daily_budget cannot be negative')
+    set_setting('scan_schedule', {**get_scan_schedule(), **changes})
+    return _scan_schedule_payload()
+
+
+# Job kinds run the scan endpoints above on the job pool; the same code keeps
+# serving the synchronous endpoints.
+JOB_KINDS: dict[str, tuple[type[BaseModel] | None, Any]] = {
+    'scan_actors': (ScanCastPayload, scan_actors),
+    'scan_shows': (None, scan_shows),
+    'actors_missing_scan': (ActorMissingScanPayload, scan_actors_for_missing),
+    'shows_missing_scan': (ShowMissingScanPayload, scan_shows_for_missing),
+    'scheduled_missing_scan': (None, _run_scheduled_missing_scan),
+}
+
+
+@app.post('/api/jobs')
+def create_job(payload: JobSubmitPayload) -> dict[str, Any]:
+    kind = payload.kind.strip().lower()
+    if kind not in JOB_KINDS:
+        raise HTTPException(status_code=400, detail=f'Unknown job kind: {payload.kind}')
+    model, target = JOB_KINDS[kind]
+    args: tuple[Any, ...] = ()
+    params: dict[str, Any] = {}
+    if model is not None:
+        try:
+            parsed = model.model_validate(payload.params)
+        except ValidationError as exc:
+            raise HTTPException(status_code=400, detail=f'Invalid params for {kind}') from exc
+        args = (parsed,)
+        params = parsed.model_dump()
+    job, created = submit_job(kind, target, *args, params=params)
+    return {'ok': True, 'created': created, 'job': job}
+
+
+@app.get('/api/jobs')
+def jobs_list(limit: int = Query(20, ge=1, le=50)) -> dict[str, Any]:
+    return {'ok': True, 'items': list_jobs(limit)}
+
+
+@app.get('/api/jobs/{job_id}')
+def job_status(job_id: str) -> dict[str, Any]:
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail='Job not found')
+    return {'ok': True, 'job': job}
+
+
+@app.post('/api/jobs/{job_id}/cancel')
+def job_cancel(job_id: str) -> dict[str, Any]:
+    job = cancel_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail='Job not found')
+    return {'ok': True, 'job': job}
+
+
+def resume_missing_scan_runs() -> list[str]:
+    """Re-submit missing scans whose checkpoint outlived the process; returns job ids."""
+    with get_conn() as conn:
+        rows = conn.execute('SELECT run_id, kind, params_json FROM missing_scan_runs ORDER BY run_id').fetchall()
+        resumable: list[tuple[str, BaseModel, bool]] = []
+        for row in rows:
+            model, _ = JOB_KINDS.get(str(row['kind']), (None, None))
+            try:
+                if model is None:
+                    raise ValueError(f'Unknown job kind: {row["kind"]}')
+                params = json.loads(row['params_json'])
+                budgeted = bool(params.pop('tmdb_budget', False))
+                resumable.append((str(row['kind']), model.model_validate(params), budgeted))
+            except ValueError:
+                conn.execute('DELETE FROM missing_scan_run_items WHERE run_id = ?', (row['run_id'],))
+                conn.execute('DELETE FROM missing_scan_runs WHERE run_id = ?', (row['run_id'],))
+        conn.commit()
+    job_ids: list[str] = []
+    for kind, parsed, budgeted in resumable:
+        target = JOB_KINDS[kind][1]
+        if budgeted:
+            job, _ = submit_job(kind, _run_budgeted_missing_scan, target, parsed, params=parsed.model_dump())
+        else:
+            job, _ = submit_job(kind, target, parsed, params=parsed.model_dump())
+        job_ids.append(job['id'])
+    if job_ids:
+        logger.info('Resuming %d interrupted missing scan(s)', len(job_ids))
+    return job_ids
+
+
+_CALENDAR_MOVIE_EVENTS_SQL = '''
+    SELECT tmdb_movie_id, event_date, title, poster_url, tracked
+    FROM release_events
+    WHERE media_type = 'movie' AND event_day BETWEEN ? AND ?
+    ORDER BY event_day ASC, title ASC
+'''
+
+_CALENDAR_SHOW_EVENTS_SQL = '''
+    SELECT
+        r.event_date,
+        r.show_id,
+        s.tmdb_show_id,
+        s.title AS show_title,
+        s.image_url AS poster_url,
+        r.season_number,
+        r.episode_number,
+        r.title AS episode_title,
+        r.tracked,
+        r.tracked_show,
+        r.tracked_season,
+        r.tracked_episode
+    FROM release_events r
+    JOIN plex_shows s ON s.show_id = r.show_id
+    WHERE r.media_type = 'show' AND r.event_day BETWEEN ? AND ?
+    ORDER BY r.event_day ASC, s.title ASC, r.season_number ASC, r.episode_number ASC
+'''
+
+
 @app.get('/api/calendar/events')
 def calendar_events(
     start: str = Query(...),
     end: str = Query(...),
 ) -> dict[str, Any]:
-    start_dt = _parse_iso_date(start)
-    end_dt = _parse_iso_date(end)
-    if not start_dt or not end_dt:
+    start_day = _iso_day_number(start)
+    end_day = _iso_day_number(end)
+    if start_day is None or end_day is None:
         raise HTTPException(status_code=400, detail='Invalid start/end date format. Use YYYY-MM-DD.')
-    if end_dt < start_dt:
+    if end_day < start_day:
         raise HTTPException(status_code=400, detail='End date must be on or after start date.')
-    if (end_dt - start_dt).days > 120:
+    if end_day - start_day > 120:
         raise HTTPException(status_code=400, detail='Date range is too large. Maximum is 120 days.')
 
-    with get_conn() as conn:
-        movie_rows = conn.execute(
-            '''
-            SELECT
-                m.tmdb_movie_id,
-                m.release_date AS event_date,
-                MIN(m.title) AS title,
-                MIN(m.poster_url) AS poster_url
-            FROM actor_missing_movies m
-            WHERE
-                m.release_date >= ?
-                AND m.release_date <= ?
-                AND m.ignored = 0
-            GROUP BY m.tmdb_movie_id, m.release_date
-            ORDER BY m.release_date ASC, title ASC
-            ''',
-            (start, end),
-        ).fetchall()
-        show_rows = conn.execute(
-            '''
-            SELECT
-                e.air_date AS event_date,
-                e.show_id,
-                s.tmdb_show_id,
-                s.title AS show_title,
-                s.image_url AS poster_url,
-                e.season_number,
-                e.episode_number,
-                e.title AS episode_title
-            FROM show_missing_episodes e
-            JOIN plex_shows s ON s.show_id = e.show_id
-            WHERE
-                e.air_date >= ?
-                AND e.air_date <= ?
-                AND e.ignored = 0
-            ORDER BY e.air_date ASC, s.title ASC, e.season_number ASC, e.episode_number ASC
-            ''',
-            (start, end),
-        ).fetchall()
-        tracked_movie_ids = {
-            int(row['tmdb_movie_id'])
-            for row in conn.execute('SELECT tmdb_movie_id FROM tracked_movies').fetchall()
-            if row['tmdb_movie_id'] is not None
-        }
-        tracked_show_ids = {
-            str(row['show_id'])
-            for row in conn.execute('SELECT show_id FROM tracked_shows').fetchall()
-            if row['show_id'] is not None
-        }
-        tracked_season_keys = {
-            (str(row['show_id']), int(row['season_number']))
-            for row in conn.execute('SELECT show_id, season_number FROM tracked_seasons').fetchall()
-            if row['show_id'] is not None and row['season_number'] is not None
-        }
-        tracked_episode_keys = {
-            (str(row['show_id']), int(row['season_number']), int(row['episode_number']))
-            for row in conn.execute(
-                'SELECT show_id, season_number, episode_number FROM tracked_episodes'
-            ).fetchall()
-            if row['show_id'] is not None and row['season_number'] is not None and row['episode_number'] is not None
-        }
-        untracked_episode_keys = {
-            (str(row['show_id']), int(row['season_number']), int(row['episode_number']))
-            for row in conn.execute(
-                'SELECT show_id, season_number, episode_number FROM untracked_episodes'
-            ).fetchall()
-            if row['show_id'] is not None and row['season_number'] is not None and row['episode_number'] is not None
-        }
+    with get_read_conn() as conn:
+        movie_rows = conn.execute(_CALENDAR_MOVIE_EVENTS_SQL, (start_day, end_day)).fetchall()
+        show_rows = conn.execute(_CALENDAR_SHOW_EVENTS_SQL, (start_day, end_day)).fetchall()
 
     items: list[dict[str, Any]] = []
     for row in movie_rows:
@@ -2279,9 +3660,7 @@ def calendar_events(
                 'tmdb_movie_id': int(row['tmdb_movie_id']) if row['tmdb_movie_id'] is not None else None,
                 'title': str(row['title'] or 'Untitled movie'),
                 'poster_url': str(row['poster_url'] or '').strip() or None,
-                'tracked': bool(
-                    row['tmdb_movie_id'] is not None and int(row['tmdb_movie_id']) in tracked_movie_ids
-                ),
+                'tracked': bool(row['tracked']),
             }
         )
     for row in show_rows:
@@ -2297,17 +3676,10 @@ def calendar_events(
                 'episode_number': episode_no,
                 'title': f"{row['show_title']} S{season_no:02d}E{episode_no:02d} - {row['episode_title']}",
                 'poster_url': str(row['poster_url'] or '').strip() or None,
-                'tracked_episode': bool((str(row['show_id']), season_no, episode_no) in tracked_episode_keys),
-                'tracked_season': bool((str(row['show_id']), season_no) in tracked_season_keys),
-                'tracked_show': bool(str(row['show_id']) in tracked_show_ids),
-                'tracked': bool(
-                    (
-                        str(row['show_id']) in tracked_show_ids
-                        or (str(row['show_id']), season_no) in tracked_season_keys
-                        or (str(row['show_id']), season_no, episode_no) in tracked_episode_keys
-                    )
-                    and (str(row['show_id']), season_no, episode_no) not in untracked_episode_keys
-                ),
+                'tracked_episode': bool(row['tracked_episode']),
+                'tracked_season': bool(row['tracked_season']),
+                'tracked_show': bool(row['tracked_show']),
+                'tracked': bool(row['tracked']),
             }
         )
     return {
@@ -2317,10 +3689,6 @@ def calendar_events(
     }
 
 
-def _is_valid_iso_date(value: str | None) -> bool:
-    return bool(value and _parse_iso_date(value))
-
-
 def _discover_name_sort_key(item: dict[str, Any]) -> tuple[int, str]:
     title = str(item.get('title') or item.get('show_title') or '').strip()
     if not title:
@@ -2368,7 +3736,7 @@ def _attach_discovery_movie_credits(items: list[dict[str, Any]]) -> None:
     credits_by_id: dict[int, dict[str, Any]] = {}
     ids_to_fetch: set[int] = set(movie_ids)
 
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         placeholders = ','.join('?' for _ in movie_ids)
         rows = conn.execute(
             f'''
@@ -2480,124 +3848,98 @@ def _attach_discovery_movie_credits(items: list[dict[str, Any]]) -> None:
         item['top_cast'] = credits.get('top_cast') or []
 
 
+_DISCOVERY_EVENTS_SQL = '''
+    SELECT
+        r.media_type,
+        r.event_date,
+        r.event_day,
+        r.tmdb_movie_id,
+        NULL AS show_id,
+        NULL AS tmdb_show_id,
+        NULL AS show_title,
+        NULL AS season_number,
+        NULL AS episode_number,
+        r.title,
+        r.poster_url,
+        r.tracked,
+        COALESCE(NULLIF(r.title, ''), 'Untitled') AS sort_title
+    FROM release_events r
+    WHERE r.media_type = 'movie' AND {date_sql}
+        AND NOT EXISTS (SELECT 1 FROM plex_movies pm WHERE pm.tmdb_id = r.tmdb_movie_id)
+    UNION ALL
+    SELECT
+        r.media_type,
+        r.event_date,
+        r.event_day,
+        NULL,
+        r.show_id,
+        s.tmdb_show_id,
+        s.title,
+        r.season_number,
+        r.episode_number,
+        r.title,
+        s.image_url,
+        r.tracked,
+        COALESCE(NULLIF(TRIM(s.title), ''), 'Untitled Show')
+    FROM release_events r
+    JOIN plex_shows s ON s.show_id = r.show_id
+    WHERE r.media_type = 'show' AND {date_sql}
+        AND NOT EXISTS (
+            SELECT 1 FROM plex_show_episodes pe
+            WHERE pe.show_id = r.show_id
+                AND pe.season_number = r.season_number
+                AND pe.episode_number = r.episode_number
+        )
+'''
+
+
+def _discovery_item(row: Any, **extra: Any) -> dict[str, Any]:
+    if row['media_type'] == 'movie':
+        tmdb_movie_id = int(row['tmdb_movie_id']) if row['tmdb_movie_id'] is not None else 0
+        return {
+            'type': 'movie',
+            'tmdb_movie_id': tmdb_movie_id if tmdb_movie_id > 0 else None,
+            'title': str(row['title'] or 'Untitled'),
+            'poster_url': str(row['poster_url'] or '').strip() or None,
+            'event_date': str(row['event_date']),
+            **extra,
+            'tracked': bool(row['tracked']),
+        }
+    tmdb_show_id = int(row['tmdb_show_id']) if row['tmdb_show_id'] is not None else 0
+    season_number = int(row['season_number'] or 0)
+    episode_number = int(row['episode_number'] or 0)
+    show_title = str(row['show_title'] or '').strip() or 'Untitled Show'
+    episode_title = str(row['title'] or '').strip() or f'Episode {episode_number}'
+    return {
+        'type': 'show',
+        'show_id': str(row['show_id']),
+        'tmdb_show_id': tmdb_show_id if tmdb_show_id > 0 else None,
+        'show_title': show_title,
+        'season_number': season_number,
+        'episode_number': episode_number,
+        'episode_title': episode_title,
+        'title': show_title,
+        'poster_url': str(row['poster_url'] or '').strip() or None,
+        'event_date': str(row['event_date']),
+        **extra,
+        'tracked': bool(row['tracked']),
+    }
+
+
 @app.get('/api/discovery/upcoming')
 def discovery_upcoming(limit: int = Query(80, ge=1, le=300)) -> dict[str, Any]:
-    today = datetime.now(UTC).date().isoformat()
-    with get_conn() as conn:
-        movie_rows = conn.execute(
-            '''
-            SELECT
-                m.tmdb_movie_id,
-                m.release_date AS event_date,
-                MIN(m.title) AS title,
-                MIN(m.poster_url) AS poster_url,
-                MAX(CASE WHEN t.tmdb_movie_id IS NOT NULL THEN 1 ELSE 0 END) AS tracked
-            FROM actor_missing_movies m
-            LEFT JOIN tracked_movies t ON t.tmdb_movie_id = m.tmdb_movie_id
-            LEFT JOIN plex_movies pm ON pm.tmdb_id = m.tmdb_movie_id
-            WHERE
-                m.ignored = 0
-                AND m.status = 'upcoming'
-                AND m.release_date > ?
-                AND pm.plex_rating_key IS NULL
-            GROUP BY m.tmdb_movie_id, m.release_date
-            ORDER BY m.release_date ASC, title ASC
-            ''',
-            (today,),
-        ).fetchall()
-        show_rows = conn.execute(
-            '''
-            SELECT
-                e.show_id,
-                s.tmdb_show_id,
-                s.title AS show_title,
-                e.season_number,
-                e.episode_number,
-                e.title AS episode_title,
-                e.air_date AS event_date,
-                s.image_url AS poster_url,
-                CASE
-                    WHEN te.show_id IS NOT NULL THEN 1
-                    WHEN ts.show_id IS NOT NULL THEN 1
-                    WHEN tsh.show_id IS NOT NULL THEN 1
-                    ELSE 0
-                END AS tracked
-            FROM show_missing_episodes e
-            JOIN plex_shows s ON s.show_id = e.show_id
-            LEFT JOIN plex_show_episodes pe
-                ON pe.show_id = e.show_id
-                AND pe.season_number = e.season_number
-                AND pe.episode_number = e.episode_number
-            LEFT JOIN tracked_episodes te
-                ON te.show_id = e.show_id
-                AND te.season_number = e.season_number
-                AND te.episode_number = e.episode_number
-            LEFT JOIN tracked_seasons ts
-                ON ts.show_id = e.show_id
-                AND ts.season_number = e.season_number
-            LEFT JOIN tracked_shows tsh
-                ON tsh.show_id = e.show_id
-            WHERE
-                e.ignored = 0
-                AND e.status = 'upcoming'
-                AND e.air_date > ?
-                AND pe.plex_rating_key IS NULL
-            ORDER BY e.air_date ASC, s.title ASC, e.season_number ASC, e.episode_number ASC
+    today, _ = _status_day_bounds(datetime.now(UTC))
+    events_sql = _DISCOVERY_EVENTS_SQL.format(date_sql="r.status = 'upcoming' AND r.event_day > :today")
+    with get_read_conn() as conn:
+        rows = conn.execute(
+            f'''
+            SELECT * FROM ({events_sql})
+            ORDER BY event_day ASC, sort_title ASC, season_number ASC, episode_number ASC
+            LIMIT :limit
             ''',
-            (today,),
+            {'today': today, 'limit': limit},
         ).fetchall()
-        untracked_episode_keys = {
-            (str(row['show_id']), int(row['season_number']), int(row['episode_number']))
-            for row in conn.execute(
-                'SELECT show_id, season_number, episode_number FROM untracked_episodes'
-            ).fetchall()
-            if row['show_id'] is not None and row['season_number'] is not None and row['episode_number'] is not None
-        }
-
-    items: list[dict[str, Any]] = []
-    for row in movie_rows:
-        event_date = str(row['event_date'] or '').strip()
-        if not _is_valid_iso_date(event_date):
-            continue
-        tmdb_movie_id = int(row['tmdb_movie_id']) if row['tmdb_movie_id'] is not None else 0
-        items.append(
-            {
-                'type': 'movie',
-                'tmdb_movie_id': tmdb_movie_id if tmdb_movie_id > 0 else None,
-                'title': str(row['title'] or 'Untitled'),
-                'poster_url': str(row['poster_url'] or '').strip() or None,
-                'event_date': event_date,
-                'tracked': bool(int(row['tracked'] or 0)),
-            }
-        )
-    for row in show_rows:
-        event_date = str(row['event_date'] or '').strip()
-        if not _is_valid_iso_date(event_date):
-            continue
-        tmdb_show_id = int(row['tmdb_show_id']) if row['tmdb_show_id'] is not None else 0
-        season_number = int(row['season_number'] or 0)
-        episode_number = int(row['episode_number'] or 0)
-        show_title = str(row['show_title'] or '').strip() or 'Untitled Show'
-        episode_title = str(row['episode_title'] or '').strip() or f'Episode {episode_number}'
-        show_key = (str(row['show_id']), season_number, episode_number)
-        items.append(
-            {
-                'type': 'show',
-                'show_id': str(row['show_id']),
-                'tmdb_show_id': tmdb_show_id if tmdb_show_id > 0 else None,
-                'show_title': show_title,
-                'season_number': season_number,
-                'episode_number': episode_number,
-                'episode_title': episode_title,
-                'title': show_title,
-                'poster_url': str(row['poster_url'] or '').strip() or None,
-                'event_date': event_date,
-                'tracked': bool(int(row['tracked'] or 0)) and show_key not in untracked_episode_keys,
-            }
-        )
-
-    items.sort(key=lambda item: (item['event_date'], item.get('title') or item.get('show_title') or ''))
-    return {'ok': True, 'items': items[:limit]}
+    return {'ok': True, 'items': [_discovery_item(row) for row in rows]}
 
 
 @app.get('/api/discovery/feed')
@@ -2622,161 +3964,47 @@ def discovery_feed(
     normalized_sort = str(sort_by or 'date').strip().lower()
     if normalized_sort not in {'date', 'name', 'random'}:
         raise HTTPException(status_code=400, detail='sort_by must be date, name, or random')
-    now_dt = datetime.now(UTC)
-    today = now_dt.date().isoformat()
-    untracked_episode_keys: set[tuple[str, int, int]] = set()
-
-    with get_conn() as conn:
-        movie_rows = conn.execute(
-            '''
-            SELECT
-                m.tmdb_movie_id,
-                m.release_date AS event_date,
-                MIN(m.title) AS title,
-                MIN(m.poster_url) AS poster_url,
-                MAX(CASE WHEN t.tmdb_movie_id IS NOT NULL THEN 1 ELSE 0 END) AS tracked
-            FROM actor_missing_movies m
-            LEFT JOIN tracked_movies t ON t.tmdb_movie_id = m.tmdb_movie_id
-            LEFT JOIN plex_movies pm ON pm.tmdb_id = m.tmdb_movie_id
-            WHERE
-                m.ignored = 0
-                AND m.release_date <= ?
-                AND pm.plex_rating_key IS NULL
-            GROUP BY m.tmdb_movie_id, m.release_date
-            ''',
-            (today,),
-        ).fetchall()
-        show_rows = conn.execute(
-            '''
-            SELECT
-                e.show_id,
-                s.tmdb_show_id,
-                s.title AS show_title,
-                e.season_number,
-                e.episode_number,
-                e.title AS episode_title,
-                e.air_date AS event_date,
-                e.status AS status,
-                s.image_url AS poster_url,
-                CASE
-                    WHEN te.show_id IS NOT NULL THEN 1
-                    WHEN ts.show_id IS NOT NULL THEN 1
-                    WHEN tsh.show_id IS NOT NULL THEN 1
-                    ELSE 0
-                END AS tracked
-            FROM show_missing_episodes e
-            JOIN plex_shows s ON s.show_id = e.show_id
-            LEFT JOIN plex_show_episodes pe
-                ON pe.show_id = e.show_id
-                AND pe.season_number = e.season_number
-                AND pe.episode_number = e.episode_number
-            LEFT JOIN tracked_episodes te
-                ON te.show_id = e.show_id
-                AND te.season_number = e.season_number
-                AND te.episode_number = e.episode_number
-            LEFT JOIN tracked_seasons ts
-                ON ts.show_id = e.show_id
-                AND ts.season_number = e.season_number
-            LEFT JOIN tracked_shows tsh
-                ON tsh.show_id = e.show_id
-            WHERE
-                e.ignored = 0
-                AND e.air_date <= ?
-                AND pe.plex_rating_key IS NULL
-            ''',
-            (today,),
+    today, first_new_day = _status_day_bounds(datetime.now(UTC))
+    params: dict[str, Any] = {'today': today, 'new_start': first_new_day}
+    filters: list[str] = []
+    if tracked_only:
+        filters.append('tracked = 1')
+    if normalized_status == 'new':
+        filters.append('event_day >= :new_start')
+    elif normalized_status == 'missing':
+        filters.append('event_day < :new_start')
+    if normalized_media != 'all':
+        filters.append('media_type = :media')
+        params['media'] = normalized_media
+    events_sql = _DISCOVERY_EVENTS_SQL.format(date_sql='r.event_day <= :today')
+    filter_sql = f"WHERE {' AND '.join(filters)}" if filters else ''
+    status_sql = "CASE WHEN event_day >= :new_start THEN 'new' ELSE 'missing' END AS status"
+    page_sql = ''
+    if normalized_sort == 'date':
+        # Date order is plain SQL, so only the requested page is read.
+        page_sql = '''
+            ORDER BY event_day DESC, tracked DESC, sort_title DESC, season_number ASC, episode_number ASC
+            LIMIT :limit OFFSET :offset
+        '''
+        params.update({'limit': limit + 1, 'offset': offset})
+    with get_read_conn() as conn:
+        rows = conn.execute(
+            f'SELECT *, {status_sql} FROM ({events_sql}) {filter_sql} {page_sql}',
+            params,
         ).fetchall()
-        untracked_episode_keys = {
-            (str(row['show_id']), int(row['season_number']), int(row['episode_number']))
-            for row in conn.execute(
-                'SELECT show_id, season_number, episode_number FROM untracked_episodes'
-            ).fetchall()
-            if row['show_id'] is not None and row['season_number'] is not None and row['episode_number'] is not None
-        }
-
-    merged: list[dict[str, Any]] = []
-    for row in movie_rows:
-        event_date = str(row['event_date'] or '').strip()
-        if not _is_valid_iso_date(event_date):
-            continue
-        item_status = _classify_missing_air_date(event_date, now_dt=now_dt)
-        if item_status not in {'new', 'missing'}:
-            continue
-        tracked = bool(int(row['tracked'] or 0))
-        if tracked_only and not tracked:
-            continue
-        if normalized_status == 'new' and item_status != 'new':
-            continue
-        if normalized_status == 'missing' and item_status != 'missing':
-            continue
-        if normalized_media == 'show':
-            continue
-        tmdb_movie_id = int(row['tmdb_movie_id']) if row['tmdb_movie_id'] is not None else 0
-        merged.append(
-            {
-                'type': 'movie',
-                'tmdb_movie_id': tmdb_movie_id if tmdb_movie_id > 0 else None,
-                'title': str(row['title'] or 'Untitled'),
-                'poster_url': str(row['poster_url'] or '').strip() or None,
-                'event_date': event_date,
-                'status': item_status,
-                'tracked': tracked,
-            }
-        )
-
-    for row in show_rows:
-        event_date = str(row['event_date'] or '').strip()
-        if not _is_valid_iso_date(event_date):
-            continue
-        item_status = _classify_missing_air_date(event_date, now_dt=now_dt)
-        if item_status not in {'new', 'missing'}:
-            continue
-        tracked = bool(int(row['tracked'] or 0)) and (str(row['show_id']), int(row['season_number'] or 0), int(row['episode_number'] or 0)) not in untracked_episode_keys
-        if tracked_only and not tracked:
-            continue
-        if normalized_status == 'new' and item_status != 'new':
-            continue
-        if normalized_status == 'missing' and item_status != 'missing':
-            continue
-        if normalized_media == 'movie':
-            continue
-        tmdb_show_id = int(row['tmdb_show_id']) if row['tmdb_show_id'] is not None else 0
-        season_number = int(row['season_number'] or 0)
-        episode_number = int(row['episode_number'] or 0)
-        show_title = str(row['show_title'] or '').strip() or 'Untitled Show'
-        episode_title = str(row['episode_title'] or '').strip() or f'Episode {episode_number}'
-        merged.append(
-            {
-                'type': 'show',
-                'show_id': str(row['show_id']),
-                'tmdb_show_id': tmdb_show_id if tmdb_show_id > 0 else None,
-                'show_title': show_title,
-                'season_number': season_number,
-                'episode_number': episode_number,
-                'episode_title': episode_title,
-                'title': show_title,
-                'poster_url': str(row['poster_url'] or '').strip() or None,
-                'event_date': event_date,
-                'status': item_status,
-                'tracked': tracked,
-            }
-        )
+    merged = [_discovery_item(row, status=row['status']) for row in rows]
 
-    if normalized_sort == 'name':
-        merged.sort(key=_discover_name_sort_key)
-    elif normalized_sort == 'random':
-        seed = str(random_seed or '').strip() or 'default'
-        merged.sort(key=lambda item: _discover_random_sort_key(item, seed))
+    if normalized_sort == 'date':
+        has_more = len(merged) > limit
+        paged = merged[:limit]
     else:
-        merged.sort(
-            key=lambda item: (
-                item['event_date'],
-                1 if item.get('tracked') else 0,
-                str(item.get('title') or item.get('show_title') or ''),
-            ),
-            reverse=True,
-        )
-    paged = merged[offset:offset + limit]
+        if normalized_sort == 'name':
+            merged.sort(key=_discover_name_sort_key)
+        else:
+            seed = str(random_seed or '').strip() or 'default'
+            merged.sort(key=lambda item: _discover_random_sort_key(item, seed))
+        has_more = (offset + limit) < len(merged)
+        paged = merged[offset:offset + limit]
     _attach_discovery_movie_credits(paged)
     return {
         'ok': True,
@@ -2787,7 +4015,7 @@ def discovery_feed(
         'random_seed': str(random_seed or '').strip(),
         'offset': offset,
         'limit': limit,
-        'has_more': (offset + limit) < len(merged),
+        'has_more': has_more,
         'items': paged,
     }
 
@@ -2843,7 +4071,7 @@ def plex_image(thumb: str = Query(...)) -> Response:
 
 @app.get('/api/cast/roles')
 def cast_roles() -> dict[str, Any]:
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         rows = conn.execute(
             '''
             SELECT role, COUNT(*) AS total
@@ -2864,7 +4092,7 @@ def actors(role: str = Query('actor')) -> dict[str, Any]:
     role_value = role.strip().lower() or 'actor'
     if role_value not in {'actor', 'director', 'writer'}:
         raise HTTPException(status_code=400, detail='Invalid cast role')
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         rows = conn.execute(
             '''
             SELECT
@@ -2936,6 +4164,7 @@ def set_actor_movie_ignore(
         if not actor:
             raise HTTPException(status_code=404, detail='Actor not found')
         _set_movie_ignored_state(conn, actor_id, tmdb_movie_id, payload.ignored)
+        refresh_movie_release_events(conn, [tmdb_movie_id])
         conn.commit()
     return {
         'ok': True,
@@ -3082,7 +4311,7 @@ def create_collection_from_actor(payload: CreateCollectionPayload) -> dict[str,
 @app.post('/api/collections/create-smart-from-actor')
 def create_smart_collection_from_actor(payload: CreateSmartCollectionPayload) -> dict[str, Any]:
     _, server = ensure_auth()
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         actor_row = conn.execute(
             '''
             SELECT actor_id, name, role
@@ -3111,7 +4340,7 @@ def create_smart_collection_from_actor(payload: CreateSmartCollectionPayload) ->
     ]
     section_ids = sorted({str(item['library_section_id']) for item in in_plex_items if item.get('library_section_id')})
     if not section_ids:
-        with get_conn() as conn:
+        with get_read_conn() as conn:
             fallback_rows = conn.execute(
                 '''
                 SELECT DISTINCT library_section_id
@@ -3205,7 +4434,7 @@ def create_smart_collection_from_actor(payload: CreateSmartCollectionPayload) ->
 
 @app.get('/api/shows')
 def shows() -> dict[str, Any]:
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         rows = conn.execute(
             '''
             SELECT
@@ -3223,25 +4452,9 @@ def shows() -> dict[str, Any]:
                 s.missing_scan_at,
                 s.missing_upcoming_air_dates,
                 s.updated_at,
-                COUNT(e.plex_rating_key) AS episodes_in_plex
+                s.episodes_in_plex
             FROM plex_shows s
-            LEFT JOIN plex_show_episodes e ON e.show_id = s.show_id
-            GROUP BY
-                s.show_id,
-                s.title,
-                s.year,
-                s.tmdb_show_id,
-                s.image_url,
-                s.plex_web_url,
-                s.has_missing_episodes,
-                s.missing_episode_count,
-                s.missing_new_count,
-                s.missing_old_count,
-                s.missing_upcoming_count,
-                s.missing_scan_at,
-                s.missing_upcoming_air_dates,
-                s.updated_at
-            ORDER BY episodes_in_plex DESC, s.title ASC
+            ORDER BY s.episodes_in_plex DESC, s.title ASC
             '''
         ).fetchall()
         tracked_show_ids = {
@@ -3299,25 +4512,12 @@ def show_seasons(
             )
             conn.commit()
 
-        plex_rows = conn.execute(
-            '''
-            SELECT season_number, episode_number, season_plex_web_url
-            FROM plex_show_episodes
-            WHERE show_id = ?
-            ''',
-            (show_id,),
-        ).fetchall()
-        ignored_episode_keys = _get_ignored_episode_keys(conn, show_id)
-        tracked_show = bool(
-            conn.execute('SELECT 1 FROM tracked_shows WHERE show_id = ?', (show_id,)).fetchone()
-        )
+        tracking = _get_effective_tracking(conn, show_id)
+        tracked_show = tracking.get((0, 0), False)
         tracked_seasons = {
-            int(row['season_number'])
-            for row in conn.execute(
-                'SELECT season_number FROM tracked_seasons WHERE show_id = ?',
-                (show_id,),
-            ).fetchall()
-            if row['season_number'] is not None
+            season_no
+            for (season_no, episode_no), tracked in tracking.items()
+            if season_no > 0 and episode_no == 0 and tracked
         }
         summary_rows = conn.execute(
             '''
@@ -3345,6 +4545,17 @@ def show_seasons(
             ''',
             (show_id,),
         ).fetchall()
+        # Episode rows are only needed to rebuild a missing summary.
+        if not summary_rows:
+            plex_rows = conn.execute(
+                '''
+                SELECT season_number, episode_number, season_plex_web_url
+                FROM plex_show_episodes
+                WHERE show_id = ?
+                ''',
+                (show_id,),
+            ).fetchall()
+            ignored_episode_keys = _get_ignored_episode_keys(conn, show_id)
 
     if summary_rows:
         items = _build_show_season_items_from_summary_rows(
@@ -3499,39 +4710,7 @@ def show_season_episodes(
             (show_id, season_number),
         ).fetchall()
         ignored_episode_keys = _get_ignored_episode_keys(conn, show_id, season_number)
-        tracked_show = bool(
-            conn.execute('SELECT 1 FROM tracked_shows WHERE show_id = ?', (show_id,)).fetchone()
-        )
-        tracked_season = bool(
-            conn.execute(
-                'SELECT 1 FROM tracked_seasons WHERE show_id = ? AND season_number = ?',
-                (show_id, season_number),
-            ).fetchone()
-        )
-        tracked_episode_keys = {
-            int(row['episode_number'])
-            for row in conn.execute(
-                '''
-                SELECT episode_number
-                FROM tracked_episodes
-                WHERE show_id = ? AND season_number = ?
-                ''',
-                (show_id, season_number),
-            ).fetchall()
-            if row['episode_number'] is not None
-        }
-        untracked_episode_keys = {
-            int(row['episode_number'])
-            for row in conn.execute(
-                '''
-                SELECT episode_number
-                FROM untracked_episodes
-                WHERE show_id = ? AND season_number = ?
-                ''',
-                (show_id, season_number),
-            ).fetchall()
-            if row['episode_number'] is not None
-        }
+        tracking = _get_effective_tracking(conn, show_id, season_number)
         plex_episode_keys = {
             (season_number, int(row['episode_number']))
             for row in plex_rows
@@ -3573,10 +4752,7 @@ def show_season_episodes(
             'in_plex': bool(matched),
             'plex_rating_key': matched['plex_rating_key'] if matched else None,
             'plex_web_url': matched['plex_web_url'] if matched else None,
-            'tracked': (
-                (tracked_show or tracked_season or (int(episode['episode_number']) in tracked_episode_keys))
-                and (int(episode['episode_number']) not in untracked_episode_keys)
-            ),
+            'tracked': _is_episode_tracked(tracking, season_number, int(episode['episode_number'])),
         }
         status = 'in_plex'
         if not item['in_plex']:
@@ -3632,6 +4808,7 @@ def set_show_episode_ignore(
         if not show:
             raise HTTPException(status_code=404, detail='Show not found')
         _set_episode_ignored_state(conn, show_id, season_number, episode_number, payload.ignored)
+        refresh_show_release_events(conn, [show_id])
         conn.commit()
     return {
         'ok': True,
@@ -3657,6 +4834,7 @@ def set_cast_tracked(actor_id: str, payload: TrackTogglePayload) -> dict[str, An
         _set_track_cast_state(conn, actor_id, payload.tracked)
         for tmdb_movie_id in movie_ids:
             _set_track_movie_state(conn, tmdb_movie_id, payload.tracked)
+        refresh_movie_release_events(conn, movie_ids)
         conn.commit()
     return {'ok': True, 'actor_id': actor_id, 'tracked': bool(payload.tracked), 'movies_updated': len(movie_ids)}
 
@@ -3667,6 +4845,7 @@ def set_movie_tracked(tmdb_movie_id: int, payload: TrackTogglePayload) -> dict[s
         raise HTTPException(status_code=400, detail='Invalid TMDb movie id')
     with get_conn() as conn:
         _set_track_movie_state(conn, tmdb_movie_id, payload.tracked)
+        refresh_movie_release_events(conn, [tmdb_movie_id])
         conn.commit()
     return {'ok': True, 'tmdb_movie_id': tmdb_movie_id, 'tracked': bool(payload.tracked)}
 
@@ -3680,15 +4859,14 @@ def set_show_tracked(show_id: str, payload: TrackTogglePayload) -> dict[str, Any
         season_numbers, episode_keys = _get_known_show_tracking_entries(conn, show_id)
         _set_track_show_state(conn, show_id, payload.tracked)
         if payload.tracked:
-            conn.execute('DELETE FROM untracked_episodes WHERE show_id = ?', (show_id,))
+            _clear_episode_tracking(conn, show_id, overrides_only=True)
             for season_number in season_numbers:
                 _set_track_season_state(conn, show_id, season_number, payload.tracked)
             for season_number, episode_number in episode_keys:
                 _set_track_episode_state(conn, show_id, season_number, episode_number, payload.tracked)
         else:
-            conn.execute('DELETE FROM tracked_seasons WHERE show_id = ?', (show_id,))
-            conn.execute('DELETE FROM tracked_episodes WHERE show_id = ?', (show_id,))
-            conn.execute('DELETE FROM untracked_episodes WHERE show_id = ?', (show_id,))
+            _clear_episode_tracking(conn, show_id)
+        refresh_show_release_events(conn, [show_id])
         conn.commit()
     return {
         'ok': True,
@@ -3711,27 +4889,12 @@ def set_season_tracked(show_id: str, season_number: int, payload: TrackTogglePay
         episode_numbers = sorted({episode_no for _, episode_no in episode_keys})
         _set_track_season_state(conn, show_id, season_number, payload.tracked)
         if payload.tracked:
-            conn.execute(
-                'DELETE FROM untracked_episodes WHERE show_id = ? AND season_number = ?',
-                (show_id, season_number),
-            )
+            _clear_episode_tracking(conn, show_id, season_number, overrides_only=True)
             for episode_number in episode_numbers:
                 _set_track_episode_state(conn, show_id, season_number, episode_number, payload.tracked)
         else:
-            conn.execute(
-                '''
-                DELETE FROM tracked_episodes
-                WHERE show_id = ? AND season_number = ?
-                ''',
-                (show_id, season_number),
-            )
-            conn.execute(
-                '''
-                DELETE FROM untracked_episodes
-                WHERE show_id = ? AND season_number = ?
-                ''',
-                (show_id, season_number),
-            )
+            _clear_episode_tracking(conn, show_id, season_number)
+        refresh_show_release_events(conn, [show_id])
         conn.commit()
     return {
         'ok': True,
@@ -3756,6 +4919,7 @@ def set_episode_tracked(
         if not show:
             raise HTTPException(status_code=404, detail='Show not found')
         _set_track_episode_state(conn, show_id, season_number, episode_number, payload.tracked)
+        refresh_show_release_events(conn, [show_id])
         conn.commit()
     return {
         'ok': True,
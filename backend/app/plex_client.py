@@ -2,8 +2,11 @@
 
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
 from datetime import datetime, UTC
-from typing import Any
+from threading import Lock
+from typing import Any, Iterator
 from urllib.parse import parse_qs, quote, urlparse, urlunparse
 import xml.etree.ElementTree as ET
 
@@ -13,6 +16,7 @@ from requests import ConnectionError as RequestsConnectionError
 from .config import (
     PLEX_CLIENT_ID,
     PLEX_DEVICE,
+    PLEX_PAGE_SIZE,
     PLEX_PLATFORM,
     PLEX_PRODUCT,
     PLEX_VERSION,
@@ -21,6 +25,31 @@ from .utils import cast_id_from_name, normalize_title
 
 PLEX_BASE = 'https://plex.tv'
 
+# Response bytes go to the counter of the scan that made the request (see
+# count_bytes_received), so scans running side by side each record only
+# their own traffic.
+_TRANSFER_COUNTER: ContextVar[dict[str, int] | None] = ContextVar('plex_transfer_counter', default=None)
+_TRANSFER_LOCK = Lock()
+
+
+def _count_received(response: requests.Response) -> None:
+    counter = _TRANSFER_COUNTER.get()
+    if counter is None:
+        return
+    with _TRANSFER_LOCK:
+        counter['bytes_received'] += len(response.content)
+
+
+@contextmanager
+def count_bytes_received() -> Iterator[dict[str, int]]:
+    """Count Plex server response bytes fetched inside the block, for scan statistics."""
+    counter = {'bytes_received': 0}
+    token = _TRANSFER_COUNTER.set(counter)
+    try:
+        yield counter
+    finally:
+        _TRANSFER_COUNTER.reset(token)
+
 
 def _extract_external_ids(node: ET.Element) -> tuple[int | None, str | None]:
     tmdb_id: int | None = None
@@ -330,6 +359,7 @@ def _server_get(uri: str, token: str, path: str, params: dict[str, Any] | None =
             timeout=(6, 90),
         )
         response.raise_for_status()
+        _count_received(response)
         body = response.text.lstrip()
         if not body.startswith('<'):
             raise RequestsConnectionError(f'Unexpected non-XML response from Plex endpoint: {target}')
@@ -347,6 +377,7 @@ def _server_get(uri: str, token: str, path: str, params: dict[str, Any] | None =
             timeout=(6, 90),
         )
         response.raise_for_status()
+        _count_received(response)
         body = response.text.lstrip()
         if not body.startswith('<'):
             raise RequestsConnectionError(f'Unexpected non-XML response from Plex endpoint: {fallback_target}')
@@ -748,109 +779,130 @@ def resolve_show_tmdb_ids(
 
 
 
-def fetch_show_library_snapshot(
+def _show_web_url(server_client_identifier: str | None, rating_key: str | None) -> str | None:
+    if not server_client_identifier or not rating_key:
+        return None
+    return f'https://app.plex.tv/desktop#!/server/{server_client_identifier}/details?key=%2Flibrary%2Fmetadata%2F{rating_key}'
+
+
+def _show_record(directory: ET.Element, server_client_identifier: str | None) -> dict[str, Any] | None:
+    title = directory.attrib.get('title')
+    rating_key = directory.attrib.get('ratingKey')
+    if not title or not rating_key:
+        return None
+
+    year_raw = directory.attrib.get('year')
+    year = int(year_raw) if year_raw and year_raw.isdigit() else None
+    show_tmdb_id, _ = _extract_external_ids(directory)
+    return {
+        'show_id': rating_key,
+        'plex_rating_key': rating_key,
+        'title': title,
+        'year': year,
+        'tmdb_show_id': show_tmdb_id,
+        'normalized_title': normalize_title(title),
+        'image_url': proxied_thumb_url(directory.attrib.get('thumb')),
+        'plex_web_url': _show_web_url(server_client_identifier, rating_key),
+    }
+
+
+def _episode_record(video: ET.Element, server_client_identifier: str | None) -> dict[str, Any] | None:
+    episode_rating_key = video.attrib.get('ratingKey')
+    show_rating_key = video.attrib.get('grandparentRatingKey')
+    if not episode_rating_key or not show_rating_key:
+        return None
+
+    season_raw = video.attrib.get('parentIndex')
+    episode_raw = video.attrib.get('index')
+    if not season_raw or not season_raw.isdigit() or not episode_raw or not episode_raw.isdigit():
+        return None
+
+    title = video.attrib.get('title') or f'Episode {episode_raw}'
+    episode_tmdb_id, _ = _extract_external_ids(video)
+    return {
+        'plex_rating_key': episode_rating_key,
+        'show_id': show_rating_key,
+        'season_number': int(season_raw),
+        'episode_number': int(episode_raw),
+        'title': title,
+        'normalized_title': normalize_title(title),
+        'tmdb_episode_id': episode_tmdb_id,
+        'season_plex_web_url': _show_web_url(server_client_identifier, video.attrib.get('parentRatingKey')),
+        'plex_web_url': _show_web_url(server_client_identifier, episode_rating_key),
+    }
+
+
+def _section_page_params(media_type: int, start: int, page_size: int) -> dict[str, Any]:
+    return {
+        'type': media_type,
+        'X-Plex-Container-Start': start,
+        'X-Plex-Container-Size': page_size,
+    }
+
+
+def iter_show_library_snapshot(
     server_uri: str,
     server_token: str,
     server_client_identifier: str | None = None,
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    page_size: int = PLEX_PAGE_SIZE,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ('show', record) and ('episode', record) pairs for every show library.
+
+    Episodes are requested a page at a time, with the next page fetched while
+    the current one is consumed, so at most two pages are held in memory.
+    """
     sections_root = _server_get(server_uri, server_token, '/library/sections')
     show_sections = [
         s for s in sections_root.findall('Directory') if s.attrib.get('type') == 'show'
     ]
-
-    shows_by_rating_key: dict[str, dict[str, Any]] = {}
-    episodes: list[dict[str, Any]] = []
+    now = datetime.now(UTC).isoformat()
+    seen_show_ids: set[str] = set()
+    episode_show_ids: set[str] = set()
 
     for section in show_sections:
         section_key = section.attrib.get('key')
         if not section_key:
             continue
+        path = f'/library/sections/{section_key}/all'
 
-        # Fetch show and episode listings concurrently per section to reduce
-        # total scan latency without changing scan output.
         with ThreadPoolExecutor(max_workers=2) as pool:
+            # Helper threads run in a copy of the scan's context so their
+            # bytes reach its counter.
             shows_future = pool.submit(
-                _server_get,
-                server_uri,
-                server_token,
-                f'/library/sections/{section_key}/all',
-                {'type': 2},
+                copy_context().run, _server_get, server_uri, server_token, path, {'type': 2}
             )
-            episodes_future = pool.submit(
-                _server_get,
-                server_uri,
-                server_token,
-                f'/library/sections/{section_key}/all',
-                {'type': 4},
+            start = 0
+            page_future = pool.submit(
+                copy_context().run, _server_get, server_uri, server_token, path, _section_page_params(4, start, page_size)
             )
-            shows_root = shows_future.result()
-            episodes_root = episodes_future.result()
-
-        for directory in shows_root.findall('Directory'):
-            title = directory.attrib.get('title')
-            rating_key = directory.attrib.get('ratingKey')
-            if not title or not rating_key:
-                continue
-
-            year_raw = directory.attrib.get('year')
-            year = int(year_raw) if year_raw and year_raw.isdigit() else None
-            show_tmdb_id, _ = _extract_external_ids(directory)
-            shows_by_rating_key[rating_key] = {
-                'show_id': rating_key,
-                'plex_rating_key': rating_key,
-                'title': title,
-                'year': year,
-                'tmdb_show_id': show_tmdb_id,
-                'normalized_title': normalize_title(title),
-                'image_url': proxied_thumb_url(directory.attrib.get('thumb')),
-                'plex_web_url': (
-                    f'https://app.plex.tv/desktop#!/server/{server_client_identifier}/details?key=%2Flibrary%2Fmetadata%2F{rating_key}'
-                    if server_client_identifier
-                    else None
-                ),
-            }
 
-        for video in episodes_root.findall('Video'):
-            episode_rating_key = video.attrib.get('ratingKey')
-            show_rating_key = video.attrib.get('grandparentRatingKey')
-            if not episode_rating_key or not show_rating_key:
-                continue
-
-            season_raw = video.attrib.get('parentIndex')
-            episode_raw = video.attrib.get('index')
-            if not season_raw or not season_raw.isdigit() or not episode_raw or not episode_raw.isdigit():
-                continue
-
-            title = video.attrib.get('title') or f'Episode {episode_raw}'
-            episode_tmdb_id, _ = _extract_external_ids(video)
-            episodes.append(
-                {
-                    'plex_rating_key': episode_rating_key,
-                    'show_id': show_rating_key,
-                    'season_number': int(season_raw),
-                    'episode_number': int(episode_raw),
-                    'title': title,
-                    'normalized_title': normalize_title(title),
-                    'tmdb_episode_id': episode_tmdb_id,
-                    'season_plex_web_url': (
-                        f'https://app.plex.tv/desktop#!/server/{server_client_identifier}/details?key=%2Flibrary%2Fmetadata%2F{video.attrib.get("parentRatingKey")}'
-                        if server_client_identifier and video.attrib.get('parentRatingKey')
-                        else None
-                    ),
-                    'plex_web_url': (
-                        f'https://app.plex.tv/desktop#!/server/{server_client_identifier}/details?key=%2Flibrary%2Fmetadata%2F{episode_rating_key}'
-                        if server_client_identifier
-                        else None
-                    ),
-                }
-            )
+            for directory in shows_future.result().findall('Directory'):
+                show = _show_record(directory, server_client_identifier)
+                if show:
+                    seen_show_ids.add(show['show_id'])
+                    yield 'show', {**show, 'updated_at': now}
+
+            while page_future is not None:
+                page = page_future.result()
+                videos = page.findall('Video')
+                start += page_size
+                # Servers that ignore the container params send everything at
+                # once without totalSize; stop after that single page.
+                total_size = int(page.attrib.get('totalSize') or 0)
+                page_future = None
+                if len(videos) == page_size and start < total_size:
+                    page_future = pool.submit(
+                        copy_context().run, _server_get, server_uri, server_token, path, _section_page_params(4, start, page_size)
+                    )
+                for video in videos:
+                    episode = _episode_record(video, server_client_identifier)
+                    if episode:
+                        episode_show_ids.add(episode['show_id'])
+                        yield 'episode', {**episode, 'updated_at': now}
 
     # Ensure show title data exists for episodes even if /type=2 missed an item.
-    for episode in episodes:
-        show_id = episode['show_id']
-        if show_id in shows_by_rating_key:
-            continue
-        shows_by_rating_key[show_id] = {
+    for show_id in sorted(episode_show_ids - seen_show_ids):
+        yield 'show', {
             'show_id': show_id,
             'plex_rating_key': show_id,
             'title': f'Show {show_id}',
@@ -858,19 +910,24 @@ def fetch_show_library_snapshot(
             'tmdb_show_id': None,
             'normalized_title': normalize_title(f'Show {show_id}'),
             'image_url': None,
-            'plex_web_url': (
-                f'https://app.plex.tv/desktop#!/server/{server_client_identifier}/details?key=%2Flibrary%2Fmetadata%2F{show_id}'
-                if server_client_identifier
-                else None
-            ),
+            'plex_web_url': _show_web_url(server_client_identifier, show_id),
+            'updated_at': now,
         }
 
-    now = datetime.now(UTC).isoformat()
-    shows = []
-    for show in shows_by_rating_key.values():
-        shows.append({**show, 'updated_at': now})
-    for episode in episodes:
-        episode['updated_at'] = now
 
+def fetch_show_library_snapshot(
+    server_uri: str,
+    server_token: str,
+    server_client_identifier: str | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    shows_by_rating_key: dict[str, dict[str, Any]] = {}
+    episodes: list[dict[str, Any]] = []
+    for kind, record in iter_show_library_snapshot(server_uri, server_token, server_client_identifier):
+        if kind == 'show':
+            shows_by_rating_key[record['show_id']] = record
+        else:
+            episodes.append(record)
+
+    shows = list(shows_by_rating_key.values())
     shows.sort(key=lambda x: x['title'].lower())
     return shows, episodes
@@ -1,20 +1,64 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, UTC, timedelta
+from threading import Lock, Thread
+from typing import Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import TMDB_API_KEY, TMDB_IMAGE_BASE
-from .db import get_setting
+from .config import TMDB_API_KEY, TMDB_IMAGE_BASE, TMDB_POOL_SIZE, TMDB_RATE_LIMIT
+from .db import get_setting, set_setting
 from .utils import normalize_title
 
 TMDB_BASE = 'https://api.themoviedb.org/3'
+GENRE_CACHE_TTL = timedelta(days=30)
+GENRE_REFRESH_RETRY = timedelta(hours=1)
+TMDB_MAX_RETRY_AFTER = 10.0
+
+logger = logging.getLogger(__name__)
 
 
 class TMDbNotConfiguredError(RuntimeError):
     pass
 
 
+_SESSION_STATE: dict[str, Any] = {'session': None}
+_SESSION_LOCK = Lock()
+
+
+def _get_session() -> requests.Session:
+    session = _SESSION_STATE.get('session')
+    if session is not None:
+        return session
+    with _SESSION_LOCK:
+        session = _SESSION_STATE.get('session')
+        if session is None:
+            # One keep-alive pool shared by all scan workers instead of a new
+            # TLS handshake per request.
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=TMDB_POOL_SIZE,
+                pool_block=True,
+            )
+            session.mount('https://', adapter)
+            session.headers.update(
+                {
+                    'Accept': 'application/json',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'Connection': 'keep-alive',
+                }
+            )
+            _SESSION_STATE['session'] = session
+    return session
+
+
 def get_tmdb_api_key() -> str:
     override = get_setting('tmdb_api_key', '')
     if isinstance(override, str) and override.strip():
@@ -22,6 +66,48 @@ def get_tmdb_api_key() -> str:
     return TMDB_API_KEY
 
 
+_INFLIGHT: dict[tuple[str, tuple[tuple[str, str], ...]], Future] = {}
+_INFLIGHT_LOCK = Lock()
+_REQUEST_STATS: dict[str, int] = {'requests': 0, 'collapsed': 0, 'throttled': 0}
+_RATE_STATE: dict[str, float] = {'next_at': 0.0}
+_RATE_LOCK = Lock()
+# Sent requests are also counted into the counter opened by the calling
+# context (see count_tmdb_requests), so a scheduled scan is charged only for
+# its own requests.
+_REQUEST_COUNTER: ContextVar[dict[str, int] | None] = ContextVar('tmdb_request_counter', default=None)
+
+
+def _wait_for_rate_budget() -> None:
+    # Hand out evenly spaced send slots so any number of scan workers stays
+    # under TMDB_RATE_LIMIT requests per second together.
+    if TMDB_RATE_LIMIT <= 0:
+        return
+    with _RATE_LOCK:
+        now = time.monotonic()
+        slot = max(now, _RATE_STATE['next_at'])
+        _RATE_STATE['next_at'] = slot + 1.0 / TMDB_RATE_LIMIT
+    delay = slot - now
+    if delay > 0:
+        with _INFLIGHT_LOCK:
+            _REQUEST_STATS['throttled'] += 1
+        time.sleep(delay)
+
+
+def _send_tmdb_request(path: str, query: dict[str, Any]) -> requests.Response:
+    _wait_for_rate_budget()
+    response = _get_session().get(f'{TMDB_BASE}{path}', params=query, timeout=25)
+    if response.status_code == 429:
+        # Over budget anyway (another client on the same key); back off once.
+        try:
+            retry_after = float(response.headers.get('Retry-After') or 1)
+        except ValueError:
+            retry_after = 1.0
+        time.sleep(min(max(retry_after, 0.0), TMDB_MAX_RETRY_AFTER))
+        _wait_for_rate_budget()
+        response = _get_session().get(f'{TMDB_BASE}{path}', params=query, timeout=25)
+    return response
+
+
 def _tmdb_get(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
     api_key = get_tmdb_api_key()
     if not api_key:
@@ -31,18 +117,71 @@ def _tmdb_get(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]
     if params:
         query.update(params)
 
-    response = requests.get(f'{TMDB_BASE}{path}', params=query, timeout=25)
-    response.raise_for_status()
-    return response.json()
+    # Coalesce identical concurrent requests (e.g. season prefetch racing a
+    # missing scan) so they share one in-flight HTTP call and its result.
+    flight_key = (path, tuple(sorted((str(k), str(v)) for k, v in query.items())))
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(flight_key)
+        if pending is None:
+            pending = Future()
+            _INFLIGHT[flight_key] = pending
+            is_leader = True
+        else:
+            _REQUEST_STATS['collapsed'] += 1
+            is_leader = False
+
+    if not is_leader:
+        return pending.result()
+
+    try:
+        response = _send_tmdb_request(path, query)
+        response.raise_for_status()
+        payload = response.json()
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        pending.set_result(payload)
+        return payload
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(flight_key, None)
+            _REQUEST_STATS['requests'] += 1
+            counter = _REQUEST_COUNTER.get()
+            if counter is not None:
+                counter['requests'] += 1
+
+
+@contextmanager
+def count_tmdb_requests() -> Iterator[dict[str, int]]:
+    """Count the TMDb requests sent inside the block (helper threads need copy_context)."""
+    counter = {'requests': 0}
+    token = _REQUEST_COUNTER.set(counter)
+    try:
+        yield counter
+    finally:
+        _REQUEST_COUNTER.reset(token)
+
+
+def tmdb_requests_counted() -> bool:
+    return _REQUEST_COUNTER.get() is not None
+
+
+def get_tmdb_request_stats() -> dict[str, int]:
+    with _INFLIGHT_LOCK:
+        return {
+            'requests': _REQUEST_STATS['requests'],
+            'collapsed': _REQUEST_STATS['collapsed'],
+            'throttled': _REQUEST_STATS['throttled'],
+            'in_flight': len(_INFLIGHT),
+        }
 
 
-_GENRE_CACHE: dict[str, Any] = {'map': None}
+_GENRE_CACHE: dict[str, Any] = {'map': None, 'updated_at': None, 'refreshing': False, 'attempted_at': None}
+_GENRE_LOCK = Lock()
 
 
-def _get_movie_genre_map() -> dict[int, str]:
-    cached = _GENRE_CACHE.get('map')
-    if isinstance(cached, dict):
-        return cached
+def _fetch_movie_genre_map() -> dict[int, str]:
     payload = _tmdb_get('/genre/movie/list')
     genres_raw = payload.get('genres', [])
     mapping: dict[int, str] = {}
@@ -55,10 +194,112 @@ def _get_movie_genre_map() -> dict[int, str]:
             name = str(genre.get('name') or '').strip()
             if name:
                 mapping[genre_id] = name
+    return mapping
+
+
+def _load_persisted_genre_map() -> bool:
+    stored = get_setting('tmdb_movie_genres')
+    if not isinstance(stored, dict) or not isinstance(stored.get('genres'), dict):
+        return False
+    try:
+        updated_at = datetime.fromisoformat(str(stored.get('updated_at') or ''))
+    except ValueError:
+        updated_at = None
+    mapping: dict[int, str] = {}
+    for raw_id, name in stored['genres'].items():
+        try:
+            mapping[int(raw_id)] = str(name)
+        except (TypeError, ValueError):
+            continue
+    if not mapping:
+        return False
     _GENRE_CACHE['map'] = mapping
+    _GENRE_CACHE['updated_at'] = updated_at
+    return True
+
+
+def _store_genre_map(mapping: dict[int, str]) -> None:
+    updated_at = datetime.now(UTC)
+    if mapping:
+        set_setting(
+            'tmdb_movie_genres',
+            {
+                'updated_at': updated_at.isoformat(),
+                'genres': {str(genre_id): name for genre_id, name in mapping.items()},
+            },
+        )
+    _GENRE_CACHE['map'] = mapping
+    _GENRE_CACHE['updated_at'] = updated_at
+
+
+def _genre_map_is_stale() -> bool:
+    updated_at = _GENRE_CACHE.get('updated_at')
+    if not isinstance(updated_at, datetime):
+        return True
+    return updated_at < datetime.now(UTC) - GENRE_CACHE_TTL
+
+
+def refresh_movie_genre_map() -> dict[int, str]:
+    mapping = _fetch_movie_genre_map()
+    with _GENRE_LOCK:
+        _store_genre_map(mapping)
     return mapping
 
 
+def _refresh_genre_map_worker() -> None:
+    try:
+        refresh_movie_genre_map()
+    except TMDbNotConfiguredError:
+        pass
+    except Exception:  # noqa: BLE001
+        logger.warning('Background TMDb genre refresh failed', exc_info=True)
+    finally:
+        _GENRE_CACHE['refreshing'] = False
+
+
+def _refresh_genre_map_in_background() -> None:
+    now = datetime.now(UTC)
+    with _GENRE_LOCK:
+        if _GENRE_CACHE.get('refreshing'):
+            return
+        # A failed refresh leaves the map stale; wait before asking TMDb again
+        # so an outage does not start a request per credit lookup.
+        attempted_at = _GENRE_CACHE.get('attempted_at')
+        if isinstance(attempted_at, datetime) and attempted_at > now - GENRE_REFRESH_RETRY:
+            return
+        _GENRE_CACHE['refreshing'] = True
+        _GENRE_CACHE['attempted_at'] = now
+    Thread(target=_refresh_genre_map_worker, name='tmdb-genre-refresh', daemon=True).start()
+
+
+def warm_movie_genre_map() -> None:
+    """Load the persisted genre map and refresh it in the background if stale."""
+    with _GENRE_LOCK:
+        if _GENRE_CACHE.get('map') is None:
+            _load_persisted_genre_map()
+    if _genre_map_is_stale():
+        _refresh_genre_map_in_background()
+
+
+def _get_movie_genre_map() -> dict[int, str]:
+    cached = _GENRE_CACHE.get('map')
+    if isinstance(cached, dict):
+        if _genre_map_is_stale():
+            _refresh_genre_map_in_background()
+        return cached
+    # Cold cache (first run before warm-up finished): let one thread fetch
+    # while the others wait for its result instead of racing TMDb.
+    with _GENRE_LOCK:
+        cached = _GENRE_CACHE.get('map')
+        if isinstance(cached, dict):
+            return cached
+        if _load_persisted_genre_map():
+            return _GENRE_CACHE['map']
+        mapping = _fetch_movie_genre_map()
+        _store_genre_map(mapping)
+        return mapping
+
+
 def _genre_names_from_ids(genre_ids: Any) -> list[str]:
     if not isinstance(genre_ids, list) or not genre_ids:
         return []
@@ -224,6 +465,10 @@ def search_tv_show(name: str, year: int | None = None) -> dict[str, Any] | None:
 
 
 def get_tv_show_seasons(tv_id: int) -> list[dict[str, Any]]:
+    return get_tv_show_details(tv_id)['seasons']
+
+
+def get_tv_show_details(tv_id: int) -> dict[str, Any]:
     payload = _tmdb_get(f'/tv/{tv_id}')
     seasons = payload.get('seasons', [])
     items: list[dict[str, Any]] = []
@@ -242,7 +487,7 @@ def get_tv_show_seasons(tv_id: int) -> list[dict[str, Any]]:
             }
         )
     items.sort(key=lambda s: s['season_number'])
-    return items
+    return {'status': payload.get('status') or None, 'seasons': items}
 
 
 def get_tv_season_episodes(tv_id: int, season_number: int) -> list[dict[str, Any]]:
@@ -270,6 +515,19 @@ def get_tv_season_episodes(tv_id: int, season_number: int) -> list[dict[str, Any
     return items
 
 
+def find_movie_id_by_imdb_id(imdb_id: str) -> int | None:
+    imdb_value = str(imdb_id or '').strip()
+    if not imdb_value:
+        return None
+    payload = _tmdb_get(f'/find/{imdb_value}', {'external_source': 'imdb_id'})
+    for movie in payload.get('movie_results', []) or []:
+        try:
+            return int(movie.get('id'))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
 def get_movie_trailer_url(movie_id: int) -> str | None:
     payload = _tmdb_get(f'/movie/{movie_id}/videos')
     return _select_best_trailer(payload)
@@ -1,5 +1,7 @@
 ﻿import re
 import unicodedata
+from datetime import date, datetime, time, timedelta
+from typing import Any
 
 
 def normalize_title(title: str) -> str:
@@ -19,3 +21,97 @@ def cast_id_from_name(role: str, name: str) -> str:
     if normalized_role == 'actor' or not normalized_role:
         return base
     return f'{normalized_role}-{base}'
+
+
+# minute, hour, day of month, month, day of week (0 or 7 = Sunday)
+CRON_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+# Long enough to reach the next 29 February from any date.
+CRON_LOOKAHEAD = timedelta(days=8 * 366)
+
+
+def _cron_field_values(field: str, low: int, high: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(','):
+        step = 1
+        stepped = '/' in part
+        if stepped:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f'Invalid cron step: {field}')
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start_text, end_text = part.split('-', 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            # 'N/step' runs from N to the end of the range, even with step 1.
+            end = high if stepped else start
+        if start < low or end > high or start > end:
+            raise ValueError(f'Cron field out of range: {field}')
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expression: str) -> tuple[Any, ...]:
+    """Parse a five-field cron expression (lists, ranges and steps, no names).
+
+    Returns the minute, hour, day, month and weekday sets, then whether a day
+    matches on either day field. As in standard cron, that is the case when
+    both day of month and day of week are restricted (neither starts with *).
+    """
+    fields = str(expression or '').split()
+    if len(fields) != 5:
+        raise ValueError('Cron expression needs five fields: minute hour day month weekday')
+    minutes, hours, days, months, weekdays = (
+        _cron_field_values(field, low, high)
+        for field, (low, high) in zip(fields, CRON_FIELD_RANGES)
+    )
+    if 7 in weekdays:
+        weekdays = (weekdays - {7}) | {0}
+    either_day = not fields[2].startswith('*') and not fields[4].startswith('*')
+    return minutes, hours, days, months, weekdays, either_day
+
+
+def _cron_day_matches(spec: tuple[Any, ...], day: date) -> bool:
+    _, _, days, months, weekdays, either_day = spec
+    if day.month not in months:
+        return False
+    day_matches = day.day in days
+    weekday_matches = day.isoweekday() % 7 in weekdays
+    return day_matches or weekday_matches if either_day else day_matches and weekday_matches
+
+
+def _cron_fields_match(spec: tuple[Any, ...], moment: datetime) -> bool:
+    minutes, hours = spec[:2]
+    return moment.hour in hours and moment.minute in minutes and _cron_day_matches(spec, moment.date())
+
+
+def cron_matches(expression: str, moment: datetime) -> bool:
+    return _cron_fields_match(parse_cron(expression), moment)
+
+
+def next_cron_run(expression: str, after: datetime) -> datetime | None:
+    """First minute after `after` that matches, or None within CRON_LOOKAHEAD.
+
+    Skips months and days that cannot match, then picks the first
+    hour and minute on the matching day.
+    """
+    spec = parse_cron(expression)
+    minutes, hours, _, months = spec[:4]
+    times = [time(hour, minute) for hour in sorted(hours) for minute in sorted(minutes)]
+    start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    day = start.date()
+    limit = (after + CRON_LOOKAHEAD).date()
+    while day <= limit:
+        if day.month not in months:
+            day = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+            continue
+        if _cron_day_matches(spec, day):
+            for moment_time in times:
+                moment = datetime.combine(day, moment_time, tzinfo=after.tzinfo)
+                if moment >= start:
+                    return moment
+        day += timedelta(days=1)
+    return None
@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import config, db  # noqa: E402
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    db_path = tmp_path / 'plex_collector.db'
+    monkeypatch.setattr(config, 'DB_PATH', db_path)
+    monkeypatch.setattr(db, 'DB_PATH', db_path)
+    db.close_thread_conns()
+    db.init_db()
+    yield db_path
+    db.close_thread_conns()
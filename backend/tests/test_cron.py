@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+
+from app.utils import cron_matches, next_cron_run, parse_cron
+
+MONDAY_19TH = datetime(2026, 10, 19, 4, 0)
+
+
+def test_restricted_day_fields_match_either_day():
+    assert cron_matches('0 4 1 * 1', MONDAY_19TH)
+    assert cron_matches('0 4 1 * 1', datetime(2026, 11, 1, 4, 0))
+    assert not cron_matches('0 4 1 * 1', datetime(2026, 10, 20, 4, 0))
+    assert next_cron_run('0 4 1 * 1', MONDAY_19TH) == datetime(2026, 10, 26, 4, 0)
+
+
+@pytest.mark.parametrize('expression', ['0 4 * * 1', '0 4 */2 * 1'])
+def test_starred_day_field_still_requires_both(expression):
+    assert not cron_matches(expression, datetime(2026, 11, 3, 4, 0))
+
+
+def test_step_on_single_value_runs_to_end_of_range():
+    assert parse_cron('5/1 * * * *')[0] == set(range(5, 60))
+    assert parse_cron('10/20 * * * *')[0] == {10, 30, 50}
+    assert parse_cron('5 * * * *')[0] == {5}
+
+
+@pytest.mark.parametrize('expression', ['0 4 * *', '60 * * * *', '*/0 * * * *', '5-1 * * * *'])
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        parse_cron(expression)
+
+
+@pytest.mark.parametrize(
+    ('expression', 'expected'),
+    [
+        ('0 4 1 1 *', datetime(2027, 1, 1, 4, 0)),
+        ('30 2 29 2 *', datetime(2028, 2, 29, 2, 30)),
+        ('0 4 * * *', datetime(2026, 10, 20, 4, 0)),
+        ('1 4 * * *', datetime(2026, 10, 19, 4, 1)),
+        ('*/15 3-5 * * 1-5', datetime(2026, 10, 19, 4, 15)),
+    ],
+)
+def test_next_run_beyond_a_month(expression, expected):
+    assert next_cron_run(expression, MONDAY_19TH) == expected
+
+
+def test_next_run_of_impossible_date_is_none():
+    assert next_cron_run('0 0 31 2 *', MONDAY_19TH) is None
@@ -0,0 +1,54 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app import tmdb_client
+
+
+class InlineThread:
+    """Runs the background refresh in the calling thread."""
+
+    def __init__(self, target, **kwargs):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+@pytest.fixture
+def stale_genre_map(database, monkeypatch):
+    cache = {
+        'map': {28: 'Action'},
+        'updated_at': datetime.now(UTC) - tmdb_client.GENRE_CACHE_TTL - timedelta(days=1),
+        'refreshing': False,
+        'attempted_at': None,
+    }
+    monkeypatch.setattr(tmdb_client, '_GENRE_CACHE', cache)
+    monkeypatch.setattr(tmdb_client, 'Thread', InlineThread)
+    return cache
+
+
+def test_failed_refresh_backs_off(stale_genre_map, monkeypatch):
+    calls = []
+
+    def fail(path, *args, **kwargs):
+        calls.append(path)
+        raise RuntimeError('TMDb unavailable')
+
+    monkeypatch.setattr(tmdb_client, '_tmdb_get', fail)
+    for _ in range(50):
+        assert tmdb_client._genre_names_from_ids([28]) == ['Action']
+    assert calls == ['/genre/movie/list']
+    assert stale_genre_map['refreshing'] is False
+
+    stale_genre_map['attempted_at'] -= tmdb_client.GENRE_REFRESH_RETRY
+    tmdb_client._genre_names_from_ids([28])
+    assert len(calls) == 2
+
+
+def test_successful_refresh_replaces_stale_map(stale_genre_map, monkeypatch):
+    payload = {'genres': [{'id': 28, 'name': 'Action & Adventure'}]}
+    monkeypatch.setattr(tmdb_client, '_tmdb_get', lambda path, *args, **kwargs: payload)
+    tmdb_client._genre_names_from_ids([28])
+    assert tmdb_client._genre_names_from_ids([28]) == ['Action & Adventure']
+    assert not tmdb_client._genre_map_is_stale()
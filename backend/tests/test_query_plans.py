@@ -0,0 +1,93 @@
+import re
+
+import pytest
+
+from app import db, main
+
+# Large tables and the aliases the endpoint SQL gives them; plans name the alias.
+LARGE_TABLES = {'release_events', 'r', 'plex_movies', 'pm', 'plex_shows', 's', 'plex_show_episodes', 'pe'}
+FULL_SCAN = re.compile(r'^SCAN (\w+)')
+SHOWS = 200
+EPISODES_PER_SHOW = 50
+EVENT_DAYS = 2000
+TODAY = 20500
+
+
+def _seed(conn) -> None:
+    now = '2026-01-01T00:00:00+00:00'
+    conn.executemany(
+        '''
+        INSERT INTO plex_movies (plex_rating_key, title, tmdb_id, normalized_title, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        ''',
+        [(f'm{i}', f'Movie {i}', i, f'movie {i}', now) for i in range(0, 20000, 2)],
+    )
+    conn.executemany(
+        '''
+        INSERT INTO plex_shows (show_id, plex_rating_key, title, normalized_title, updated_at, episodes_in_plex)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ''',
+        [(f's{i}', f's{i}', f'Show {i}', f'show {i}', now, EPISODES_PER_SHOW) for i in range(SHOWS)],
+    )
+    conn.executemany(
+        '''
+        INSERT INTO plex_show_episodes (plex_rating_key, show_id, season_number, episode_number, title, normalized_title, updated_at)
+        VALUES (?, ?, 1, ?, ?, ?, ?)
+        ''',
+        [
+            (f'e{show}-{episode}', f's{show}', episode, f'E{episode}', f'e{episode}', now)
+            for show in range(SHOWS)
+            for episode in range(1, EPISODES_PER_SHOW + 1)
+        ],
+    )
+    conn.executemany(
+        '''
+        INSERT INTO release_events (media_type, event_day, tmdb_movie_id, event_date, title, status, tracked)
+        VALUES ('movie', ?, ?, '2026-01-01', ?, 'missing', 0)
+        ''',
+        [(TODAY - EVENT_DAYS // 2 + i % EVENT_DAYS, i, f'Movie {i}') for i in range(20000)],
+    )
+    conn.executemany(
+        '''
+        INSERT INTO release_events (media_type, event_day, show_id, season_number, episode_number, event_date, title, status, tracked)
+        VALUES ('show', ?, ?, 1, ?, '2026-01-01', ?, 'missing', 0)
+        ''',
+        [
+            (TODAY - EVENT_DAYS // 2 + (show * 97 + episode) % EVENT_DAYS, f's{show}', episode, f'E{episode}')
+            for show in range(SHOWS)
+            for episode in range(1, EPISODES_PER_SHOW * 2 + 1)
+        ],
+    )
+    conn.execute('ANALYZE')
+    conn.commit()
+
+
+def _full_scans(conn, sql: str, params) -> list[str]:
+    plan = [row['detail'] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()]
+    return [detail for detail in plan if (match := FULL_SCAN.match(detail)) and match.group(1) in LARGE_TABLES]
+
+
+@pytest.fixture
+def conn(database):
+    with db.get_conn() as conn:
+        _seed(conn)
+        yield conn
+
+
+@pytest.mark.parametrize(
+    'date_sql',
+    ["r.status = 'upcoming' AND r.event_day > :today", 'r.event_day <= :today'],
+    ids=['upcoming', 'feed'],
+)
+def test_discovery_events_use_indexes(conn, date_sql):
+    sql = f'''
+        SELECT * FROM ({main._DISCOVERY_EVENTS_SQL.format(date_sql=date_sql)})
+        ORDER BY event_day DESC, tracked DESC, sort_title DESC, season_number ASC, episode_number ASC
+        LIMIT :limit OFFSET :offset
+    '''
+    assert _full_scans(conn, sql, {'today': TODAY, 'limit': 21, 'offset': 0}) == []
+
+
+@pytest.mark.parametrize('sql', [main._CALENDAR_MOVIE_EVENTS_SQL, main._CALENDAR_SHOW_EVENTS_SQL], ids=['movies', 'shows'])
+def test_calendar_range_uses_primary_key(conn, sql):
+    assert _full_scans(conn, sql, (TODAY, TODAY + 42)) == []
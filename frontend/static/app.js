@@ -14,7 +14,7 @@ const CALENDAR_ICON_PATH = "M7 2h2v2h6V2h2v2h3v18H4V4h3V2Zm11 8H6v10h12V10Zm0-4H
 const PIN_ICON_PATH = "m12 2.75 2.91 5.89 6.5.95-4.7 4.58 1.11 6.47L12 17.58l-5.82 3.06 1.11-6.47-4.7-4.58 6.5-.95L12 2.75Z";
 const PLAY_ICON_PATH = "M8 5.14v13.72c0 .76.82 1.24 1.49.87l10.77-6.86a1 1 0 0 0 0-1.74L9.49 4.27A1 1 0 0 0 8 5.14Z";
 const ACTORS_BATCH_SIZE = 60;
-const SCAN_WORKERS_CONCURRENCY = 8; // "Scan workers"
+const JOB_POLL_INTERVAL_MS = 1000;
 const ACTOR_INITIAL_FILTERS = ['All', '0-9', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', '\u00c6', '\u00d8', '\u00c5', '#'];
 const DEFAULT_DOWNLOAD_PREFIX = {
   actor_start: '',
@@ -3525,49 +3525,47 @@ function chooseShowMissingScanMode(scopedCount, allCount, unscannedCount = 0) {
   });
 }
 
-async function runScanWorkers({
-  ids,
-  label,
-  workerFn,
-  onUpdate,
-  concurrency = SCAN_WORKERS_CONCURRENCY,
-}) {
-  const total = ids.length;
-  let cursor = 0;
-  let completed = 0;
-  let fatalError = null;
+function formatJobProgress(job, label) {
+  const counters = Object.entries(job?.counters || {})
+    .filter(([, value]) => Number.isFinite(Number(value)) && Number(value) > 0)
+    .map(([key, value]) => `${value} ${key}`);
+  return counters.length ? `${label} ${counters.join(', ')}` : label;
+}
 
-  const safeConcurrency = Math.max(1, Math.min(Number(concurrency) || 1, total || 1));
+async function runJob(kind, params = {}, onProgress = null) {
+  const submitted = await api('/api/jobs', {
+    method: 'POST',
+    body: JSON.stringify({ kind, params }),
+  });
+  let job = submitted.job;
+  while (job.status === 'queued' || job.status === 'running') {
+    if (typeof onProgress === 'function') onProgress(job);
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    job = (await api(`/api/jobs/${encodeURIComponent(job.id)}`)).job;
+  }
+  if (job.status !== 'succeeded') {
+    throw new Error(job.error || `Scan ${job.status}`);
+  }
+  return job.result;
+}
 
-  const updateProgress = () => {
+async function runMissingScanJob(kind, params, total, label) {
+  const updateProgress = (done) => {
     const msg = document.getElementById('scan-modal-msg');
-    if (msg) msg.textContent = `Scanned ${completed}/${total} ${label}`;
+    if (msg) msg.textContent = `Scanned ${done}/${total} ${label}`;
   };
-
-  updateProgress();
-
-  const worker = async () => {
-    while (true) {
-      if (fatalError) return;
-      const idx = cursor;
-      if (idx >= total) return;
-      cursor += 1;
-      const id = ids[idx];
-      try {
-        const result = await workerFn(id);
-        if (typeof onUpdate === 'function') onUpdate(result, id);
-      } catch (error) {
-        fatalError = error;
-        return;
-      } finally {
-        completed += 1;
-        updateProgress();
-      }
-    }
+  updateProgress(0);
+  const result = await runJob(kind, params, (job) => updateProgress(Number(job?.progress?.done) || 0));
+  updateProgress(total);
+  // Large (checkpointed) scans only report totals; callers reload the list.
+  return {
+    items: Array.isArray(result?.items) ? result.items : null,
+    skipped: Number(result?.skipped) || 0,
   };
+}
 
-  await Promise.all(Array.from({ length: safeConcurrency }, () => worker()));
-  if (fatalError) throw fatalError;
+function formatMissingScanDone(skipped) {
+  return skipped > 0 ? `Scan completed (${skipped} already up to date)` : 'Scan completed';
 }
 
 function showCreateCollectionModal(message) {
@@ -3623,7 +3621,10 @@ async function runScan() {
   showScanModal(scanText);
 
   try {
-    const result = await api('/api/scan/actors', { method: 'POST' });
+    const result = await runJob('scan_actors', {}, (job) => {
+      const msg = document.getElementById('scan-modal-msg');
+      if (msg) msg.textContent = formatJobProgress(job, scanText);
+    });
     clearPrimaryDataCaches();
     invalidateImageCache();
     state.actorsLoaded = false;
@@ -3667,7 +3668,10 @@ async function runShowScan() {
   showScanModal(scanText);
 
   try {
-    const result = await api('/api/scan/shows', { method: 'POST' });
+    const result = await runJob('scan_shows', {}, (job) => {
+      const msg = document.getElementById('scan-modal-msg');
+      if (msg) msg.textContent = formatJobProgress(job, scanText);
+    });
     clearPrimaryDataCaches();
     invalidateImageCache();
     state.showsLoaded = false;
@@ -4212,7 +4216,7 @@ async function renderActors(enableBackgroundRefresh = true, routeKey = state.cur
         try {
           const result = await api('/api/actors/missing-scan', {
             method: 'POST',
-            body: JSON.stringify({ actor_ids: [String(actor.actor_id)] }),
+            body: JSON.stringify({ actor_ids: [String(actor.actor_id)], force: true }),
           });
           const updates = Array.isArray(result.items) ? result.items : [];
           for (const updated of updates) {
@@ -4346,22 +4350,16 @@ async function renderActors(enableBackgroundRefresh = true, routeKey = state.cur
       const total = actorIds.length;
       showScanModal(`Scanned 0/${total} cast`);
       try {
-        await runScanWorkers({
-          ids: actorIds,
-          label: 'actors',
-          workerFn: (actorId) => api('/api/actors/missing-scan', {
-            method: 'POST',
-            body: JSON.stringify({ actor_ids: [actorId] }),
-          }),
-          onUpdate: (result) => {
-            const updates = Array.isArray(result?.items) ? result.items : [];
-            for (const updated of updates) {
-              if (!updated) continue;
-              applyActorMissingScanUpdate(updated);
-            }
-          },
-        });
-        showScanSuccessModal('Scan completed', true);
+        const { items: updates, skipped } = await runMissingScanJob('actors_missing_scan', { actor_ids: actorIds }, total, 'actors');
+        if (updates) {
+          for (const updated of updates) {
+            if (!updated) continue;
+            applyActorMissingScanUpdate(updated);
+          }
+        } else {
+          await loadActorsData(true, state.castRole);
+        }
+        showScanSuccessModal(formatMissingScanDone(skipped), true);
         state.actorsLoaded = true;
         renderActors();
       } catch (error) {
@@ -4715,7 +4713,7 @@ async function renderShows(enableBackgroundRefresh = true, routeKey = state.curr
         try {
           const result = await api('/api/shows/missing-scan', {
             method: 'POST',
-            body: JSON.stringify({ show_ids: [String(show.show_id)] }),
+            body: JSON.stringify({ show_ids: [String(show.show_id)], force: true }),
           });
           const updated = Array.isArray(result.items) ? result.items[0] : null;
           if (updated) applyShowMissingScanUpdate(updated);
@@ -4825,22 +4823,16 @@ async function renderShows(enableBackgroundRefresh = true, routeKey = state.curr
       const total = showIds.length;
       showScanModal(`Scanned 0/${total} shows`);
       try {
-        await runScanWorkers({
-          ids: showIds,
-          label: 'shows',
-          workerFn: (showId) => api('/api/shows/missing-scan', {
-            method: 'POST',
-            body: JSON.stringify({ show_ids: [showId] }),
-          }),
-          onUpdate: (result) => {
-            const updates = Array.isArray(result?.items) ? result.items : [];
-            for (const updated of updates) {
-              if (!updated) continue;
-              applyShowMissingScanUpdate(updated);
-            }
-          },
-        });
-        showScanSuccessModal('Scan completed', true);
+        const { items: updates, skipped } = await runMissingScanJob('shows_missing_scan', { show_ids: showIds }, total, 'shows');
+        if (updates) {
+          for (const updated of updates) {
+            if (!updated) continue;
+            applyShowMissingScanUpdate(updated);
+          }
+        } else {
+          await loadShowsData(true);
+        }
+        showScanSuccessModal(formatMissingScanDone(skipped), true);
         state.showsLoaded = true;
         renderShows();
       } catch (error) {
@@ -5560,7 +5552,7 @@ async function renderShowEpisodes(showId, seasonNumber, routeKey = state.current
           ignoreToggleBtn.textContent = nextIgnored ? 'Unignore' : 'Ignore';
           const refresh = await api('/api/shows/missing-scan', {
             method: 'POST',
-            body: JSON.stringify({ show_ids: [String(showId)] }),
+            body: JSON.stringify({ show_ids: [String(showId)], force: true }),
           });
           const updated = Array.isArray(refresh.items) ? refresh.items[0] : null;
           if (updated) applyShowMissingScanUpdate(updated);
@@ -6119,7 +6111,7 @@ async function renderActorDetail(actorId, routeKey = state.currentRouteKey, rout
             ignoreToggleBtn.textContent = nextIgnored ? 'Unignore' : 'Ignore';
             const refresh = await api('/api/actors/missing-scan', {
               method: 'POST',
-              body: JSON.stringify({ actor_ids: [actorId] }),
+              body: JSON.stringify({ actor_ids: [actorId], force: true }),
             });
             const updated = Array.isArray(refresh.items) ? refresh.items[0] : null;
             if (updated) {